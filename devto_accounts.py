@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+多账户发布池
+
+每个账户一个 DevToPublisher（各自的连接池和令牌桶），总吞吐随账户数近似线性增长。
+
+路由规则（按优先级）：
+1. article["account"]：指定账户名
+2. article["author"]：通过 authors 映射（或同名账户）找到账户
+3. article["route_key"]：按哈希固定分配到某个账户（同一 key 总是同一账户）
+4. 都没有：放进共享队列，由当前空闲且未被限流的账户领取
+
+被限流（令牌桶需等待较久）的账户暂停领取共享队列中的文章，
+避免一个账户卡在 Retry-After 上而其他账户闲置。
+
+账本（ledger）按账户隔离：from_keys 给每个账户一个命名空间视图（Ledger.scoped），
+一个账户的记录不会让另一个账户跳过或去更新别人的文章。
+未指定路由的文章如果已在某个账户的账本里，会固定交给该账户（内容有变时更新而不是重发）。
+"""
+
+import os
+import threading
+import zlib
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+from devto_bulk import publish_one
+from devto_ledger import normalize_key
+from devto_validate import invalid_result, validate_batch
+
+DEFAULT_WORKERS_PER_ACCOUNT = 2
+ENV_PREFIX = "DEVTO_API_KEY_"
+THROTTLED_WAIT = 1.0  # 令牌桶需等待超过该秒数时视为被限流
+
+
+class PublisherPool:
+    """多个 Dev.to 账户组成的发布池"""
+
+    def __init__(
+        self,
+        publishers: Dict[str, object],
+        authors: Dict[str, str] = None,
+        workers_per_account: int = DEFAULT_WORKERS_PER_ACCOUNT
+    ):
+        """
+        Args:
+            publishers: 账户名 -> DevToPublisher
+            authors: 作者名 -> 账户名（文章的 author 字段）
+            workers_per_account: 每个账户同时在途的请求数
+        """
+        if not publishers:
+            raise ValueError("至少需要一个账户")
+        self.publishers = dict(publishers)
+        self.names = sorted(self.publishers)
+        self.authors = dict(authors or {})
+        self.workers_per_account = max(1, workers_per_account)
+        self._lock = threading.Lock()
+        self._counts = {name: 0 for name in self.names}
+
+    @classmethod
+    def from_keys(cls, keys: Dict[str, str], authors: Dict[str, str] = None, workers_per_account: int = DEFAULT_WORKERS_PER_ACCOUNT, **kwargs):
+        """
+        用 API Key 创建发布池
+
+        Args:
+            keys: 账户名 -> API Key
+            authors: 作者名 -> 账户名
+            workers_per_account: 每个账户同时在途的请求数
+            **kwargs: 传给每个 DevToPublisher 的参数（rate_limiter 除外，每个账户单独限流；
+                ledger 按账户名划分命名空间）
+        """
+        from devto_publisher import DevToPublisher
+
+        kwargs.pop("rate_limiter", None)
+        kwargs.setdefault("pool_size", workers_per_account)
+        ledger = kwargs.pop("ledger", None)
+        publishers = {
+            name: DevToPublisher(
+                api_key=key,
+                ledger=ledger.scoped(name) if ledger is not None else None,
+                **kwargs
+            )
+            for name, key in keys.items()
+        }
+        return cls(publishers, authors, workers_per_account)
+
+    @classmethod
+    def from_env(cls, prefix: str = ENV_PREFIX, **kwargs):
+        """从环境变量 DEVTO_API_KEY_<账户名> 读取全部账户"""
+        keys = {
+            name[len(prefix):].lower(): value
+            for name, value in os.environ.items()
+            if name.startswith(prefix) and value
+        }
+        return cls.from_keys(keys, **kwargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        for publisher in self.publishers.values():
+            publisher.close()
+
+    def route(self, article: Dict) -> Optional[str]:
+        """
+        文章固定归属的账户名；None 表示任意账户
+
+        Raises:
+            KeyError: 指定的账户或作者不存在
+        """
+        account = article.get("account")
+        if account:
+            if account not in self.publishers:
+                raise KeyError(f"未知账户: {account}")
+            return account
+        author = article.get("author")
+        if author:
+            account = self.authors.get(author, author)
+            if account not in self.publishers:
+                raise KeyError(f"作者 {author} 没有对应账户")
+            return account
+        route_key = article.get("route_key")
+        if route_key:
+            return self.names[zlib.crc32(str(route_key).encode("utf-8")) % len(self.names)]
+        return self._ledger_owner(article)
+
+    def _ledger_owner(self, article: Dict) -> Optional[str]:
+        """已在某个账户账本中的文章归该账户"""
+        key = article.get("key") or normalize_key(article.get("title") or "")
+        for name in self.names:
+            ledger = getattr(self.publishers[name], "ledger", None)
+            if ledger is not None and ledger.find_by_key(key):
+                return name
+        return None
+
+    def _least_loaded(self) -> str:
+        """等待时间最短的账户"""
+        return min(self.names, key=lambda n: (self.publishers[n].rate_limiter.wait_time(), self._counts[n]))
+
+    def publish_article(self, article: Dict) -> Dict:
+        """发布单篇文章，结果附带 account"""
+        try:
+            account = self.route(article) or self._least_loaded()
+        except KeyError as e:
+            return {"status": "error", "message": e.args[0], "account": None}
+        with self._lock:
+            self._counts[account] += 1
+        result = publish_one(self.publishers[account], article)
+        result["account"] = account
+        return result
+
+    def publish_many(self, articles: Iterable[Dict]) -> List[Dict]:
+        """
+        并发发布多篇文章
+
+        Args:
+            articles: 文章字典的可迭代对象
+
+        Returns:
+            与输入顺序一致的结果列表，每项附带 account 和 elapsed
+            （未发请求的校验失败 / 无法路由的文章 account 为 None，elapsed 为 0）
+        """
+        articles = list(articles)
+        results: List[Dict] = [None] * len(articles)
+        valid, report = validate_batch(articles)
+        accepted = set(valid)
+        for item in report:
+            if item["index"] not in accepted:
+                results[item["index"]] = dict(
+                    invalid_result(articles[item["index"]], item["problems"]), account=None, elapsed=0.0
+                )
+
+        pinned = {name: deque() for name in self.names}
+        shared = deque()
+        for index in valid:
+            try:
+                account = self.route(articles[index])
+            except KeyError as e:
+                results[index] = {"status": "error", "message": e.args[0], "account": None, "elapsed": 0.0}
+                continue
+            (pinned[account] if account else shared).append(index)
+
+        cond = threading.Condition()
+
+        def take(name: str) -> Optional[int]:
+            """取下一篇：先取本账户的，未被限流时再取共享队列"""
+            limiter = self.publishers[name].rate_limiter
+            with cond:
+                while True:
+                    if pinned[name]:
+                        return pinned[name].popleft()
+                    if not shared:
+                        return None
+                    wait = limiter.wait_time()
+                    if wait <= THROTTLED_WAIT:
+                        return shared.popleft()
+                    cond.wait(min(wait, THROTTLED_WAIT))
+
+        def worker(name: str):
+            publisher = self.publishers[name]
+            while True:
+                index = take(name)
+                if index is None:
+                    return
+                result = publish_one(publisher, articles[index])
+                result["account"] = name
+                results[index] = result
+                with self._lock:
+                    self._counts[name] += 1
+
+        threads = [
+            threading.Thread(target=worker, args=(name,), daemon=True)
+            for name in self.names
+            for _ in range(self.workers_per_account)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def stats(self) -> Dict[str, Dict]:
+        """各账户已处理的文章数和当前限流状态"""
+        with self._lock:
+            counts = dict(self._counts)
+        return {
+            name: {
+                "articles": counts[name],
+                "rate": round(self.publishers[name].rate_limiter.rate, 3),
+                "wait": round(self.publishers[name].rate_limiter.wait_time(), 3),
+            }
+            for name in self.names
+        }
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+文章数据采集与分析
+
+- harvest(): 增量采集 /articles/me 中的阅读 / 点赞 / 评论数。
+  列表按发布时间倒序翻页，近期发布或近期有变化的文章都看过后就停止；
+  每隔 full_every 秒做一次完整扫描。只有数值变化的文章才写入快照。
+- MetricStore: 列式存储，每列一个定长二进制文件（int64 / int32），
+  追加写入，读取时直接 np.fromfile，不经过逐行字典。
+  元数据（articles.json）记录已提交的行数，写入元数据才算提交；
+  追加后、写元数据前退出时，下次打开会把各列截断回上次提交的行数。
+- growth_by_tag(): 按标签、按周汇总增长量等 NumPy 聚合。
+
+    python devto_analytics.py harvest
+    python devto_analytics.py report --metric views
+
+依赖：pip install numpy
+"""
+
+import argparse
+import datetime
+import json
+import os
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+DEFAULT_ANALYTICS_DIR = os.path.expanduser("~/.devto_publisher/analytics")
+DEFAULT_ACTIVE_DAYS = 30
+DEFAULT_FULL_EVERY = 7 * 86400
+HARVEST_PER_PAGE = 1000
+WEEK = 7 * 86400
+_WEEK_OFFSET = 3 * 86400  # 1970-01-01 是周四，平移后按周一分周
+
+METRICS = ("views", "reactions", "comments")
+COLUMNS = {
+    "id": np.int64,
+    "ts": np.int64,
+    "views": np.int32,
+    "reactions": np.int32,
+    "comments": np.int32,
+}
+META_FILENAME = "articles.json"
+
+
+def _parse_time(value: str) -> int:
+    """ISO 8601 时间转 Unix 秒（无法解析时返回 0）"""
+    if not value:
+        return 0
+    try:
+        return int(datetime.datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+    except ValueError:
+        return 0
+
+
+def _tags(article: Dict) -> List[str]:
+    tags = article.get("tag_list", article.get("tags")) or []
+    if isinstance(tags, str):
+        tags = [t.strip() for t in tags.split(",") if t.strip()]
+    return list(tags)
+
+
+def _values(article: Dict) -> Tuple[int, int, int]:
+    return (
+        int(article.get("page_views_count") or 0),
+        int(article.get("public_reactions_count", article.get("positive_reactions_count")) or 0),
+        int(article.get("comments_count") or 0),
+    )
+
+
+class MetricStore:
+    """按 (文章 id, 时间戳) 追加的列式快照存储"""
+
+    def __init__(self, directory: str = DEFAULT_ANALYTICS_DIR):
+        """
+        Args:
+            directory: 存储目录（每列一个 .bin 文件，另有 articles.json 记录文章元数据）
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.articles: Dict[str, Dict] = {}
+        self.state: Dict = {}
+        meta_path = os.path.join(directory, META_FILENAME)
+        if os.path.exists(meta_path):
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            self.articles = meta.get("articles", {})
+            self.state = meta.get("state", {})
+        self._repair()
+
+    def _path(self, column: str) -> str:
+        return os.path.join(self.directory, f"{column}.bin")
+
+    def _repair(self):
+        """截断未提交的行：各列截断到元数据记录的行数（旧版元数据没有行数时截断到最短的一列）"""
+        sizes = {}
+        for column, dtype in COLUMNS.items():
+            path = self._path(column)
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            sizes[column] = size // np.dtype(dtype).itemsize
+        rows = min(sizes.values())
+        if "rows" in self.state:
+            rows = min(rows, self.state["rows"])
+        for column, dtype in COLUMNS.items():
+            if sizes[column] != rows:
+                with open(self._path(column), "r+b") as f:
+                    f.truncate(rows * np.dtype(dtype).itemsize)
+
+    def __len__(self) -> int:
+        path = self._path("id")
+        return os.path.getsize(path) // np.dtype(COLUMNS["id"]).itemsize if os.path.exists(path) else 0
+
+    def append(self, rows: Dict[str, np.ndarray]):
+        """追加一批快照（各列等长）；调用 save_meta() 后才算提交"""
+        n = len(rows["id"])
+        if not n:
+            return
+        for column, dtype in COLUMNS.items():
+            values = np.asarray(rows[column], dtype=dtype)
+            if len(values) != n:
+                raise ValueError(f"列 {column} 长度不一致")
+            with open(self._path(column), "ab") as f:
+                values.tofile(f)
+
+    def columns(self, names=None) -> Dict[str, np.ndarray]:
+        """读取列"""
+        names = names or list(COLUMNS)
+        rows = len(self)
+        result = {}
+        for column in names:
+            path = self._path(column)
+            if not rows:
+                result[column] = np.zeros(0, dtype=COLUMNS[column])
+            else:
+                result[column] = np.fromfile(path, dtype=COLUMNS[column], count=rows)
+        return result
+
+    def save_meta(self):
+        """原子写入文章元数据和采集状态，同时提交已追加的快照"""
+        self.state["rows"] = len(self)
+        path = os.path.join(self.directory, META_FILENAME)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"articles": self.articles, "state": self.state}, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+
+
+def harvest(
+    publisher,
+    store: MetricStore,
+    active_days: int = DEFAULT_ACTIVE_DAYS,
+    full: bool = None,
+    full_every: int = DEFAULT_FULL_EVERY,
+    now: int = None
+) -> Dict:
+    """
+    增量采集一次
+
+    Args:
+        publisher: DevToPublisher 实例
+        store: 快照存储
+        active_days: 近期窗口：该窗口内发布或数值有变化的文章每次都检查
+        full: 强制完整扫描（None 表示按 full_every 自动决定）
+        full_every: 两次完整扫描的最小间隔（秒）
+        now: 当前时间（Unix 秒，默认 time.time()）
+
+    Returns:
+        {"checked": n, "changed": n, "full": bool}；接口熔断没有遍历完时附带 "remote": unavailable 结果
+    """
+    from devto_publisher import capture_result
+
+    now = int(now or time.time())
+    cutoff = now - active_days * 86400
+    if full is None:
+        full = now - store.state.get("last_full", 0) >= full_every
+    hot = {
+        article_id for article_id, meta in store.articles.items()
+        if meta.get("changed_at", 0) >= cutoff
+    }
+
+    ids, views, reactions, comments = [], [], [], []
+    checked = 0
+    outcome = {}
+    for article in capture_result(publisher.iter_articles(per_page=HARVEST_PER_PAGE), outcome):
+        article_id = str(article["id"])
+        published_at = _parse_time(article.get("published_at"))
+        if not full and published_at and published_at < cutoff and not hot:
+            break
+        hot.discard(article_id)
+        checked += 1
+
+        values = _values(article)
+        meta = store.articles.get(article_id)
+        if meta is None:
+            meta = store.articles[article_id] = {}
+        meta["title"] = article.get("title")
+        meta["tags"] = _tags(article)
+        meta["published_at"] = published_at
+        previous = meta.get("values")
+        if previous != list(values):
+            meta["values"] = list(values)
+            # 第一次见到的文章按发布时间判断是否活跃
+            meta["changed_at"] = now if previous is not None else published_at
+            ids.append(int(article["id"]))
+            views.append(values[0])
+            reactions.append(values[1])
+            comments.append(values[2])
+
+    store.append({
+        "id": ids,
+        "ts": np.full(len(ids), now, dtype=np.int64),
+        "views": views,
+        "reactions": reactions,
+        "comments": comments,
+    })
+    store.state["last_run"] = now
+    if full and not outcome.get("result"):
+        store.state["last_full"] = now
+    store.save_meta()
+    summary = {"checked": checked, "changed": len(ids), "full": full}
+    if outcome.get("result"):
+        summary["remote"] = outcome["result"]  # 熔断，本次没有遍历完
+    return summary
+
+
+# --- 聚合 ---
+
+def deltas(store: MetricStore, metric: str = "views") -> Dict[str, np.ndarray]:
+    """
+    每条快照相对同一文章上一条快照的增量
+
+    Returns:
+        {"id", "ts", "delta"}（按 id、时间排序；文章的第一条快照增量为其当前值）
+    """
+    cols = store.columns(["id", "ts", metric])
+    order = np.lexsort((cols["ts"], cols["id"]))
+    ids = cols["id"][order]
+    ts = cols["ts"][order]
+    values = cols[metric][order].astype(np.int64)
+    delta = np.diff(values, prepend=0)
+    first = np.ones(len(ids), dtype=bool)
+    first[1:] = ids[1:] != ids[:-1]
+    delta[first] = values[first]
+    return {"id": ids, "ts": ts, "delta": delta}
+
+
+def growth_by_tag(
+    store: MetricStore,
+    metric: str = "views",
+    period: int = WEEK
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    按标签、按时间段汇总增长量
+
+    Args:
+        store: 快照存储
+        metric: views / reactions / comments
+        period: 时间段长度（秒，默认按周，周一开始）
+
+    Returns:
+        (标签列表, 各时间段起点的 Unix 秒, 矩阵[标签, 时间段])
+    """
+    if metric not in METRICS:
+        raise ValueError(f"未知指标: {metric}")
+    d = deltas(store, metric)
+    if not len(d["id"]):
+        return [], np.zeros(0, dtype=np.int64), np.zeros((0, 0), dtype=np.int64)
+
+    # 文章 -> 标签 的 CSR 结构
+    article_ids = np.array(sorted(int(i) for i in store.articles), dtype=np.int64)
+    tag_names = sorted({t for meta in store.articles.values() for t in meta.get("tags", ())})
+    tag_index = {t: i for i, t in enumerate(tag_names)}
+    counts = np.zeros(len(article_ids), dtype=np.int64)
+    flat = []
+    for i, article_id in enumerate(article_ids.tolist()):
+        tags = store.articles[str(article_id)].get("tags", ())
+        counts[i] = len(tags)
+        flat.extend(tag_index[t] for t in tags)
+    flat = np.array(flat, dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    # 只统计元数据中有记录的文章（searchsorted 对找不到的 id 返回插入位置，不能直接用作下标）
+    row_article = np.searchsorted(article_ids, d["id"])
+    known = row_article < len(article_ids)
+    known[known] = article_ids[row_article[known]] == d["id"][known]
+    if not known.all():
+        d = {name: values[known] for name, values in d.items()}
+        row_article = row_article[known]
+        if not len(row_article):
+            return tag_names, np.zeros(0, dtype=np.int64), np.zeros((len(tag_names), 0), dtype=np.int64)
+
+    # 每条增量展开到它所属文章的每个标签
+    row_tags = counts[row_article]
+    rows = np.repeat(np.arange(len(row_article)), row_tags)
+    starts = np.repeat(offsets[row_article], row_tags)
+    within = np.arange(len(rows)) - np.repeat(np.cumsum(row_tags) - row_tags, row_tags)
+    tag_of_row = flat[starts + within]
+
+    buckets = (d["ts"] + _WEEK_OFFSET) // period if period == WEEK else d["ts"] // period
+    first_bucket = buckets.min()
+    n_buckets = int(buckets.max() - first_bucket) + 1
+    cell = tag_of_row * n_buckets + (buckets[rows] - first_bucket)
+    matrix = np.bincount(cell, weights=d["delta"][rows], minlength=len(tag_names) * n_buckets)
+    matrix = matrix.astype(np.int64).reshape(len(tag_names), n_buckets)
+
+    starts_ts = (np.arange(n_buckets) + first_bucket) * period
+    if period == WEEK:
+        starts_ts -= _WEEK_OFFSET
+    return tag_names, starts_ts, matrix
+
+
+def latest(store: MetricStore, metric: str = "views") -> Dict[int, int]:
+    """每篇文章最新的指标值"""
+    cols = store.columns(["id", "ts", metric])
+    order = np.lexsort((cols["ts"], cols["id"]))
+    ids = cols["id"][order]
+    last = np.ones(len(ids), dtype=bool)
+    last[:-1] = ids[:-1] != ids[1:]
+    return dict(zip(ids[last].tolist(), cols[metric][order][last].tolist()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dev.to 文章数据采集")
+    parser.add_argument("--dir", default=DEFAULT_ANALYTICS_DIR, help="存储目录")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("harvest", help="增量采集一次")
+    run.add_argument("--full", action="store_true", help="完整扫描全部文章")
+    run.add_argument("--active-days", type=int, default=DEFAULT_ACTIVE_DAYS)
+
+    report = sub.add_parser("report", help="按标签、按周输出增长量")
+    report.add_argument("--metric", choices=METRICS, default="views")
+    args = parser.parse_args()
+
+    store = MetricStore(args.dir)
+    if args.command == "harvest":
+        from devto_publisher import DevToPublisher
+        with DevToPublisher() as publisher:
+            result = harvest(publisher, store, args.active_days, full=args.full or None)
+        print(json.dumps(result, ensure_ascii=False))
+    else:
+        tags, weeks, matrix = growth_by_tag(store, args.metric)
+        labels = [time.strftime("%Y-%m-%d", time.gmtime(w)) for w in weeks.tolist()]
+        for tag, row in zip(tags, matrix.tolist()):
+            print(json.dumps({"tag": tag, "growth": dict(zip(labels, row))}, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
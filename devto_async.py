@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Dev.to 异步发布器
+
+AsyncDevToPublisher 与 DevToPublisher 接口一致（方法均为协程），
+基于 aiohttp，在单个事件循环上并发成千上万个发布 / 更新请求：
+
+- 所有请求共享一个连接池（keep-alive）
+- 信号量限制同时在途的请求数
+- 支持连接 / 读取超时，任务取消时立即释放连接和并发名额
+- 与同步版共用令牌桶限流、重试策略、Markdown 规范化、标签推荐，
+  以及账本 / 近似重复检查和结果整理（PublishSteps）；
+  配置了账本、近似重复或全文索引时，这些同步步骤放到线程池执行，不阻塞事件循环
+
+依赖：pip install aiohttp
+"""
+
+import asyncio
+import json
+import os
+import time
+from typing import AsyncIterator, Dict, List, Optional
+
+import aiohttp
+
+from devto_breaker import CircuitBreakers, CircuitOpenError
+from devto_ledger import Ledger
+from devto_publisher import (
+    API_BASE,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_PER_PAGE,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_TIMEOUT,
+    IDEMPOTENT_METHODS,
+    RETRY_STATUS,
+    PublishSteps,
+    prepare_payload,
+)
+from devto_markdown import normalize_markdown
+from devto_metrics import endpoint_label
+from devto_models import to_articles
+from devto_ratelimit import TokenBucket, backoff_delay, parse_retry_after
+from devto_validate import has_errors, invalid_result, validate_article
+
+DEFAULT_CONCURRENCY = 100
+# aiohttp 3.10 起连接超时单独为 ConnectionTimeoutError（之前与读超时无法区分）
+_CONNECT_TIMEOUT = (aiohttp.ConnectionTimeoutError,) if hasattr(aiohttp, "ConnectionTimeoutError") else ()
+
+
+class AsyncResponse:
+    """已读取完毕的响应（状态码、响应头、正文）"""
+
+    __slots__ = ("status_code", "headers", "text")
+
+    def __init__(self, status_code: int, headers, text: str):
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    def json(self):
+        return json.loads(self.text) if self.text else None
+
+
+class AsyncDevToPublisher(PublishSteps):
+    """Dev.to 异步发布器"""
+
+    def __init__(
+        self,
+        api_key: str = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: tuple = DEFAULT_TIMEOUT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limiter: TokenBucket = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        ledger: Ledger = None,
+        normalize: bool = True,
+        tagger=None,
+        dedup=None,
+        dedup_action: str = "flag",
+        breakers: CircuitBreakers = None,
+        search=None,
+        api_base: str = API_BASE
+    ):
+        """
+        Args:
+            api_key: Dev.to API Key（默认读取 DEVTO_API_KEY）
+            pool_size: 连接池大小
+            timeout: (连接超时, 读取超时)，单位秒
+            concurrency: 同时在途的最大请求数
+            rate_limiter: 令牌桶限流器（可与同步发布器共享）
+            max_retries: 可重试失败的最大重试次数
+            ledger: 已发布文章账本
+            normalize: 发布 / 更新前是否规范化 Markdown 正文
+            tagger: 标签推荐器
+            dedup: 近似重复索引（devto_dedup.DuplicateIndex）
+            dedup_action: 发现近似重复时 "flag" 或 "block"
+            breakers: 按接口熔断（可与同步发布器共享）
+            search: 全文检索索引（devto_search.SearchIndex），发布 / 更新成功后自动收录（由调用方 save()）
+            api_base: API 地址
+        """
+        self.api_key = api_key or os.getenv("DEVTO_API_KEY")
+        self.headers = {
+            "Content-Type": "application/json",
+            "api-key": self.api_key or ""
+        }
+        self.pool_size = pool_size
+        self.timeout = aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter or TokenBucket()
+        self.max_retries = max_retries
+        self.ledger = ledger
+        self.normalize = normalize
+        self.tagger = tagger
+        self.dedup = dedup
+        self.dedup_action = dedup_action
+        self.breakers = breakers
+        self.search = search
+        self.profiler = None  # 协程共享线程，不支持分阶段剖析
+        self.api_base = api_base.rstrip("/")
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """关闭连接池"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # 在事件循环内懒创建，保证连接池和信号量绑定到当前循环
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=30)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._session
+
+    async def _request(self, method: str, path: str, timeout: float = None, **kwargs) -> AsyncResponse:
+        """
+        熔断 + 限流 + 并发上限 + 抖动退避重试
+
+        Raises:
+            CircuitOpenError: 该接口熔断中，请求未发出
+        """
+        session = self._get_session()
+        idempotent = method in IDEMPOTENT_METHODS
+        request_timeout = aiohttp.ClientTimeout(total=timeout) if timeout else None
+        breaker = None
+        if self.breakers is not None:
+            endpoint = endpoint_label(method, path)
+        attempt = 0
+        while True:
+            if self.breakers is not None:
+                breaker = self.breakers.check(endpoint)
+            await self.rate_limiter.acquire_async()
+            started = time.perf_counter()
+            try:
+                async with self._semaphore:
+                    async with session.request(
+                        method,
+                        f"{self.api_base}{path}",
+                        timeout=request_timeout,
+                        **kwargs
+                    ) as raw:
+                        response = AsyncResponse(raw.status, raw.headers, await raw.text())
+            except BaseException as e:
+                if breaker is not None:
+                    if isinstance(e, asyncio.CancelledError):
+                        breaker.release()
+                    else:
+                        breaker.record(True, time.perf_counter() - started)
+                if not isinstance(e, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+                    raise
+                # 非幂等请求只有在连接都没建立时才能确定服务端未处理
+                retryable = idempotent or isinstance(e, aiohttp.ClientConnectorError)
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(backoff_delay(attempt))
+                attempt += 1
+                continue
+
+            if breaker is not None:
+                breaker.record(response.status_code >= 500, time.perf_counter() - started)
+            self.rate_limiter.update_from_headers(response.headers)
+            status = response.status_code
+            if status == 429:
+                self.rate_limiter.penalize(parse_retry_after(response.headers.get("Retry-After")))
+            elif status < 500:
+                self.rate_limiter.reward()
+
+            retryable = status == 429 or (idempotent and status in RETRY_STATUS)
+            if not retryable or attempt >= self.max_retries:
+                return response
+            await asyncio.sleep(backoff_delay(attempt))
+            attempt += 1
+
+    async def get_user(self) -> Dict:
+        """获取当前用户信息"""
+        if not self.api_key:
+            return {"error": "No API key provided"}
+        try:
+            return (await self._request("GET", "/me", headers=self.headers)).json()
+        except asyncio.CancelledError:
+            raise
+        except CircuitOpenError as e:
+            return e.result()
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            return {"error": str(e) or type(e).__name__}
+
+    async def publish_article(
+        self,
+        title: str,
+        content: str,
+        tags: List[str] = None,
+        published: bool = True,
+        canonical_url: str = None,
+        description: str = None,
+        key: str = None
+    ) -> Dict:
+        """发布文章到 Dev.to（参数与 DevToPublisher.publish_article 相同）"""
+        if not self.api_key:
+            return {"error": "请设置 DEVTO_API_KEY 环境变量"}
+        payload = prepare_payload(
+            title, content, tags, published, canonical_url, description, key,
+            normalize=self.normalize, tagger=self.tagger
+        )
+        return await self.publish_prepared(payload)
+
+    async def publish_prepared(self, payload: Dict) -> Dict:
+        """发布 prepare_payload() 生成的请求（检查和结果整理与 DevToPublisher 共用 PublishSteps）"""
+        if "result" in payload:
+            return payload["result"]
+        if not self.api_key:
+            return {"error": "请设置 DEVTO_API_KEY 环境变量"}
+
+        plan = await self._offload(self._plan, payload)
+        if "result" in plan:
+            return plan["result"]
+        if plan["entry"] is not None:
+            article = await self.update_article(plan["entry"]["id"], **plan["fields"])
+            return await self._offload(lambda: self._finish(plan, self._updated(plan, article)))
+
+        try:
+            response = await self._request("POST", "/articles", headers=self.headers, json={"article": plan["fields"]})
+        except asyncio.CancelledError:
+            raise  # 结果未知，保留占位
+        except Exception as e:
+            return await self._offload(self._post_failed, plan, e)
+        return await self._offload(lambda: self._finish(plan, self._created(plan, response)))
+
+    async def _offload(self, func, *args):
+        """执行 PublishSteps 的步骤：用到 SQLite 账本 / 索引时放到线程池，不阻塞事件循环"""
+        if self.ledger is None and self.dedup is None and self.search is None:
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+
+    def _not_sent(self, error: Exception) -> bool:
+        """熔断、连接失败或连接超时：请求体还没有发出"""
+        return isinstance(error, (CircuitOpenError, aiohttp.ClientConnectorError) + _CONNECT_TIMEOUT)
+
+    async def update_article(self, article_id: int, **kwargs) -> Dict:
+        """更新已发布的文章"""
+        if not self.api_key:
+            return {"error": "No API key provided"}
+
+        problems = validate_article(kwargs, partial=True)
+        if has_errors(problems):
+            return invalid_result(kwargs, problems)
+
+        if self.normalize and kwargs.get("body_markdown"):
+            kwargs["body_markdown"] = normalize_markdown(kwargs["body_markdown"])
+        try:
+            response = await self._request(
+                "PUT", f"/articles/{article_id}", headers=self.headers, json={"article": kwargs}
+            )
+            article = response.json()
+            if response.ok and "id" in article:
+                self._index_published(article, article)
+            return article
+        except asyncio.CancelledError:
+            raise
+        except CircuitOpenError as e:
+            return e.result()
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+    async def get_articles(
+        self,
+        username: str = None,
+        page: int = None,
+        per_page: int = None,
+        records: bool = False,
+        body: bool = False,
+        raw: bool = False
+    ) -> List[Dict]:
+        """获取文章列表（单页）；失败时返回带 status 的字典，records 为 True 时返回紧凑的 Article 记录"""
+        params = {}
+        if page:
+            params["page"] = page
+        if per_page:
+            params["per_page"] = per_page
+        try:
+            if username:
+                response = await self._request("GET", "/articles", params={"username": username, **params})
+            else:
+                response = await self._request("GET", "/articles/me", headers=self.headers, params=params)
+            articles = response.json()
+        except asyncio.CancelledError:
+            raise
+        except CircuitOpenError as e:
+            return e.result()
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            return {"status": "error", "message": str(e) or type(e).__name__}
+        if records and isinstance(articles, list):
+            return to_articles(articles, body, raw)
+        return articles
+
+    async def iter_articles(
+        self,
+        username: str = None,
+        per_page: int = DEFAULT_PER_PAGE,
+        records: bool = False,
+        body: bool = False,
+        raw: bool = False,
+        outcome: Dict = None
+    ) -> AsyncIterator[Dict]:
+        """
+        逐篇遍历全部文章（自动翻页，处理当前页时预取下一页）；records 为 True 时产出 Article 记录
+
+        与 DevToPublisher.iter_articles 一致：接口熔断中时停止遍历，status == "unavailable" 的结果
+        写入 outcome["result"]（异步生成器没有返回值，相当于同步版的 capture_result()）；
+        其他错误抛出 RuntimeError。
+        """
+        page = 1
+        pending = asyncio.ensure_future(self.get_articles(username, page, per_page, records, body, raw))
+        try:
+            while pending is not None:
+                articles = await pending
+                pending = None
+                if not isinstance(articles, list):
+                    if isinstance(articles, dict) and articles.get("status") == "unavailable":
+                        if outcome is not None:
+                            outcome["result"] = articles
+                        return
+                    raise RuntimeError(f"获取文章列表失败: {articles}")
+                if len(articles) == per_page:
+                    page += 1
+                    pending = asyncio.ensure_future(self.get_articles(username, page, per_page, records, body, raw))
+                for article in articles:
+                    yield article
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def publish_many(self, articles, timeout: float = None) -> List[Dict]:
+        """
+        并发发布多篇文章，结果与输入顺序一致
+
+        Args:
+            articles: 文章字典的可迭代对象
+            timeout: 整批的超时时间（秒），超时后未完成的请求被取消
+        """
+        async def one(article):
+            return await self.publish_article(
+                title=article["title"],
+                content=article["content"],
+                tags=article.get("tags"),
+                published=article.get("published", True),
+                canonical_url=article.get("canonical_url"),
+                description=article.get("description"),
+                key=article.get("key")
+            )
+
+        tasks = [asyncio.ensure_future(one(a)) for a in articles]
+        try:
+            return await asyncio.wait_for(asyncio.gather(*tasks), timeout)
+        finally:
+            for task in tasks:
+                task.cancel()
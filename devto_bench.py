@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+DevToPublisher 基准测试
+
+在本地模拟服务（devto_mock）上驱动 publish_article / update_article /
+get_articles / publish_all，输出吞吐量（ops/sec）、p50/p95/p99 延迟和峰值 RSS。
+全程不访问网络，结果可重复。
+
+用法：
+    python devto_bench.py --count 500 --workers 8 --latency 0.01
+    python devto_bench.py --json > bench.json
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from devto_mock import MockServer
+
+BENCH_BODY = "# Benchmark\n\n" + "Lorem ipsum dolor sit amet. " * 200
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """最近秩百分位数"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def peak_rss_kb() -> int:
+    """当前进程峰值 RSS（KB）"""
+    if resource is None:
+        return 0
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def measure(op: Callable[[int], bool], count: int, workers: int, ops_per_call: int = 1) -> Dict:
+    """
+    并发执行 op(i) count 次并统计
+
+    Args:
+        op: 单次操作，成功返回 True
+        count: 调用次数
+        workers: 并发数
+        ops_per_call: 每次调用包含的 API 操作数（用于计算 ops/sec）
+    """
+    def timed(i):
+        start = time.perf_counter()
+        try:
+            ok = op(i)
+        except Exception:
+            ok = False
+        return time.perf_counter() - start, ok
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        samples = list(executor.map(timed, range(count)))
+    wall = time.perf_counter() - start
+
+    latencies = sorted(s[0] for s in samples)
+    return {
+        "calls": count,
+        "errors": sum(1 for s in samples if not s[1]),
+        "wall_s": round(wall, 4),
+        "ops_per_sec": round(count * ops_per_call / wall, 2) if wall else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+def run_benchmarks(
+    count: int = 200,
+    workers: int = 8,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    error_rate: float = 0.0,
+    rate_limit_rate: float = 0.0,
+    seed: int = 42
+) -> Dict:
+    """启动模拟服务并运行全部基准，返回报告字典"""
+    # 延迟导入，保证 --help 不依赖 requests
+    from devto_publisher import DevToPublisher
+    from devto_ratelimit import TokenBucket
+    import agent_li_style
+
+    report = {
+        "config": {
+            "count": count, "workers": workers, "latency": latency, "jitter": jitter,
+            "error_rate": error_rate, "rate_limit_rate": rate_limit_rate, "seed": seed,
+        },
+        "results": {},
+    }
+    results = report["results"]
+
+    with MockServer(latency=latency, jitter=jitter, error_rate=error_rate,
+                    rate_limit_rate=rate_limit_rate, retry_after=0, seed=seed) as server:
+        # 基准测试关注客户端本身，放开客户端限流
+        limiter = TokenBucket(rate=1e9, burst=10 ** 9)
+        with DevToPublisher("bench-key", api_base=server.url, pool_size=workers,
+                            rate_limiter=limiter) as publisher:
+            ids = []
+
+            def publish(i):
+                result = publisher.publish_article(f"Bench {i}", BENCH_BODY, ["bench"], published=False)
+                if result.get("status") == "success":
+                    ids.append(result["id"])
+                    return True
+                return False
+
+            def update(i):
+                if not ids:
+                    return False
+                result = publisher.update_article(ids[i % len(ids)], body_markdown=BENCH_BODY + str(i))
+                return "id" in result
+
+            def list_page(i):
+                return isinstance(publisher.get_articles(page=i % 5 + 1, per_page=30), list)
+
+            def publish_all(i):
+                return all(r.get("status") == "success" for r in agent_li_style.publish_all(publisher, workers=1))
+
+            results["publish_article"] = measure(publish, count, workers)
+            results["update_article"] = measure(update, count, workers)
+            results["get_articles"] = measure(list_page, count, workers)
+            runs = max(1, count // len(agent_li_style.ARTICLES))
+            results["publish_all"] = measure(publish_all, runs, workers, len(agent_li_style.ARTICLES))
+
+        report["server_requests"] = server.state.requests
+
+    report["peak_rss_kb"] = peak_rss_kb()
+    return report
+
+
+def print_report(report: Dict):
+    """以表格形式打印报告"""
+    print(f"{'operation':<16}{'calls':>7}{'errors':>8}{'ops/sec':>11}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, r in report["results"].items():
+        print(f"{name:<16}{r['calls']:>7}{r['errors']:>8}{r['ops_per_sec']:>11.1f}"
+              f"{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}{r['p99_ms']:>10.2f}")
+    print(f"\nserver requests: {report['server_requests']}    peak RSS: {report['peak_rss_kb']} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DevToPublisher 离线基准测试")
+    parser.add_argument("--count", type=int, default=200, help="每项操作的调用次数")
+    parser.add_argument("--workers", type=int, default=8, help="并发数")
+    parser.add_argument("--latency", type=float, default=0.0, help="模拟服务基础延迟（秒）")
+    parser.add_argument("--jitter", type=float, default=0.0, help="模拟服务随机附加延迟（秒）")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 注入概率")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 注入概率")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="输出 JSON 报告")
+    args = parser.parse_args()
+
+    report = run_benchmarks(
+        count=args.count, workers=args.workers, latency=args.latency, jitter=args.jitter,
+        error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate, seed=args.seed
+    )
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
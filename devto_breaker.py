@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+按接口熔断
+
+每个接口（如 "POST /articles"、"PUT /articles/{id}"）一个熔断器：
+- closed：正常放行，滑动窗口内统计失败率和慢调用比例
+- open：失败率或慢调用比例超过阈值后打开，直接拒绝请求（抛出 CircuitOpenError，
+  发布路径返回 status == "unavailable"），不占用限流令牌和工作线程
+- half-open：open 持续 open_seconds 后放行少量探测请求，全部成功则关闭，任一失败重新打开
+
+失败的定义：网络异常（超时、连接失败）和 5xx 响应；429 由限流器处理，不计入失败。
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_WINDOW = 20             # 滑动窗口（最近 N 次调用）
+DEFAULT_MIN_CALLS = 10          # 窗口内至少这么多次调用才判断
+DEFAULT_FAILURE_RATE = 0.5
+DEFAULT_SLOW_CALL_SECONDS = 10.0
+DEFAULT_SLOW_CALL_RATE = 0.8
+DEFAULT_OPEN_SECONDS = 30.0
+DEFAULT_PROBES = 2
+
+
+class CircuitOpenError(Exception):
+    """熔断器打开，请求未发出"""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        super().__init__(f"{endpoint} 暂不可用（熔断中），{retry_after:.1f} 秒后重试")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+    def result(self) -> Dict:
+        """发布路径中的返回值"""
+        return {
+            "status": "unavailable",
+            "endpoint": self.endpoint,
+            "retry_after": round(self.retry_after, 3),
+            "message": str(self),
+        }
+
+
+class CircuitBreaker:
+    """单个接口的熔断器（线程安全）"""
+
+    __slots__ = (
+        "window", "min_calls", "failure_rate", "slow_call_seconds", "slow_call_rate",
+        "open_seconds", "probes", "state", "_outcomes", "_failures", "_slow",
+        "_opened_at", "_probes_in_flight", "_probe_successes", "_lock",
+    )
+
+    def __init__(
+        self,
+        window: int = DEFAULT_WINDOW,
+        min_calls: int = DEFAULT_MIN_CALLS,
+        failure_rate: float = DEFAULT_FAILURE_RATE,
+        slow_call_seconds: float = DEFAULT_SLOW_CALL_SECONDS,
+        slow_call_rate: float = DEFAULT_SLOW_CALL_RATE,
+        open_seconds: float = DEFAULT_OPEN_SECONDS,
+        probes: int = DEFAULT_PROBES
+    ):
+        """
+        Args:
+            window: 滑动窗口大小（最近 N 次调用）
+            min_calls: 窗口内至少这么多次调用才判断是否打开
+            failure_rate: 失败率阈值
+            slow_call_seconds: 超过该耗时（秒）算慢调用
+            slow_call_rate: 慢调用比例阈值
+            open_seconds: 打开后多久进入半开
+            probes: 半开时放行的探测请求数（全部成功才关闭）
+        """
+        self.window = window
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.open_seconds = open_seconds
+        self.probes = probes
+        self.state = CLOSED
+        self._outcomes = deque()
+        self._failures = 0
+        self._slow = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+
+    def _reset_window(self):
+        self._outcomes.clear()
+        self._failures = 0
+        self._slow = 0
+
+    def _open(self, now: float):
+        self.state = OPEN
+        self._opened_at = now
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._reset_window()
+
+    def retry_after(self) -> float:
+        """距离进入半开还剩的秒数"""
+        return max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+
+    def allow(self) -> bool:
+        """是否放行一次请求（放行后必须调用 record）"""
+        if self.state == CLOSED:
+            return True
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.open_seconds:
+                    return False
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN:
+                if self._probes_in_flight + self._probe_successes >= self.probes:
+                    return False
+                self._probes_in_flight += 1
+            return True
+
+    def release(self):
+        """放行的请求被取消、没有结果时调用（归还半开探测名额）"""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def record(self, failed: bool, elapsed: float):
+        """记录一次调用结果"""
+        slow = elapsed >= self.slow_call_seconds
+        with self._lock:
+            now = time.monotonic()
+            if self.state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                if failed or slow:
+                    self._open(now)
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.probes:
+                        self.state = CLOSED
+                        self._reset_window()
+                return
+            if self.state == OPEN:
+                return
+
+            self._outcomes.append((failed, slow))
+            self._failures += failed
+            self._slow += slow
+            if len(self._outcomes) > self.window:
+                old_failed, old_slow = self._outcomes.popleft()
+                self._failures -= old_failed
+                self._slow -= old_slow
+            calls = len(self._outcomes)
+            if calls >= self.min_calls and (
+                self._failures / calls >= self.failure_rate or self._slow / calls >= self.slow_call_rate
+            ):
+                self._open(now)
+
+    def snapshot(self) -> Dict:
+        """当前状态、窗口内调用数、失败率和慢调用比例"""
+        with self._lock:
+            calls = len(self._outcomes)
+            state = self.state
+            if state == OPEN and not self.retry_after():
+                state = HALF_OPEN  # 下一次 allow() 时才真正切换
+            return {
+                "state": state,
+                "calls": calls,
+                "failure_rate": round(self._failures / calls, 3) if calls else 0.0,
+                "slow_call_rate": round(self._slow / calls, 3) if calls else 0.0,
+                "retry_after": round(self.retry_after(), 3) if state == OPEN else 0.0,
+            }
+
+
+class CircuitBreakers:
+    """按接口分组的熔断器集合，可在多个发布器间共享"""
+
+    def __init__(self, **options):
+        """
+        Args:
+            **options: 传给每个 CircuitBreaker 的参数
+        """
+        self.options = options
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(endpoint, CircuitBreaker(**self.options))
+        return breaker
+
+    def check(self, endpoint: str) -> CircuitBreaker:
+        """
+        放行则返回熔断器
+
+        Raises:
+            CircuitOpenError: 熔断中
+        """
+        breaker = self.get(endpoint)
+        if not breaker.allow():
+            raise CircuitOpenError(endpoint, breaker.retry_after())
+        return breaker
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """各接口的熔断状态"""
+        return {endpoint: breaker.snapshot() for endpoint, breaker in sorted(self._breakers.items())}
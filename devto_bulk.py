@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Dev.to 批量发布引擎
+
+用线程池并发调用 DevToPublisher.publish_article，
+N 篇文章的总耗时从 N × RTT 降到约 N × RTT / workers。
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List
+
+from devto_models import to_results
+from devto_validate import invalid_result, validate_batch
+
+DEFAULT_WORKERS = 4
+
+
+def publish_one(publisher, article: Dict) -> Dict:
+    """发布单篇文章并记录耗时"""
+    start = time.perf_counter()
+    try:
+        result = publisher.publish_article(
+            title=article["title"],
+            content=article["content"],
+            tags=article.get("tags"),
+            published=article.get("published", True),
+            canonical_url=article.get("canonical_url"),
+            description=article.get("description"),
+            key=article.get("key")
+        )
+    except Exception as e:
+        result = {"status": "error", "message": str(e)}
+    result["elapsed"] = time.perf_counter() - start
+    return result
+
+
+def publish_many(publisher, articles: Iterable[Dict], workers: int = DEFAULT_WORKERS, records: bool = False) -> List[Dict]:
+    """
+    并发发布多篇文章
+
+    Args:
+        publisher: DevToPublisher 实例（连接池可在线程间共享）
+        articles: 文章字典的可迭代对象，如 ARTICLES 或 ContentGenerator.TOPICS
+        workers: 同时在途的请求数
+        records: 返回紧凑的 PublishResult 记录而不是字典
+
+    Returns:
+        与输入顺序一致的结果列表，每项附带 elapsed（秒）；
+        本地校验不通过的文章不发请求，结果为 status == "invalid"
+    """
+    articles = list(articles)
+    valid, report = validate_batch(articles)
+    accepted = set(valid)
+    results: List[Dict] = [None] * len(articles)
+    for item in report:
+        if item["index"] not in accepted:
+            results[item["index"]] = dict(invalid_result(articles[item["index"]], item["problems"]), elapsed=0.0)
+    pending = [articles[i] for i in valid]
+
+    if workers <= 1:
+        published = [publish_one(publisher, a) for a in pending]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            published = list(executor.map(lambda a: publish_one(publisher, a), pending))
+    for index, result in zip(valid, published):
+        results[index] = result
+    return to_results(results) if records else results
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+GET 响应缓存
+
+- TTL 内直接返回缓存（不发请求、不重复解析 JSON）
+- 过期后如有 ETag / Last-Modified，则带 If-None-Match / If-Modified-Since
+  重新验证，304 时复用缓存
+- 超过容量按 LRU 淘汰
+- 写操作（发布 / 更新）后按路径前缀失效
+- 缓存键包含账户标识（API Key 的哈希），多个账户共享同一个缓存时互不串用
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_TTL = 60.0
+DEFAULT_MAX_ENTRIES = 256
+
+
+def identity_of(api_key: Optional[str]) -> Optional[str]:
+    """API Key 的短哈希（缓存键里不保存 Key 本身）"""
+    if not api_key:
+        return None
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+class CacheEntry:
+    """一条缓存记录"""
+
+    __slots__ = ("data", "etag", "last_modified", "expires_at")
+
+    def __init__(self, data: Any, etag: str, last_modified: str, expires_at: float):
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """条件请求头"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """线程安全的 LRU + TTL 响应缓存"""
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            ttl: 缓存有效期（秒）
+            max_entries: 最多缓存的响应数
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(path: str, params: Dict = None, identity: str = None) -> Tuple:
+        """
+        Args:
+            path: 请求路径
+            params: 查询参数
+            identity: 账户标识（identity_of(api_key)），/me、/articles/me 等按账户返回不同内容
+        """
+        return (path, tuple(sorted((params or {}).items())), identity)
+
+    def get(self, key: Tuple) -> Optional[CacheEntry]:
+        """取出缓存记录（可能已过期），并记录命中 / 未命中"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if entry.fresh:
+                self.hits += 1
+            return entry
+
+    def put(self, key: Tuple, data: Any, etag: str = None, last_modified: str = None):
+        with self._lock:
+            self._entries[key] = CacheEntry(data, etag, last_modified, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def refresh(self, key: Tuple) -> Optional[CacheEntry]:
+        """服务端返回 304：延长有效期"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.expires_at = time.monotonic() + self.ttl
+                self.revalidated += 1
+            return entry
+
+    def record_stale_miss(self):
+        """过期且无法重新验证"""
+        with self._lock:
+            self.misses += 1
+
+    def invalidate(self, prefix: str = ""):
+        """删除路径以 prefix 开头的缓存（为空时清空）"""
+        with self._lock:
+            for key in [k for k in self._entries if k[0].startswith(prefix)]:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, int]:
+        """命中统计"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidated": self.revalidated,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
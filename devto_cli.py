@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Dev.to 命令行（非交互）
+
+    python devto_cli.py publish post.md other.md --workers 4
+    python devto_cli.py publish --collection topics --dry-run
+    python devto_cli.py update 123 post.md
+    python devto_cli.py sync articles/ --workers 8
+    python devto_cli.py list [--remote]
+    python devto_cli.py stats
+    python devto_cli.py search "GitHub Actions 部署" -n 5
+    python devto_cli.py --profile profile.json publish --collection topics
+    python devto_cli.py --search-index ~/.devto_publisher/search.npz publish post.md
+
+每个结果输出一行 JSON（JSON Lines），方便管道和调度器处理；
+有失败时退出码为 1，缺少 API Key 时为 2。
+
+模块顶层只导入标准库，requests 等重依赖在子命令内按需导入，
+--help 和本地 list 不会加载它们，也不会请求 /me。
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, Iterable, List, Tuple
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_NO_KEY = 2
+
+OK_STATUSES = ("success", "updated", "skipped", "dry_run", "unchanged", "removed")
+
+
+def emit(record: Dict, out=None):
+    """输出一行 JSON"""
+    out = out or sys.stdout
+    out.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+    out.flush()
+
+
+def _emit_all(records: Iterable[Dict]) -> int:
+    """逐条输出结果，返回退出码"""
+    code = EXIT_OK
+    for record in records:
+        emit(record)
+        if record.get("status") not in OK_STATUSES:
+            code = EXIT_FAILED
+    return code
+
+
+def _read_article(path: str) -> Dict:
+    """读取并解析 Markdown 文件；文件不存在、无法读取或不是 UTF-8 时返回 status == "error" 的结果"""
+    from devto_sync import parse_markdown
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        return {"status": "error", "path": path, "error": str(e)}
+    article = parse_markdown(text, os.path.splitext(os.path.basename(path))[0])
+    article["path"] = path
+    return article
+
+
+def _load_articles(args) -> Tuple[List[Dict], List[Dict]]:
+    """publish 的输入：文件列表或内置文章集，返回 (文章列表, 读取失败的结果)"""
+    articles, failed = [], []
+    for path in args.files:
+        article = _read_article(path)
+        (failed if article.get("status") == "error" else articles).append(article)
+    if args.collection:
+        from devto_content import load_collection
+        articles.extend(
+            {"title": a["title"], "content": a["content"], "tags": list(a["tags"])}
+            for a in load_collection(args.collection)
+        )
+    if args.draft:
+        for article in articles:
+            article["published"] = False
+    return articles, failed
+
+
+def _publisher(args, ledger: bool = True):
+    """
+    构造 DevToPublisher（只在需要访问网络的子命令里调用）
+
+    Args:
+        ledger: 是否打开账本（只读的子命令不需要，避免创建 ~/.devto_publisher/ledger.db）
+    """
+    from devto_publisher import DevToPublisher
+
+    if not ledger or args.no_ledger:
+        ledger = None
+    else:
+        from devto_ledger import DEFAULT_LEDGER_PATH, Ledger
+        ledger = Ledger(args.ledger or DEFAULT_LEDGER_PATH)
+    if args.search_index and args.search is None:
+        from devto_search import SearchIndex
+        args.search = SearchIndex(args.search_index)  # main() 结束时保存
+    return DevToPublisher(
+        ledger=ledger,
+        pool_size=max(args.workers, 1),
+        search=args.search,
+        profiler=args.profiler,
+        api_base=args.api_base
+    )
+
+
+def _require_key() -> bool:
+    if os.getenv("DEVTO_API_KEY"):
+        return True
+    emit({"status": "error", "message": "请设置 DEVTO_API_KEY 环境变量"}, sys.stderr)
+    return False
+
+
+# --- 子命令 ---
+
+def cmd_publish(args) -> int:
+    articles, failed = _load_articles(args)
+    code = _emit_all(failed)
+    if args.dry_run:
+        from devto_validate import validate_batch
+        valid, report = validate_batch(articles)
+        problems = {item["index"]: item["problems"] for item in report}
+        valid = set(valid)
+        return _emit_all(
+            {
+                "status": "dry_run" if i in valid else "invalid",
+                "title": a["title"],
+                "tags": a.get("tags"),
+                "path": a.get("path"),
+                "problems": problems.get(i, []),
+            }
+            for i, a in enumerate(articles)
+        ) or code
+    if not _require_key():
+        return EXIT_NO_KEY
+
+    from concurrent.futures import ThreadPoolExecutor
+    from devto_bulk import publish_one
+
+    with _publisher(args) as publisher, ThreadPoolExecutor(max_workers=max(args.workers, 1)) as executor:
+        results = executor.map(lambda a: dict(publish_one(publisher, a), path=a.get("path")), articles)
+        return _emit_all(results) or code
+
+
+def cmd_update(args) -> int:
+    article = _read_article(args.file)
+    if article.get("status") == "error":
+        return _emit_all([article])
+    fields = {"title": article["title"], "body_markdown": article["content"]}
+    if article.get("tags"):
+        fields["tags"] = article["tags"][:4]
+    for name in ("published", "description", "canonical_url"):
+        if name in article:
+            fields[name] = article[name]
+    if args.dry_run:
+        return _emit_all([{"status": "dry_run", "id": args.id, "title": article["title"], "path": args.file}])
+    if not _require_key():
+        return EXIT_NO_KEY
+
+    with _publisher(args) as publisher:
+        result = publisher.update_article(args.id, **fields)
+    if "id" in result:
+        record = {"status": "updated", "id": result["id"], "url": result.get("url"), "title": result.get("title")}
+    else:
+        record = {"status": "error", "id": args.id, "message": result.get("message", result.get("error", result))}
+    return _emit_all([record])
+
+
+def cmd_sync(args) -> int:
+    from devto_sync import sync_directory
+
+    if args.dry_run:
+        publisher = None
+    elif not _require_key():
+        return EXIT_NO_KEY
+    else:
+        publisher = _publisher(args)
+    try:
+        summary = sync_directory(publisher, args.directory, args.state, args.workers, args.dry_run)
+    finally:
+        if publisher is not None:
+            publisher.close()
+
+    status = "dry_run" if args.dry_run else None
+
+    def records():
+        for rel in summary["published"]:
+            yield {"status": status or "success", "path": rel}
+        for rel in summary["updated"]:
+            yield {"status": status or "updated", "path": rel}
+        for error in summary["errors"]:
+            yield {"status": "error", "path": error["path"], "result": error["result"]}
+        for rel in summary["removed"]:
+            yield {"status": "removed", "path": rel}
+        yield {"status": "unchanged", "count": summary["unchanged"]}
+
+    return _emit_all(records())
+
+
+def cmd_list(args) -> int:
+    if not args.remote:
+        from devto_content import CONTENT_DIR, list_collections, load_collection
+        content_dir = args.content_dir or CONTENT_DIR
+        names = [args.collection] if args.collection else list_collections(content_dir)
+        return _emit_all(
+            {"status": "success", "collection": name, "index": i, "title": a.title, "tags": a.tags}
+            for name in names
+            for i, a in enumerate(load_collection(name, content_dir), 1)
+        )
+    if not args.username and not _require_key():
+        return EXIT_NO_KEY
+
+    def records(articles, outcome):
+        for a in articles:
+            yield {
+                "status": "success",
+                "id": a.get("id"),
+                "title": a.get("title"),
+                "url": a.get("url"),
+                "published_at": a.get("published_at"),
+            }
+
+    return _emit_remote(args, records)
+
+
+def cmd_stats(args) -> int:
+    if not args.username and not _require_key():
+        return EXIT_NO_KEY
+
+    totals = {"articles": 0, "views": 0, "reactions": 0, "comments": 0}
+
+    def records(articles, outcome):
+        for a in articles:
+            row = {
+                "status": "success",
+                "id": a.get("id"),
+                "title": a.get("title"),
+                "views": a.get("page_views_count") or 0,
+                "reactions": a.get("positive_reactions_count", a.get("public_reactions_count")) or 0,
+                "comments": a.get("comments_count") or 0,
+            }
+            totals["articles"] += 1
+            totals["views"] += row["views"]
+            totals["reactions"] += row["reactions"]
+            totals["comments"] += row["comments"]
+            if not args.summary:
+                yield row
+        if not outcome.get("result"):
+            yield {"status": "success", "total": totals}
+
+    return _emit_remote(args, records)
+
+
+def _emit_remote(args, records) -> int:
+    """
+    遍历已发布文章并逐条输出（list --remote / stats）
+
+    遍历失败（HTTP 错误、熔断）时在 stderr 输出一行错误，退出码为 1。
+
+    Args:
+        records: (articles, outcome) -> 要输出的记录；outcome["result"] 非空表示没有遍历完
+    """
+    import requests
+    from devto_publisher import capture_result
+
+    outcome = {}
+    with _publisher(args, ledger=False) as publisher:
+        try:
+            code = _emit_all(records(capture_result(publisher.iter_articles(args.username), outcome), outcome))
+        except (requests.RequestException, ValueError) as e:
+            emit({"status": "error", "message": str(e)}, sys.stderr)
+            return EXIT_FAILED
+    if outcome.get("result"):
+        emit(outcome["result"], sys.stderr)
+        return EXIT_FAILED
+    return code
+
+
+def cmd_search(args) -> int:
+    from devto_search import DEFAULT_SEARCH_PATH, SearchIndex
+
+    path = args.index or DEFAULT_SEARCH_PATH
+    if not os.path.exists(path):
+        emit({"status": "error", "message": f"索引不存在: {path}（先运行 python devto_search.py index）"}, sys.stderr)
+        return EXIT_FAILED
+    hits = SearchIndex(path).search(" ".join(args.query), args.limit, args.source)
+    return _emit_all(dict(hit, status="success") for hit in hits)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Dev.to 批量发布命令行（输出 JSON Lines）")
+    parser.add_argument("--api-base", default="https://dev.to/api", help="API 地址（测试时可指向本地模拟服务）")
+    parser.add_argument("--ledger", help="账本路径（默认 ~/.devto_publisher/ledger.db）")
+    parser.add_argument("--no-ledger", action="store_true", help="不使用账本")
+    parser.add_argument(
+        "--search-index", metavar="PATH",
+        help="发布 / 更新成功的文章同时收录到该全文索引（结束时保存）"
+    )
+    parser.add_argument("--profile", metavar="REPORT", help="开启性能剖析，结束后把 JSON 报告写到该路径")
+    parser.add_argument(
+        "--profile-snapshot-every", type=int, default=0, metavar="N",
+        help="剖析时每发布 N 篇拍一次内存快照（默认只在开始和结束时拍）"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(p):
+        p.add_argument("--workers", type=int, default=4, help="并发请求数")
+        p.add_argument("--dry-run", action="store_true", help="只输出将要执行的操作，不发请求")
+
+    p = sub.add_parser("publish", help="发布 Markdown 文件或内置文章集")
+    p.add_argument("files", nargs="*", help="Markdown 文件（支持 front matter）")
+    p.add_argument("--collection", help="内置文章集（如 topics、agent_li）")
+    p.add_argument("--draft", action="store_true", help="以草稿形式发布")
+    add_common(p)
+    p.set_defaults(func=cmd_publish)
+
+    p = sub.add_parser("update", help="用 Markdown 文件更新已发布文章")
+    p.add_argument("id", type=int, help="文章 ID")
+    p.add_argument("file", help="Markdown 文件")
+    add_common(p)
+    p.set_defaults(func=cmd_update)
+
+    p = sub.add_parser("sync", help="增量同步 Markdown 目录")
+    p.add_argument("directory", help="Markdown 目录")
+    p.add_argument("--state", help="同步状态文件（默认为目录下的 .devto_sync.json）")
+    add_common(p)
+    p.set_defaults(func=cmd_sync)
+
+    p = sub.add_parser("list", help="列出内置文章（--remote 列出已发布文章）")
+    p.add_argument("--remote", action="store_true", help="列出 Dev.to 上的文章")
+    p.add_argument("--username", help="列出指定用户的公开文章（隐含 --remote）")
+    p.add_argument("--collection", help="只列出指定内置文章集")
+    p.add_argument("--content-dir", help="文章库目录（默认为内置 content/）")
+    p.set_defaults(func=cmd_list, workers=1)
+
+    p = sub.add_parser("stats", help="已发布文章的阅读 / 点赞 / 评论统计")
+    p.add_argument("--username", help="统计指定用户的公开文章")
+    p.add_argument("--summary", action="store_true", help="只输出汇总行")
+    p.set_defaults(func=cmd_stats, workers=1)
+
+    p = sub.add_parser("search", help="在本地全文索引中查询（内置文章、Markdown 目录、已发布文章）")
+    p.add_argument("query", nargs="+", help="查询文本")
+    p.add_argument("-n", "--limit", type=int, default=10, help="最多返回的结果数")
+    p.add_argument("--source", help="只查某个来源（topics、agent_li、markdown、devto）")
+    p.add_argument("--index", help="索引路径（默认 ~/.devto_publisher/search.npz）")
+    p.set_defaults(func=cmd_search, workers=1)
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "list" and args.username:
+        args.remote = True
+    if args.command == "publish" and not (args.files or args.collection):
+        emit({"status": "error", "message": "请指定 Markdown 文件或 --collection"}, sys.stderr)
+        return EXIT_FAILED
+    args.search = None
+    try:
+        if not args.profile:
+            args.profiler = None
+            return args.func(args)
+
+        from devto_profile import Profiler
+        args.profiler = Profiler(snapshot_on=("publish_article",), snapshot_every=args.profile_snapshot_every)
+        with args.profiler:
+            code = args.func(args)
+        report = args.profiler.write(args.profile)
+        emit({"status": "profile", "path": args.profile, "summary": report["summary"]}, sys.stderr)
+        return code
+    finally:
+        if args.search is not None:
+            args.search.save()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+磁盘文章库
+
+文章正文以 Markdown 文件存放在 content/ 目录，content/index.json 记录标题和标签。
+导入时只读取索引；正文在第一次访问 article["content"] 时才通过 mmap 读入。
+"""
+
+import json
+import mmap
+import os
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Dict, List
+
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content")
+INDEX_FILENAME = "index.json"
+
+
+def _read_body(path: str) -> str:
+    """用 mmap 读取正文"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return m[:].decode("utf-8")
+
+
+class StoredArticle(Mapping):
+    """
+    只读文章记录，用法与原来的文章字典一致
+
+    title / tags 来自索引；content 首次访问时才从磁盘读取。
+    """
+
+    __slots__ = ("title", "tags", "path", "_content")
+
+    def __init__(self, title: str, tags: List[str], path: str):
+        self.title = title
+        self.tags = tags
+        self.path = path
+        self._content = None
+
+    @property
+    def content(self) -> str:
+        if self._content is None:
+            self._content = _read_body(self.path)
+        return self._content
+
+    @property
+    def loaded(self) -> bool:
+        """正文是否已读入内存"""
+        return self._content is not None
+
+    def __getitem__(self, key: str):
+        if key == "title":
+            return self.title
+        if key == "tags":
+            return self.tags
+        if key == "content":
+            return self.content
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(("title", "content", "tags"))
+
+    def __len__(self) -> int:
+        return 3
+
+    def __repr__(self) -> str:
+        return f"StoredArticle(title={self.title!r}, tags={self.tags!r}, path={self.path!r})"
+
+
+@lru_cache(maxsize=None)
+def _load_index(content_dir: str) -> Dict:
+    with open(os.path.join(content_dir, INDEX_FILENAME), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_collection(name: str, content_dir: str = CONTENT_DIR) -> List[StoredArticle]:
+    """
+    加载一个文章集合（只读索引，不读正文）
+
+    Args:
+        name: 集合名，如 "topics" 或 "agent_li"
+        content_dir: 文章库目录
+    """
+    return [
+        StoredArticle(entry["title"], entry["tags"], os.path.join(content_dir, entry["file"]))
+        for entry in _load_index(content_dir)[name]
+    ]
+
+
+def list_collections(content_dir: str = CONTENT_DIR) -> List[str]:
+    """文章库中的全部集合名"""
+    return sorted(_load_index(content_dir))
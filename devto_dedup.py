@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+近似重复检测（MinHash + LSH）
+
+- 正文切成词级 shingle（中文按二元组），用 NumPy 批量计算 MinHash 签名
+- 签名分成若干 band，每个 band 的哈希放进按 band 排序的数组，
+  查询时二分查找候选，再用签名估算 Jaccard 相似度
+- 候选查找为 O(bands · log n)，10 万篇规模下单次查询在毫秒级
+
+只能发现同一语言内的近似重复；译文（如中文 TOPICS[0] 与英文 ARTICLES[0]）
+shingle 几乎没有交集，需要先翻译成同一语言再比较。
+
+依赖：pip install numpy
+"""
+
+import json
+import os
+import threading
+import zlib
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from devto_tags import tokenize
+
+DEFAULT_DEDUP_PATH = os.path.expanduser("~/.devto_publisher/dedup.npz")
+DEFAULT_NUM_PERM = 128
+DEFAULT_BANDS = 32
+DEFAULT_THRESHOLD = 0.7
+DEFAULT_SHINGLE_SIZE = 3
+MERGE_THRESHOLD = 1024  # 新增文档攒到这么多再合并进排序数组
+SIGNATURE_CHUNK = 4096  # 计算签名时每批 shingle 数，中间矩阵为 num_perm × SIGNATURE_CHUNK
+
+
+def shingles(text: str, size: int = DEFAULT_SHINGLE_SIZE) -> np.ndarray:
+    """词级 shingle 的 32 位哈希（去重后）"""
+    tokens = tokenize(text)
+    if len(tokens) < size:
+        grams = [" ".join(tokens)] if tokens else []
+    else:
+        grams = [" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)]
+    return np.unique(np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams)))
+
+
+class DuplicateIndex:
+    """MinHash 签名 + LSH 分桶的近似重复索引"""
+
+    def __init__(
+        self,
+        path: str = None,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        threshold: float = DEFAULT_THRESHOLD,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        seed: int = 1
+    ):
+        """
+        Args:
+            path: 索引文件路径（存在时自动加载）
+            num_perm: 签名长度
+            bands: LSH band 数（num_perm 必须能被整除）
+            threshold: 判定为近似重复的 Jaccard 相似度阈值
+            shingle_size: 每个 shingle 的词数
+            seed: 哈希函数随机种子（同一索引必须保持不变）
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm 必须是 bands 的整数倍")
+        self.path = path
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.seed = seed
+        rng = np.random.RandomState(seed)
+        # multiply-shift 哈希族：h(x) = ((a·x + b) mod 2^64) >> 32
+        self._a = rng.randint(1, 2 ** 63, size=num_perm, dtype=np.int64).astype(np.uint64) | np.uint64(1)
+        self._b = rng.randint(0, 2 ** 63, size=num_perm, dtype=np.int64).astype(np.uint64)
+        self._band_mult = rng.randint(1, 2 ** 63, size=self.rows, dtype=np.int64).astype(np.uint64) | np.uint64(1)
+
+        self._lock = threading.Lock()
+        self.keys: List[str] = []
+        self._key_index: Dict[str, int] = {}
+        self._signatures = np.zeros((0, num_perm), dtype=np.uint32)
+        self._removed = set()
+        # 已合并部分：每个 band 一组按哈希排序的 (band_hash, doc_id)
+        self._band_hashes = [np.zeros(0, dtype=np.uint64) for _ in range(bands)]
+        self._band_ids = [np.zeros(0, dtype=np.int64) for _ in range(bands)]
+        # 未合并部分：band -> {band_hash: [doc_id]}
+        self._recent: List[Dict[int, List[int]]] = [dict() for _ in range(bands)]
+        self._recent_count = 0
+
+        if path and os.path.exists(path):
+            self._load(path)
+
+    # --- 签名 ---
+
+    def signature(self, text: str) -> np.ndarray:
+        """文本的 MinHash 签名（uint32 × num_perm）"""
+        values = shingles(text, self.shingle_size)
+        if not values.size:
+            return np.full(self.num_perm, 0xFFFFFFFF, dtype=np.uint32)
+        # 分批计算再取最小值，长文的中间矩阵大小固定（num_perm × SIGNATURE_CHUNK）
+        result = np.full(self.num_perm, np.iinfo(np.uint64).max, dtype=np.uint64)
+        for start in range(0, values.size, SIGNATURE_CHUNK):
+            chunk = values[start:start + SIGNATURE_CHUNK]
+            hashed = (self._a[:, None] * chunk[None, :] + self._b[:, None]) >> np.uint64(32)
+            np.minimum(result, hashed.min(axis=1), out=result)
+        return result.astype(np.uint32)
+
+    def _band_keys(self, signatures: np.ndarray) -> np.ndarray:
+        """（文档数 × bands）的 band 哈希"""
+        grouped = signatures.astype(np.uint64).reshape(len(signatures), self.bands, self.rows)
+        return (grouped * self._band_mult).sum(axis=2, dtype=np.uint64)
+
+    # --- 维护 ---
+
+    def add(self, key: str, text: str):
+        """加入 / 替换一篇文章"""
+        self.add_many([(key, text)])
+
+    def add_many(self, items: Iterable[Tuple[str, str]]):
+        """批量加入（key, 正文）"""
+        items = list(items)
+        if not items:
+            return
+        signatures = np.stack([self.signature(text) for _, text in items])
+        band_keys = self._band_keys(signatures)
+        with self._lock:
+            start = len(self.keys)
+            for offset, (key, _) in enumerate(items):
+                old = self._key_index.get(key)
+                if old is not None:
+                    self._removed.add(old)
+                self._key_index[key] = start + offset
+                self.keys.append(key)
+            self._signatures = np.concatenate([self._signatures, signatures])
+            for row, doc_id in enumerate(range(start, start + len(items))):
+                for band in range(self.bands):
+                    self._recent[band].setdefault(int(band_keys[row, band]), []).append(doc_id)
+            self._recent_count += len(items)
+            if self._recent_count >= MERGE_THRESHOLD:
+                self._merge()
+
+    def remove(self, key: str):
+        """移除一篇文章"""
+        with self._lock:
+            doc_id = self._key_index.pop(key, None)
+            if doc_id is not None:
+                self._removed.add(doc_id)
+
+    def _merge(self):
+        """把未合并的新文档并入排序数组"""
+        if not self._recent_count:
+            return
+        for band in range(self.bands):
+            recent = self._recent[band]
+            hashes = np.fromiter((h for h, ids in recent.items() for _ in ids), dtype=np.uint64)
+            ids = np.fromiter((i for ids in recent.values() for i in ids), dtype=np.int64)
+            all_hashes = np.concatenate([self._band_hashes[band], hashes])
+            all_ids = np.concatenate([self._band_ids[band], ids])
+            order = np.argsort(all_hashes, kind="stable")
+            self._band_hashes[band] = all_hashes[order]
+            self._band_ids[band] = all_ids[order]
+            self._recent[band] = {}
+        self._recent_count = 0
+
+    def __len__(self) -> int:
+        return len(self._key_index)
+
+    # --- 查询 ---
+
+    def query(self, text: str, threshold: float = None, exclude: str = None) -> List[Tuple[str, float]]:
+        """
+        查找近似重复
+
+        Args:
+            text: 待检测正文
+            threshold: 相似度阈值（默认用索引的 threshold）
+            exclude: 排除的文章标识（通常是自身）
+
+        Returns:
+            [(key, 估算相似度)]，按相似度降序
+        """
+        threshold = self.threshold if threshold is None else threshold
+        signature = self.signature(text)
+        band_keys = self._band_keys(signature[None, :])[0]
+        candidates = set()
+        with self._lock:
+            for band in range(self.bands):
+                value = band_keys[band]
+                hashes = self._band_hashes[band]
+                lo = np.searchsorted(hashes, value, side="left")
+                hi = np.searchsorted(hashes, value, side="right")
+                candidates.update(self._band_ids[band][lo:hi].tolist())
+                candidates.update(self._recent[band].get(int(value), ()))
+            candidates -= self._removed
+            if not candidates:
+                return []
+            ids = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+            similarity = (self._signatures[ids] == signature).mean(axis=1)
+            keys = self.keys
+
+        matches = [
+            (keys[doc_id], round(float(sim), 4))
+            for doc_id, sim in zip(ids.tolist(), similarity.tolist())
+            if sim >= threshold and keys[doc_id] != exclude
+        ]
+        matches.sort(key=lambda m: -m[1])
+        return matches
+
+    # --- 持久化 ---
+
+    def save(self, path: str = None):
+        """保存索引（只保存签名，分桶在加载时重建）"""
+        path = path or self.path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._lock:
+            live = sorted(self._key_index.items(), key=lambda kv: kv[1])
+            meta = json.dumps({
+                "keys": [k for k, _ in live],
+                "num_perm": self.num_perm, "bands": self.bands,
+                "shingle_size": self.shingle_size, "seed": self.seed,
+            })
+            signatures = self._signatures[[i for _, i in live]] if live else self._signatures[:0]
+        tmp = path + ".tmp.npz"
+        np.savez_compressed(tmp, meta=np.array(meta), signatures=signatures)
+        os.replace(tmp, path)
+
+    def _load(self, path: str):
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            signatures = data["signatures"]
+        if (meta["num_perm"], meta["bands"], meta["shingle_size"], meta["seed"]) != \
+                (self.num_perm, self.bands, self.shingle_size, self.seed):
+            raise ValueError("索引参数与当前配置不一致")
+        self.keys = list(meta["keys"])
+        self._key_index = {key: i for i, key in enumerate(self.keys)}
+        self._signatures = signatures
+        band_keys = self._band_keys(signatures)
+        ids = np.arange(len(self.keys), dtype=np.int64)
+        for band in range(self.bands):
+            order = np.argsort(band_keys[:, band], kind="stable")
+            self._band_hashes[band] = band_keys[order, band]
+            self._band_ids[band] = ids[order]
+
+
+def article_text(article: Mapping) -> str:
+    """用于比对的文本：标题 + 正文"""
+    return f"{article.get('title', '')}\n{article.get('content', article.get('body_markdown', ''))}"
+
+
+def build_default_index(path: Optional[str] = DEFAULT_DEDUP_PATH, publisher=None) -> DuplicateIndex:
+    """
+    用内置文章和（可选）已发布文章建立索引
+
+    Args:
+        path: 索引文件（None 表示不保存）
+        publisher: 提供时遍历 /articles/me 收录已发布文章
+    """
+    from devto_content import load_collection
+    from devto_ledger import normalize_key
+
+    index = DuplicateIndex(path)
+    local = list(load_collection("topics")) + list(load_collection("agent_li"))
+    index.add_many((normalize_key(a["title"]), article_text(a)) for a in local)
+    if publisher is not None:
+        index.add_many(
+            (normalize_key(a["title"]), article_text(a))
+            for a in publisher.iter_articles()
+            if a.get("body_markdown")
+        )
+    if path:
+        index.save(path)
+    return index
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+已发布文章账本
+
+用 SQLite 记录「文章标识 → 内容哈希、文章 id/url」，重复运行时：
+- 内容未变：直接跳过，不发任何请求
+- 内容有变：改走 update_article
+- 新文章：先占位（claim），发布成功后记账；多个线程 / 进程同时发布同一篇时只有一个发请求
+
+占位行的 article_id 为 0，查询时不返回；发布进程崩溃遗留的占位超过 claim_seconds 后可被接管。
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+DEFAULT_LEDGER_PATH = os.path.expanduser("~/.devto_publisher/ledger.db")
+DEFAULT_CLAIM_SECONDS = 600  # 占位的有效期，应远大于一次发布（含重试）的耗时
+PENDING_ID = 0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    key          TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    article_id   INTEGER NOT NULL,
+    url          TEXT,
+    updated_at   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_hash ON articles (content_hash);
+"""
+
+
+def normalize_key(title: str) -> str:
+    """文章标识：默认用规范化后的标题"""
+    return " ".join(title.split()).lower()
+
+
+def content_hash(title: str, content: str, tags: List[str] = None) -> str:
+    """标题 + 正文 + 标签的规范化哈希（忽略首尾空白、行尾空格、换行风格、标签顺序）"""
+    body = "\n".join(line.rstrip() for line in content.strip().splitlines())
+    tag_part = ",".join(sorted(t.strip().lower() for t in (tags or [])))
+    digest = hashlib.sha256()
+    for part in (" ".join(title.split()), body, tag_part):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class Ledger:
+    """SQLite 账本，可在多个线程 / 进程间共享"""
+
+    def __init__(self, path: str = DEFAULT_LEDGER_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _row(self, sql: str, args: tuple) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(sql, args).fetchone()
+        if row is None:
+            return None
+        return {"key": row[0], "content_hash": row[1], "id": row[2], "url": row[3]}
+
+    def find_by_hash(self, digest: str, prefix: str = "") -> Optional[Dict]:
+        """按内容哈希查找（索引查找）；prefix 非空时只查 key 以它开头的记录"""
+        return self._row(
+            "SELECT key, content_hash, article_id, url FROM articles "
+            "WHERE content_hash = ? AND article_id != ? AND substr(key, 1, ?) = ? LIMIT 1",
+            (digest, PENDING_ID, len(prefix), prefix)
+        )
+
+    def find_by_key(self, key: str) -> Optional[Dict]:
+        """按文章标识查找（主键查找）"""
+        return self._row(
+            "SELECT key, content_hash, article_id, url FROM articles WHERE key = ? AND article_id != ?",
+            (key, PENDING_ID)
+        )
+
+    def claim(self, key: str, digest: str, claim_seconds: float = DEFAULT_CLAIM_SECONDS) -> bool:
+        """
+        新文章发布前占位（key 不存在时插入占位行）
+
+        Args:
+            key: 文章标识
+            digest: 内容哈希
+            claim_seconds: 已有占位超过这么久视为遗留，可以接管
+
+        Returns:
+            是否占位成功；False 表示 key 已发布或正由其他线程 / 进程发布
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO articles (key, content_hash, article_id, url, updated_at) "
+                "VALUES (?, ?, ?, NULL, ?) ON CONFLICT(key) DO NOTHING",
+                (key, digest, PENDING_ID, now)
+            )
+            if cursor.rowcount:
+                return True
+            cursor = self._conn.execute(
+                "UPDATE articles SET content_hash = ?, updated_at = ? "
+                "WHERE key = ? AND article_id = ? AND updated_at < ?",
+                (digest, now, key, PENDING_ID, now - claim_seconds)
+            )
+            return cursor.rowcount > 0
+
+    def release(self, key: str):
+        """放弃占位（发布确定失败时调用；已记账的行不受影响）"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM articles WHERE key = ? AND article_id = ?", (key, PENDING_ID))
+
+    def record(self, key: str, digest: str, article_id: int, url: str = None):
+        """记录 / 更新一篇文章"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO articles (key, content_hash, article_id, url, updated_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET content_hash = excluded.content_hash, "
+                "article_id = excluded.article_id, url = COALESCE(excluded.url, articles.url), "
+                "updated_at = excluded.updated_at",
+                (key, digest, article_id, url, time.time())
+            )
+
+    def forget(self, key: str):
+        """删除一条记录"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM articles WHERE key = ?", (key,))
+
+    def scoped(self, namespace: str) -> "ScopedLedger":
+        """按命名空间隔离的视图（多个账户共用一个账本文件时，每个账户一个）"""
+        return ScopedLedger(self, namespace)
+
+    def count(self, prefix: str = "") -> int:
+        """已记账的文章数（prefix 非空时只数 key 以它开头的记录）"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM articles WHERE article_id != ? AND substr(key, 1, ?) = ?",
+                (PENDING_ID, len(prefix), prefix)
+            ).fetchone()[0]
+
+    def __len__(self) -> int:
+        return self.count()
+
+
+class ScopedLedger:
+    """
+    Ledger 的命名空间视图：key 自动加上 "<namespace>:" 前缀，按内容哈希查找也只在本空间内
+
+    接口与 Ledger 相同，可直接传给 DevToPublisher；关闭由底层 Ledger 的所有者负责。
+    """
+
+    def __init__(self, ledger: Ledger, namespace: str):
+        self.ledger = ledger
+        self.namespace = namespace
+        self._prefix = f"{namespace}:"
+
+    @property
+    def path(self) -> str:
+        return self.ledger.path
+
+    def _unscoped(self, row: Optional[Dict]) -> Optional[Dict]:
+        if row is not None:
+            row["key"] = row["key"][len(self._prefix):]
+        return row
+
+    def find_by_hash(self, digest: str) -> Optional[Dict]:
+        return self._unscoped(self.ledger.find_by_hash(digest, self._prefix))
+
+    def find_by_key(self, key: str) -> Optional[Dict]:
+        return self._unscoped(self.ledger.find_by_key(self._prefix + key))
+
+    def claim(self, key: str, digest: str, claim_seconds: float = DEFAULT_CLAIM_SECONDS) -> bool:
+        return self.ledger.claim(self._prefix + key, digest, claim_seconds)
+
+    def release(self, key: str):
+        self.ledger.release(self._prefix + key)
+
+    def record(self, key: str, digest: str, article_id: int, url: str = None):
+        self.ledger.record(self._prefix + key, digest, article_id, url)
+
+    def forget(self, key: str):
+        self.ledger.forget(self._prefix + key)
+
+    def close(self):
+        pass
+
+    def __len__(self) -> int:
+        return self.ledger.count(self._prefix)
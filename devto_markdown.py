@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Markdown 预处理（发布前自动转换）
+
+去掉全文的公共缩进（来自三引号字符串，与 textwrap.dedent 相同）后逐行扫描：
+- 去掉首尾空行
+- 独占一行的 YouTube / Twitter 等链接转成 Dev.to 的 {% embed %} 标签；GitHub 只转换仓库首页
+  （github.com/用户/仓库）和 gist，文件、issue 等其他 GitHub 链接原样保留
+- 没有语言标注的代码块补上默认语言
+- 修复表格（补齐首尾竖线、单元格数量和分隔行；行内代码里的竖线不算分隔）
+
+- 可选：注入 front matter
+
+代码块（``` 围栏和四格缩进）里的内容原样保留。
+
+结果按内容哈希缓存，批量发布时同一正文只处理一次。
+"""
+
+import hashlib
+import re
+import textwrap
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List, Optional
+
+DEFAULT_CODE_LANGUAGE = "text"
+MAX_CACHE_ENTRIES = 1024
+MAX_CACHE_CHARS = 32 * 1024 * 1024
+
+_FENCE = re.compile(r"^(\s*)(`{3,}|~{3,})(.*)$")
+_EMBED_URL = re.compile(
+    r"^\s*<?(https?://(?:www\.)?"
+    r"(?:youtube\.com/watch\S*|youtu\.be/\S+|github\.com/[\w.-]+/[\w.-]+/?|gist\.github\.com/\S+|"
+    r"twitter\.com/\S+/status/\S+|x\.com/\S+/status/\S+|codepen\.io/\S+|codesandbox\.io/\S+|"
+    r"stackblitz\.com/\S+|dev\.to/\S+))>?\s*$"
+)
+_TABLE_ROW = re.compile(r"^\s*\|")
+_INDENTED_CODE = re.compile(r"^(?: {4}|\t)")
+_LIST_ITEM = re.compile(r"^\s*(?:[-*+]|\d+[.)])(?:\s|$)")
+_SEPARATOR_CELL = re.compile(r"^:?-+:?$")
+_FRONT_MATTER_START = re.compile(r"\A---\s*$")
+
+_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_cache_chars = 0
+_cache_lock = threading.Lock()
+
+
+def _split_cells(row: str) -> List[str]:
+    """按竖线拆分单元格，跳过转义的竖线和行内代码（`x|y`）里的竖线"""
+    row = row.strip()
+    if row.startswith("|"):
+        row = row[1:]
+    cells, start, i = [], 0, 0
+    while i < len(row):
+        char = row[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "`":
+            ticks = row[i:len(row) - len(row[i:].lstrip("`"))]
+            run = len(ticks)
+            # 找到等长的闭合反引号才算行内代码，否则按普通字符处理
+            close = re.search(r"(?<!`)" + ticks + r"(?!`)", row[i + run:])
+            i += run + (close.end() if close else 0)
+            continue
+        if char == "|":
+            cells.append(row[start:i])
+            start = i + 1
+        i += 1
+    tail = row[start:]
+    if tail.strip() or not cells:
+        cells.append(tail)
+    return [cell.strip() for cell in cells]
+
+
+def _repair_table(rows: List[str]) -> List[str]:
+    """统一表格格式：首尾竖线、列数、分隔行"""
+    if len(rows) < 2:
+        return rows
+    cells = [_split_cells(row) for row in rows]
+    has_separator = all(_SEPARATOR_CELL.match(c) for c in cells[1] if c) and any(cells[1])
+    if not has_separator:
+        cells.insert(1, ["---"] * len(cells[0]))
+    width = max(len(row) for row in cells)
+    repaired = []
+    for i, row in enumerate(cells):
+        if i == 1:
+            row = [c if _SEPARATOR_CELL.match(c) else "---" for c in row]
+            row += ["---"] * (width - len(row))
+        else:
+            row += [""] * (width - len(row))
+        repaired.append("| " + " | ".join(row) + " |")
+    return repaired
+
+
+def _normalize_lines(lines: Iterable[str], default_language: str, embeds: bool) -> Iterator[str]:
+    """逐行处理，产出规范化后的行（不含换行符）"""
+    fence = None  # 当前代码块的起始标记
+    indented_code = False  # 是否在四格缩进的代码块中
+    in_list = False
+    table: List[str] = []
+    pending_blank = 0
+    started = False
+    previous_blank = True
+
+    for line in lines:
+        line = line.rstrip("\r\n")
+        blank = not line.strip()
+        if blank:
+            line = ""
+
+        if fence is None:
+            # 缩进代码块：空行（或开头）之后、不在列表中的四格缩进行，直到遇到非缩进的非空行
+            if indented_code:
+                indented_code = blank or bool(_INDENTED_CODE.match(line))
+            elif not blank and previous_blank and not in_list and not table and _INDENTED_CODE.match(line):
+                indented_code = True
+            if not blank and not indented_code:
+                if _LIST_ITEM.match(line):
+                    in_list = True
+                elif not line[0].isspace():
+                    in_list = False
+
+        if indented_code:
+            if table:
+                yield from _repair_table(table)
+                table = []
+        elif fence is None:
+            if table and not _TABLE_ROW.match(line):
+                yield from _repair_table(table)
+                table = []
+
+            match = _FENCE.match(line)
+            if match:
+                lead, marker, info = match.groups()
+                fence = marker
+                if not info.strip() and default_language:
+                    line = f"{lead}{marker}{default_language}"
+            elif _TABLE_ROW.match(line):
+                if not table:
+                    for _ in range(pending_blank):
+                        yield ""
+                    pending_blank = 0
+                    started = True
+                table.append(line)
+                previous_blank = False
+                continue
+            elif embeds:
+                url = _EMBED_URL.match(line)
+                if url:
+                    line = "{% embed " + url.group(1) + " %}"
+        else:
+            stripped = line.strip()
+            if stripped.startswith(fence[0] * len(fence)) and not stripped.strip(fence[0]):
+                fence = None
+        previous_blank = blank
+
+        # 去掉开头和结尾的空行，中间的空行原样保留
+        if not line:
+            if started:
+                pending_blank += 1
+            continue
+        started = True
+        for _ in range(pending_blank):
+            yield ""
+        pending_blank = 0
+        yield line
+
+    if table:
+        yield from _repair_table(table)
+
+
+def _front_matter(fields: Dict) -> str:
+    lines = ["---"]
+    for name, value in fields.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            value = ", ".join(value)
+        elif isinstance(value, bool):
+            value = "true" if value else "false"
+        lines.append(f"{name}: {value}")
+    lines.append("---")
+    return "\n".join(lines) + "\n"
+
+
+def normalize_markdown(
+    text: str,
+    default_language: str = DEFAULT_CODE_LANGUAGE,
+    embeds: bool = True,
+    front_matter: Optional[Dict] = None
+) -> str:
+    """
+    规范化 Markdown 正文（结果按内容哈希缓存）
+
+    Args:
+        text: 原始 Markdown
+        default_language: 无语言标注代码块的默认语言（为空则不补）
+        embeds: 是否把独占一行的链接转成 {% embed %}
+        front_matter: 要注入的 front matter 字段（正文已有 front matter 时不注入）
+    """
+    global _cache_chars
+
+    options = (default_language, embeds, repr(sorted(front_matter.items())) if front_matter else None)
+    key = (hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(), options)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None:
+            _cache.move_to_end(key)
+            return cached
+
+    lines = textwrap.dedent(text).splitlines()
+    result = "\n".join(_normalize_lines(lines, default_language, embeds)) + "\n"
+    if front_matter and not _FRONT_MATTER_START.match(result.split("\n", 1)[0]):
+        result = _front_matter(front_matter) + result
+
+    if len(result) <= MAX_CACHE_CHARS // 4:
+        with _cache_lock:
+            if key not in _cache:
+                _cache[key] = result
+                _cache_chars += len(result)
+                while len(_cache) > MAX_CACHE_ENTRIES or _cache_chars > MAX_CACHE_CHARS:
+                    _, evicted = _cache.popitem(last=False)
+                    _cache_chars -= len(evicted)
+    return result
+
+
+def clear_cache():
+    """清空缓存"""
+    global _cache_chars
+    with _cache_lock:
+        _cache.clear()
+        _cache_chars = 0
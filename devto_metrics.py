@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+API 调用指标
+
+记录每个接口的：
+- 延迟直方图（总耗时 / 服务端首字节耗时 / 限流等待 / 重试退避）
+- 状态码计数、网络异常计数、重试次数
+- 请求 / 响应字节数
+
+导出方式：snapshot() 返回字典；to_prometheus() / write_prometheus() 输出
+Prometheus 文本格式（可配合 node_exporter 的 textfile collector）。
+
+未启用时 DevToPublisher 只做一次 `is None` 判断，几乎没有开销。
+"""
+
+import bisect
+import os
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, Tuple
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PHASES = ("total", "server", "limiter_wait", "backoff")
+
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_label(method: str, path: str) -> str:
+    """把 /articles/123 归一成 /articles/{id}，避免标签基数爆炸"""
+    return f"{method} {_NUMERIC_SEGMENT.sub('/{id}', path)}"
+
+
+class Histogram:
+    """固定桶直方图"""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """按桶上界估算分位数"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, n in zip(self.buckets, self.counts):
+            seen += n
+            if seen >= target:
+                return bound
+        return float("inf")
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([str(b) for b in self.buckets] + ["+Inf"], self.counts)),
+        }
+
+
+class Metrics:
+    """线程安全的指标收集器"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._latency: Dict[Tuple[str, str], Histogram] = {}
+        self._status: Dict[Tuple[str, int], int] = defaultdict(int)
+        self._errors: Dict[Tuple[str, str], int] = defaultdict(int)
+        self._retries: Dict[str, int] = defaultdict(int)
+        self._bytes_out: Dict[str, int] = defaultdict(int)
+        self._bytes_in: Dict[str, int] = defaultdict(int)
+
+    def _observe(self, endpoint: str, phase: str, seconds: float):
+        key = (endpoint, phase)
+        histogram = self._latency.get(key)
+        if histogram is None:
+            histogram = self._latency[key] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    def observe_response(
+        self,
+        endpoint: str,
+        status: int,
+        total: float,
+        server: float,
+        bytes_out: int,
+        bytes_in: int
+    ):
+        """记录一次完成的 HTTP 往返"""
+        with self._lock:
+            self._observe(endpoint, "total", total)
+            self._observe(endpoint, "server", server)
+            self._status[(endpoint, status)] += 1
+            self._bytes_out[endpoint] += bytes_out
+            self._bytes_in[endpoint] += bytes_in
+
+    def observe_error(self, endpoint: str, error: str, total: float):
+        """记录网络异常（超时、连接失败等）"""
+        with self._lock:
+            self._observe(endpoint, "total", total)
+            self._errors[(endpoint, error)] += 1
+
+    def observe_wait(self, endpoint: str, phase: str, seconds: float):
+        """记录限流等待或重试退避"""
+        with self._lock:
+            self._observe(endpoint, phase, seconds)
+
+    def observe_retry(self, endpoint: str):
+        with self._lock:
+            self._retries[endpoint] += 1
+
+    def reset(self):
+        with self._lock:
+            self._latency.clear()
+            self._status.clear()
+            self._errors.clear()
+            self._retries.clear()
+            self._bytes_out.clear()
+            self._bytes_in.clear()
+
+    def snapshot(self) -> Dict:
+        """当前指标快照（按接口分组）"""
+        with self._lock:
+            endpoints = defaultdict(lambda: {
+                "latency": {}, "status": {}, "errors": {}, "retries": 0, "bytes_out": 0, "bytes_in": 0
+            })
+            for (endpoint, phase), histogram in self._latency.items():
+                endpoints[endpoint]["latency"][phase] = histogram.to_dict()
+            for (endpoint, status), n in self._status.items():
+                endpoints[endpoint]["status"][str(status)] = n
+            for (endpoint, error), n in self._errors.items():
+                endpoints[endpoint]["errors"][error] = n
+            for endpoint, n in self._retries.items():
+                endpoints[endpoint]["retries"] = n
+            for endpoint, n in self._bytes_out.items():
+                endpoints[endpoint]["bytes_out"] = n
+            for endpoint, n in self._bytes_in.items():
+                endpoints[endpoint]["bytes_in"] = n
+            return dict(endpoints)
+
+    def to_prometheus(self, prefix: str = "devto") -> str:
+        """Prometheus 文本格式"""
+        lines = []
+        with self._lock:
+            lines.append(f"# HELP {prefix}_request_duration_seconds API request latency by phase")
+            lines.append(f"# TYPE {prefix}_request_duration_seconds histogram")
+            for (endpoint, phase), h in sorted(self._latency.items()):
+                labels = f'endpoint="{endpoint}",phase="{phase}"'
+                cumulative = 0
+                for bound, n in zip(h.buckets, h.counts):
+                    cumulative += n
+                    lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="+Inf"}} {h.count}')
+                lines.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {h.sum}")
+                lines.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {h.count}")
+
+            lines.append(f"# TYPE {prefix}_responses_total counter")
+            for (endpoint, status), n in sorted(self._status.items()):
+                lines.append(f'{prefix}_responses_total{{endpoint="{endpoint}",code="{status}"}} {n}')
+            lines.append(f"# TYPE {prefix}_errors_total counter")
+            for (endpoint, error), n in sorted(self._errors.items()):
+                lines.append(f'{prefix}_errors_total{{endpoint="{endpoint}",error="{error}"}} {n}')
+            lines.append(f"# TYPE {prefix}_retries_total counter")
+            for endpoint, n in sorted(self._retries.items()):
+                lines.append(f'{prefix}_retries_total{{endpoint="{endpoint}"}} {n}')
+            lines.append(f"# TYPE {prefix}_bytes_total counter")
+            for endpoint, n in sorted(self._bytes_out.items()):
+                lines.append(f'{prefix}_bytes_total{{endpoint="{endpoint}",direction="out"}} {n}')
+            for endpoint, n in sorted(self._bytes_in.items()):
+                lines.append(f'{prefix}_bytes_total{{endpoint="{endpoint}",direction="in"}} {n}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str, prefix: str = "devto"):
+        """原子写入 Prometheus 文本文件"""
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus(prefix))
+        os.replace(tmp, path)
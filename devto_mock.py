@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+本地 Dev.to 模拟服务
+
+实现 DevToPublisher 用到的接口，用于离线测试和基准测试：
+- GET  /me
+- POST /articles
+- PUT  /articles/{id}
+- GET  /articles/me?page=&per_page=
+- GET  /articles?username=&page=&per_page=
+
+支持注入延迟、5xx 错误和 429 限流；GET 响应带 ETag，可用于测试条件请求。
+
+用法：
+    python devto_mock.py --port 8000 --latency 0.05 --error-rate 0.01 --rate-limit-rate 0.02
+    DevToPublisher(api_key="test", api_base="http://127.0.0.1:8000")
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+from urllib.parse import parse_qs, urlparse
+
+MOCK_USERNAME = "mock_user"
+
+
+class MockState:
+    """模拟服务的内存数据与故障注入配置"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: int = None
+    ):
+        """
+        Args:
+            latency: 每个请求的基础延迟（秒）
+            jitter: 额外随机延迟上限（秒）
+            error_rate: 返回 503 的概率
+            rate_limit_rate: 返回 429 的概率
+            retry_after: 429 响应中的 Retry-After（秒）
+            seed: 随机种子（便于复现）
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.articles: Dict[int, Dict] = {}
+        self.next_id = 1
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def create(self, fields: Dict) -> Dict:
+        with self.lock:
+            article_id = self.next_id
+            self.next_id += 1
+            article = self._build(article_id, fields)
+            self.articles[article_id] = article
+            return article
+
+    def update(self, article_id: int, fields: Dict) -> Dict:
+        with self.lock:
+            if article_id not in self.articles:
+                return None
+            article = self.articles[article_id]
+            merged = {
+                "title": fields.get("title", article["title"]),
+                "body_markdown": fields.get("body_markdown", article["body_markdown"]),
+                "published": fields.get("published", article["published"]),
+                "tags": fields.get("tags", article["tag_list"]),
+                "description": fields.get("description", article["description"]),
+                "canonical_url": fields.get("canonical_url", article["canonical_url"]),
+            }
+            article = self._build(article_id, merged)
+            self.articles[article_id] = article
+            return article
+
+    def page(self, page: int, per_page: int):
+        with self.lock:
+            ids = sorted(self.articles, reverse=True)
+            start = (page - 1) * per_page
+            return [self.articles[i] for i in ids[start:start + per_page]]
+
+    @staticmethod
+    def _build(article_id: int, fields: Dict) -> Dict:
+        slug = "-".join(str(fields.get("title", "")).lower().split())[:60] or "untitled"
+        return {
+            "type_of": "article",
+            "id": article_id,
+            "title": fields.get("title", ""),
+            "description": fields.get("description") or "",
+            "body_markdown": fields.get("body_markdown", ""),
+            "published": bool(fields.get("published", False)),
+            "tag_list": list(fields.get("tags") or []),
+            "canonical_url": fields.get("canonical_url"),
+            "url": f"https://dev.to/{MOCK_USERNAME}/{slug}-{article_id}",
+            "page_views_count": 0,
+            "public_reactions_count": 0,
+            "comments_count": 0,
+            "published_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "user": {"username": MOCK_USERNAME, "name": "Mock User"},
+        }
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """模拟 Dev.to API 的请求处理器"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    state: MockState = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, payload=None, headers: Dict = None):
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, str(value))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_cacheable(self, payload):
+        """带 ETag 的 200 响应，If-None-Match 命中时返回 304"""
+        body = json.dumps(payload).encode("utf-8")
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> Dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return {}
+
+    def _inject(self) -> bool:
+        """模拟延迟与故障，已返回响应时为 True"""
+        state = self.state
+        with state.lock:
+            state.requests += 1
+            roll = state.random.random()
+            delay = state.latency + (state.random.uniform(0, state.jitter) if state.jitter else 0)
+        if delay:
+            time.sleep(delay)
+        if roll < state.rate_limit_rate:
+            self._send(429, {"error": "Rate limit reached", "status": 429},
+                       {"Retry-After": state.retry_after})
+            return True
+        if roll < state.rate_limit_rate + state.error_rate:
+            self._send(503, {"error": "Service unavailable", "status": 503})
+            return True
+        return False
+
+    def _authorized(self) -> bool:
+        if self.headers.get("api-key"):
+            return True
+        self._send(401, {"error": "unauthorized", "status": 401})
+        return False
+
+    def do_GET(self):
+        self._read_json()  # 读完请求体，保持 keep-alive 连接可复用
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if self._inject():
+            return
+        page = int(query.get("page", ["1"])[0])
+        per_page = int(query.get("per_page", ["30"])[0])
+
+        if url.path == "/me":
+            if self._authorized():
+                self._send_cacheable({"id": 1, "username": MOCK_USERNAME, "name": "Mock User"})
+        elif url.path == "/articles/me":
+            if self._authorized():
+                self._send_cacheable(self.state.page(page, per_page))
+        elif url.path == "/articles":
+            username = query.get("username", [None])[0]
+            articles = self.state.page(page, per_page) if username == MOCK_USERNAME else []
+            self._send_cacheable(articles)
+        else:
+            self._send(404, {"error": "not found", "status": 404})
+
+    def do_POST(self):
+        data = self._read_json()
+        if self._inject():
+            return
+        if urlparse(self.path).path != "/articles":
+            self._send(404, {"error": "not found", "status": 404})
+            return
+        if not self._authorized():
+            return
+        fields = data.get("article") or {}
+        if not fields.get("title"):
+            self._send(422, {"error": "Title can't be blank", "status": 422})
+            return
+        # DevToPublisher.publish_article 读取的是 {"article": {...}}
+        self._send(201, {"article": self.state.create(fields)})
+
+    def do_PUT(self):
+        data = self._read_json()
+        if self._inject():
+            return
+        parts = urlparse(self.path).path.strip("/").split("/")
+        if len(parts) != 2 or parts[0] != "articles" or not parts[1].isdigit():
+            self._send(404, {"error": "not found", "status": 404})
+            return
+        if not self._authorized():
+            return
+        article = self.state.update(int(parts[1]), data.get("article") or {})
+        if article is None:
+            self._send(404, {"error": "not found", "status": 404})
+        else:
+            self._send(200, article)
+
+
+class MockServer:
+    """在后台线程运行的模拟服务"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, **state_options):
+        self.state = MockState(**state_options)
+        handler = type("BoundMockHandler", (MockHandler,), {"state": self.state})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="本地 Dev.to 模拟服务")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="基础延迟（秒）")
+    parser.add_argument("--jitter", type=float, default=0.0, help="随机附加延迟上限（秒）")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 概率")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 概率")
+    parser.add_argument("--retry-after", type=int, default=1, help="429 的 Retry-After（秒）")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = MockServer(
+        args.host, args.port,
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate, retry_after=args.retry_after, seed=args.seed
+    )
+    print(f"🧪 Dev.to 模拟服务：{server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
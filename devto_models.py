@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+紧凑的文章 / 发布结果记录
+
+Dev.to 列表接口每篇文章返回几十个字段（含嵌套的 user / organization），
+对账时在内存里放几万篇，字典开销远大于实际用到的数据。
+这里用 __slots__ 只保留用到的字段：
+
+- Article：id、标题、链接、发布状态、标签、三项计数等；正文和原始 JSON 需显式保留
+- PublishResult：status / id / url / title / elapsed，其余少见字段放在 extra
+
+两者都支持 record["field"] / record.get("field")，并接受 API 原字段名
+（page_views_count、tag_list 等），已有按字典读取的代码可以直接使用。
+"""
+
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# API 字段名 -> Article 属性
+ARTICLE_ALIASES = {
+    "tag_list": "tags",
+    "page_views_count": "views",
+    "public_reactions_count": "reactions",
+    "positive_reactions_count": "reactions",
+    "comments_count": "comments",
+}
+
+_MISSING = object()
+
+
+def _tag_tuple(value) -> Tuple[str, ...]:
+    """tag_list 可能是列表或逗号分隔字符串；标签高度重复，驻留后共享同一对象"""
+    if not value:
+        return ()
+    if isinstance(value, str):
+        value = value.split(",")
+    return tuple(sys.intern(t.strip()) for t in value if t and t.strip())
+
+
+class Article:
+    """一篇已发布文章的紧凑表示"""
+
+    __slots__ = (
+        "id", "title", "url", "published", "published_at", "tags",
+        "views", "reactions", "comments", "canonical_url", "description",
+        "body_markdown", "raw",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        title: str,
+        url: str = None,
+        published: bool = True,
+        published_at: str = None,
+        tags: Tuple[str, ...] = (),
+        views: int = 0,
+        reactions: int = 0,
+        comments: int = 0,
+        canonical_url: str = None,
+        description: str = None,
+        body_markdown: str = None,
+        raw: Dict = None
+    ):
+        self.id = id
+        self.title = title
+        self.url = url
+        self.published = published
+        self.published_at = published_at
+        self.tags = tags
+        self.views = views
+        self.reactions = reactions
+        self.comments = comments
+        self.canonical_url = canonical_url
+        self.description = description
+        self.body_markdown = body_markdown
+        self.raw = raw
+
+    @classmethod
+    def from_api(cls, data: Dict, body: bool = False, raw: bool = False) -> "Article":
+        """
+        从 API 返回的文章 JSON 构造
+
+        Args:
+            data: /articles 或 /articles/me 中的一项
+            body: 是否保留 body_markdown（正文通常是最大的字段）
+            raw: 是否保留原始字典（需要未收录字段时的退路）
+        """
+        published_at = data.get("published_at")
+        return cls(
+            data["id"],
+            data.get("title"),
+            data.get("url"),
+            data.get("published", published_at is not None),
+            published_at,
+            _tag_tuple(data.get("tag_list", data.get("tags"))),
+            data.get("page_views_count") or 0,
+            data.get("public_reactions_count", data.get("positive_reactions_count")) or 0,
+            data.get("comments_count") or 0,
+            data.get("canonical_url"),
+            data.get("description"),
+            data.get("body_markdown") if body else None,
+            data if raw else None,
+        )
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """按属性名或 API 字段名读取；未收录的字段从 raw 中查找"""
+        attr = ARTICLE_ALIASES.get(name, name)
+        if attr in self.__slots__ and attr != "raw":
+            value = getattr(self, attr)
+            return default if value is None else value
+        if self.raw is not None:
+            return self.raw.get(name, default)
+        return default
+
+    def __getitem__(self, name: str) -> Any:
+        value = self.get(name, _MISSING)
+        if value is _MISSING:
+            raise KeyError(name)
+        return value
+
+    def to_dict(self) -> Dict:
+        """导出为字典（不含 raw）"""
+        data = {attr: getattr(self, attr) for attr in self.__slots__ if attr != "raw"}
+        data["tags"] = list(self.tags)
+        if data["body_markdown"] is None:
+            del data["body_markdown"]
+        return data
+
+    def __repr__(self) -> str:
+        return f"Article(id={self.id!r}, title={self.title!r})"
+
+
+class PublishResult:
+    """一次发布 / 更新的结果"""
+
+    __slots__ = ("status", "id", "url", "title", "elapsed", "extra")
+
+    def __init__(
+        self,
+        status: str,
+        id: int = None,
+        url: str = None,
+        title: str = None,
+        elapsed: float = None,
+        extra: Dict = None
+    ):
+        self.status = status
+        self.id = id
+        self.url = url
+        self.title = title
+        self.elapsed = elapsed
+        self.extra = extra or None
+
+    @classmethod
+    def from_dict(cls, result: Dict) -> "PublishResult":
+        """从 publish_article / update_article 返回的字典构造"""
+        extra = {k: v for k, v in result.items() if k not in cls.__slots__}
+        # 旧接口缺 API Key 时返回 {"error": ...}
+        status = result.get("status") or ("error" if "error" in result else None)
+        return cls(status, result.get("id"), result.get("url"), result.get("title"), result.get("elapsed"), extra)
+
+    @property
+    def ok(self) -> bool:
+        return self.status in ("success", "updated", "skipped")
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if name in self.__slots__ and name != "extra":
+            value = getattr(self, name)
+            return default if value is None else value
+        if self.extra is not None:
+            return self.extra.get(name, default)
+        return default
+
+    def __getitem__(self, name: str) -> Any:
+        value = self.get(name, _MISSING)
+        if value is _MISSING:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name, _MISSING) is not _MISSING
+
+    def to_dict(self) -> Dict:
+        """还原为字典（省略空字段）"""
+        data = {k: getattr(self, k) for k in ("status", "id", "url", "title", "elapsed") if getattr(self, k) is not None}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __repr__(self) -> str:
+        return f"PublishResult(status={self.status!r}, id={self.id!r}, title={self.title!r})"
+
+
+def to_articles(items: Iterable[Dict], body: bool = False, raw: bool = False) -> List[Article]:
+    """批量转换 API 返回的文章列表"""
+    return [Article.from_api(item, body, raw) for item in items]
+
+
+def to_results(results: Iterable[Optional[Dict]]) -> List[Optional[PublishResult]]:
+    """批量转换发布结果（None 保持为 None）"""
+    return [None if r is None else PublishResult.from_dict(r) for r in results]
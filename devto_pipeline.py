@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+两段式批量发布流水线
+
+    文件 / 文章字典 ──> [进程池：读文件、解析、规范化 Markdown、校验、哈希]
+                    ──> 有界队列 ──> [网络线程：账本 / 去重检查、HTTP 请求]
+
+- 准备阶段在多个进程中并行，按 chunksize 篇一批提交，降低进程间通信开销
+- 已准备好但尚未发布的批次数有上限（max_pending），网络阶段跟不上时准备阶段自动停下，
+  内存占用与批量大小无关
+- 网络阶段复用 DevToPublisher 的连接池、限流、熔断和账本
+
+    python devto_pipeline.py articles/*.md --processes 16 --workers 8
+    python devto_pipeline.py articles/*.md --dry-run   # 只跑准备阶段
+
+准备阶段不支持 tagger（推荐器的索引不在子进程里），未指定标签的文章使用默认标签。
+
+文件的账本 key 与 devto_sync 相同：相对 root 的路径（默认为所有输入文件的共同上级目录，
+不同目录下的同名文件 key 不同）。用 --root 指定同步目录后，同一个文件无论走 sync
+还是流水线都对应账本中的同一篇文章。
+"""
+
+import argparse
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Union
+
+DEFAULT_CHUNKSIZE = 32
+DEFAULT_WORKERS = 4
+
+
+def prepare_item(
+    item: Union[str, Dict],
+    normalize: bool = True,
+    published: bool = None,
+    root: str = None
+) -> Dict:
+    """
+    准备一篇文章：路径则读取并解析文件，字典则直接使用
+
+    Args:
+        item: Markdown 文件路径或文章字典
+        normalize: 是否规范化 Markdown 正文
+        published: 不为 None 时覆盖发布状态
+        root: 文件 key 的基准目录（默认为文件所在目录；批量处理时用 common_root() 求共同上级目录）
+    """
+    from devto_publisher import prepare_payload
+
+    if isinstance(item, str):
+        from devto_sync import file_key, parse_markdown
+        with open(item, "r", encoding="utf-8") as f:
+            article = parse_markdown(f.read(), os.path.splitext(os.path.basename(item))[0])
+        article.setdefault("key", file_key(item, root or os.path.dirname(item) or os.curdir))
+    else:
+        article = item
+    return prepare_payload(
+        article["title"],
+        article["content"],
+        article.get("tags") or None,
+        article.get("published", True) if published is None else published,
+        article.get("canonical_url"),
+        article.get("description"),
+        article.get("key"),
+        normalize=normalize
+    )
+
+
+def common_root(items: Iterable[Union[str, Dict]]) -> str:
+    """所有文件路径的共同上级目录（没有文件路径时为当前目录）"""
+    directories = [os.path.dirname(os.path.abspath(item)) for item in items if isinstance(item, str)]
+    if not directories:
+        return os.curdir
+    try:
+        return os.path.commonpath(directories)
+    except ValueError:  # Windows 下跨盘符
+        return os.curdir
+
+
+def _prepare_chunk(items: List[Union[str, Dict]], normalize: bool, published: bool, root: str) -> List[Dict]:
+    """子进程入口：准备一批文章，单篇失败不影响同批其他文章"""
+    payloads = []
+    for item in items:
+        try:
+            payloads.append(prepare_item(item, normalize, published, root))
+        except Exception as e:
+            payloads.append({"result": {"status": "error", "message": f"{type(e).__name__}: {e}"}})
+    return payloads
+
+
+def _dry_run(payload: Dict) -> Dict:
+    if "result" in payload:
+        return payload["result"]
+    return {"status": "dry_run", "key": payload["key"], "title": payload["fields"]["title"], "digest": payload["digest"]}
+
+
+def run_pipeline(
+    publisher,
+    items: Iterable[Union[str, Dict]],
+    processes: int = None,
+    workers: int = DEFAULT_WORKERS,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    max_pending: int = None,
+    normalize: bool = True,
+    published: bool = None,
+    root: str = None
+) -> Dict:
+    """
+    用进程池准备、线程发布一批文章
+
+    Args:
+        publisher: DevToPublisher 实例（None 表示只跑准备阶段）
+        items: Markdown 文件路径或文章字典
+        processes: 准备阶段进程数（默认 CPU 核数）
+        workers: 网络阶段线程数
+        chunksize: 每次提交给子进程的文章数
+        max_pending: 已提交但未发布完的批次上限（默认 processes * 2 + workers）
+        normalize: 是否规范化 Markdown 正文
+        published: 覆盖所有文章的发布状态（None 表示按文章自身）
+        root: 文件 key 的基准目录（默认为所有文件的共同上级目录；与 sync_directory 的目录一致时共用账本记录）
+
+    Returns:
+        {"results": 与输入顺序一致的结果列表, "stats": 各阶段耗时统计}
+    """
+    processes = processes or os.cpu_count() or 1
+    workers = max(1, workers)
+    max_pending = max_pending or processes * 2 + workers
+    publish = publisher.publish_prepared if publisher is not None else _dry_run
+    if root is None:
+        # key 要相对所有文件的共同上级目录，需要先看到全部输入
+        items = list(items)
+        root = common_root(items)
+
+    results: List[Dict] = []
+    ready: "queue.Queue" = queue.Queue()
+    slots = threading.BoundedSemaphore(max_pending)
+    stats = {"items": 0, "chunks": 0, "network_idle": 0.0, "producer_blocked": 0.0}
+    stats_lock = threading.Lock()
+
+    def network_worker():
+        while True:
+            waited = time.perf_counter()
+            entry = ready.get()
+            idle = time.perf_counter() - waited
+            if entry is None:
+                return
+            start, future = entry
+            with stats_lock:
+                stats["network_idle"] += idle
+            try:
+                payloads = future.result()
+            except Exception as e:  # 子进程崩溃等
+                payloads = [{"result": {"status": "error", "message": str(e)}}] * chunk_sizes[start]
+            for offset, payload in enumerate(payloads):
+                try:
+                    results[start + offset] = publish(payload)
+                except Exception as e:
+                    results[start + offset] = {"status": "error", "message": str(e)}
+            slots.release()
+
+    chunk_sizes: Dict[int, int] = {}
+    threads = [threading.Thread(target=network_worker, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+
+    started = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            chunk: List = []
+            iterator = iter(items)
+            while True:
+                item = next(iterator, None)
+                if item is not None:
+                    chunk.append(item)
+                if chunk and (len(chunk) >= chunksize or item is None):
+                    blocked = time.perf_counter()
+                    slots.acquire()  # 背压：网络阶段积压时在这里等待
+                    stats["producer_blocked"] += time.perf_counter() - blocked
+                    start = len(results)
+                    results.extend([None] * len(chunk))
+                    chunk_sizes[start] = len(chunk)
+                    future = pool.submit(_prepare_chunk, chunk, normalize, published, root)
+                    # 完成后才放进队列，网络线程拿到的都是已准备好的批次
+                    future.add_done_callback(lambda f, start=start: ready.put((start, f)))
+                    stats["items"] += len(chunk)
+                    stats["chunks"] += 1
+                    chunk = []
+                if item is None:
+                    break
+    finally:
+        # 进程池关闭时所有批次都已准备完、进入队列
+        for _ in threads:
+            ready.put(None)
+        for thread in threads:
+            thread.join()
+
+    stats["elapsed"] = round(time.perf_counter() - started, 3)
+    stats["network_idle"] = round(stats["network_idle"], 3)
+    stats["producer_blocked"] = round(stats["producer_blocked"], 3)
+    return {"results": results, "stats": stats}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="进程池准备 + 单一网络阶段的批量发布")
+    parser.add_argument("files", nargs="+", help="Markdown 文件")
+    parser.add_argument("--processes", type=int, default=None, help="准备阶段进程数（默认 CPU 核数）")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="网络阶段线程数")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--draft", action="store_true", help="以草稿形式发布")
+    parser.add_argument("--root", default=None, help="账本 key 的基准目录（默认为所有文件的共同上级目录）")
+    parser.add_argument("--dry-run", action="store_true", help="只跑准备阶段")
+    args = parser.parse_args()
+
+    published = False if args.draft else None
+    if args.dry_run:
+        outcome = run_pipeline(
+            None, args.files, args.processes, args.workers, args.chunksize, published=published, root=args.root
+        )
+    else:
+        from devto_publisher import DevToPublisher
+        from devto_ledger import Ledger
+        with DevToPublisher(ledger=Ledger(), pool_size=args.workers) as publisher:
+            outcome = run_pipeline(
+                publisher, args.files, args.processes, args.workers, args.chunksize,
+                published=published, root=args.root
+            )
+
+    for path, result in zip(args.files, outcome["results"]):
+        print(json.dumps(dict(result, path=path), ensure_ascii=False))
+    print(json.dumps(outcome["stats"]), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
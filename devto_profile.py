@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+"""
+批量发布的性能剖析（按需开启）
+
+- 分阶段计时：每个阶段（prepare / ledger / dedup / http / index 等，可嵌套）记录
+  墙钟时间、本线程 CPU 时间、网络等待、限流与退避等待，剩余部分记为 other_wait
+  （锁、GIL、线程池排队等）
+- CPU 剖析：cProfile，多线程时每个线程单独采集，报告里合并
+- 内存：tracemalloc 快照（开始、结束、手动 snapshot()，或某阶段每结束 N 次），
+  记录占用最多的代码行和相对上一次快照的增长
+- 报告为键有序的 JSON，可以直接 diff；compare() / `diff` 子命令按阶段对比两份报告
+
+    profiler = Profiler(snapshot_on=("publish_article",), snapshot_every=100)
+    with profiler:
+        with DevToPublisher(profiler=profiler) as publisher:
+            publish_many(publisher, ARTICLES)
+    profiler.write("profile.json")
+
+    python devto_cli.py --profile profile.json publish --collection topics
+    python devto_profile.py diff old.json new.json
+
+开启 CPU 剖析后各阶段的 cpu 时间包含 cProfile 自身的开销，只需要阶段拆分时用 cpu=False。
+异步发布器（devto_async）的协程共享线程，线程 CPU 时间无法按协程拆分，暂不支持。
+"""
+
+import argparse
+import contextlib
+import cProfile
+import datetime
+import json
+import os
+import platform
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+REPORT_VERSION = 1
+DEFAULT_TOP = 30
+DEFAULT_FRAMES = 1
+WAIT_KINDS = ("network", "throttle")
+STAGE_FIELDS = ("wall", "cpu", "network_wait", "throttle_wait", "other_wait")
+
+# 3.12 起 cProfile 基于 sys.monitoring，一个实例即可覆盖所有线程，且同一时刻只能有一个
+_GLOBAL_CPU_PROFILE = sys.version_info >= (3, 12)
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _short_path(filename: str) -> str:
+    """去掉机器相关的路径前缀，方便跨环境对比报告"""
+    marker = "site-packages" + os.sep
+    if marker in filename:
+        return filename.split(marker, 1)[1]
+    if filename.startswith(_PACKAGE_DIR + os.sep):
+        return os.path.relpath(filename, _PACKAGE_DIR)
+    if os.path.isabs(filename):
+        return os.path.join(os.path.basename(os.path.dirname(filename)), os.path.basename(filename))
+    return filename
+
+
+class _Frame:
+    """一次进行中的阶段"""
+
+    __slots__ = ("path", "wall", "cpu", "network", "throttle")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.wall = time.perf_counter()
+        self.cpu = time.thread_time()
+        self.network = 0.0
+        self.throttle = 0.0
+
+
+class Profiler:
+    """阶段计时 + cProfile + tracemalloc，线程安全"""
+
+    def __init__(
+        self,
+        cpu: bool = True,
+        memory: bool = True,
+        top: int = DEFAULT_TOP,
+        frames: int = DEFAULT_FRAMES,
+        snapshot_on: Iterable[str] = (),
+        snapshot_every: int = 0
+    ):
+        """
+        Args:
+            cpu: 是否采集 cProfile
+            memory: 是否用 tracemalloc 采集内存快照
+            top: 报告中保留的函数 / 代码行条数
+            frames: tracemalloc 记录的调用栈深度（越深越慢）
+            snapshot_on: 这些阶段（名称或完整路径）结束时计数
+            snapshot_every: 上述阶段每结束这么多次拍一次内存快照（0 表示不自动拍）
+        """
+        self.cpu = cpu
+        self.memory = memory
+        self.top = top
+        self.frames = frames
+        self.snapshot_on = set(snapshot_on)
+        self.snapshot_every = snapshot_every
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stages: Dict[str, Dict[str, float]] = defaultdict(lambda: dict.fromkeys(("count",) + STAGE_FIELDS, 0))
+        self._exits: Dict[str, int] = defaultdict(int)
+        self._profiles: List[cProfile.Profile] = []
+        self._global_profile: Optional[cProfile.Profile] = None
+        self._owner_profile: Optional[cProfile.Profile] = None
+        self._snapshots: List[Dict] = []
+        self._last_snapshot = None
+        self._started_tracemalloc = False
+        self._started_at = None
+        self._started = None
+        self._elapsed = None
+
+    # --- 开始 / 结束 ---
+
+    def start(self) -> "Profiler":
+        """开始采集（start / stop 需在同一线程调用）"""
+        self._started_at = datetime.datetime.now(datetime.timezone.utc)
+        self._started = time.perf_counter()
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.frames)
+                self._started_tracemalloc = True
+            self.snapshot("start")
+        if self.cpu and _GLOBAL_CPU_PROFILE:
+            self._global_profile = cProfile.Profile()
+            try:
+                self._global_profile.enable()
+            except ValueError:  # 已有其他剖析工具在运行
+                self._global_profile = None
+        elif self.cpu:
+            # 调用 start() 的线程全程采集（阶段之外的准备工作也算在内）
+            self._owner_profile = self._thread_profile()
+            self._owner_profile.enable()
+            self._local.pinned = True
+        return self
+
+    def stop(self):
+        if self._started is None or self._elapsed is not None:
+            return
+        if self._global_profile is not None:
+            self._global_profile.disable()
+            self._profiles.append(self._global_profile)
+            self._global_profile = None
+        if self._owner_profile is not None:
+            self._owner_profile.disable()
+            self._owner_profile = None
+            self._local.pinned = False
+        self._elapsed = time.perf_counter() - self._started
+        if self.memory and tracemalloc.is_tracing():
+            self.snapshot("stop")
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    # --- 阶段 ---
+
+    def _stack(self) -> List[_Frame]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _thread_profile(self) -> Optional[cProfile.Profile]:
+        profile = getattr(self._local, "profile", None)
+        if profile is None:
+            profile = self._local.profile = cProfile.Profile()
+            with self._lock:
+                self._profiles.append(profile)
+        return profile
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """
+        计时一个阶段；嵌套时路径为 "外层/内层"，外层时间包含内层
+
+        Args:
+            name: 阶段名
+        """
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        frame = _Frame(f"{parent.path}/{name}" if parent else name)
+        # 老版本 cProfile 只作用于当前线程：最外层阶段开始时启用，结束时停用
+        profile = None
+        if (
+            not stack and self.cpu and not _GLOBAL_CPU_PROFILE and self._started is not None
+            and self._elapsed is None and not getattr(self._local, "pinned", False)
+        ):
+            profile = self._thread_profile()
+            profile.enable()
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            stack.pop()
+            if profile is not None:
+                profile.disable()
+            wall = time.perf_counter() - frame.wall
+            cpu = time.thread_time() - frame.cpu
+            if parent is not None:
+                parent.network += frame.network
+                parent.throttle += frame.throttle
+            self._record(name, frame, wall, cpu)
+
+    def _record(self, name: str, frame: _Frame, wall: float, cpu: float):
+        snapshot_label = None
+        with self._lock:
+            stats = self._stages[frame.path]
+            stats["count"] += 1
+            stats["wall"] += wall
+            stats["cpu"] += cpu
+            stats["network_wait"] += frame.network
+            stats["throttle_wait"] += frame.throttle
+            stats["other_wait"] += max(0.0, wall - cpu - frame.network - frame.throttle)
+            if self.snapshot_every and (name in self.snapshot_on or frame.path in self.snapshot_on):
+                self._exits[frame.path] += 1
+                count = self._exits[frame.path]
+                if count % self.snapshot_every == 0:
+                    snapshot_label = f"{frame.path}#{count}"
+        if snapshot_label:
+            self.snapshot(snapshot_label)
+
+    @contextlib.contextmanager
+    def wait(self, kind: str):
+        """
+        标记一段等待（"network" 或 "throttle"），计入当前阶段；其中消耗的 CPU 不算等待
+
+        Args:
+            kind: 等待类型
+        """
+        if kind not in WAIT_KINDS:
+            raise ValueError(f"未知的等待类型: {kind}")
+        stack = self._stack()
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield
+        finally:
+            if stack:
+                waited = max(0.0, (time.perf_counter() - wall) - (time.thread_time() - cpu))
+                if kind == "network":
+                    stack[-1].network += waited
+                else:
+                    stack[-1].throttle += waited
+
+    # --- 内存 ---
+
+    def snapshot(self, label: str):
+        """拍一次 tracemalloc 快照（未开启内存采集时忽略）"""
+        if not self.memory or not tracemalloc.is_tracing():
+            return
+        snap = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
+        current, peak = tracemalloc.get_traced_memory()
+        record = {
+            "label": label,
+            "at": round(time.perf_counter() - self._started, 6) if self._started is not None else 0.0,
+            "current": current,
+            "peak": peak,
+            "top": [
+                {"location": self._location(stat.traceback), "size": stat.size, "count": stat.count}
+                for stat in snap.statistics("lineno")[:self.top]
+            ],
+        }
+        with self._lock:
+            if self._last_snapshot is not None:
+                record["growth"] = [
+                    {"location": self._location(stat.traceback), "size_diff": stat.size_diff, "count_diff": stat.count_diff}
+                    for stat in snap.compare_to(self._last_snapshot, "lineno")[:self.top]
+                    if stat.size_diff
+                ]
+            self._last_snapshot = snap
+            self._snapshots.append(record)
+
+    @staticmethod
+    def _location(traceback) -> str:
+        frame = traceback[0]
+        return f"{_short_path(frame.filename)}:{frame.lineno}"
+
+    # --- 报告 ---
+
+    def _cpu_report(self) -> Dict:
+        with self._lock:
+            profiles = list(self._profiles)
+        stats = None
+        for profile in profiles:
+            try:
+                if stats is None:
+                    stats = pstats.Stats(profile)
+                else:
+                    stats.add(profile)
+            except TypeError:  # 从未启用过的 profile 没有数据
+                continue
+        if stats is None:
+            return {"functions": 0, "top_tottime": [], "top_cumtime": []}
+
+        rows = []
+        for (filename, line, func), (_, calls, tottime, cumtime, _) in stats.stats.items():
+            location = func if filename == "~" else f"{_short_path(filename)}:{line}({func})"
+            rows.append({
+                "function": location,
+                "calls": calls,
+                "tottime": round(tottime, 6),
+                "cumtime": round(cumtime, 6),
+            })
+        return {
+            "functions": len(rows),
+            "top_tottime": sorted(rows, key=lambda r: -r["tottime"])[:self.top],
+            "top_cumtime": sorted(rows, key=lambda r: -r["cumtime"])[:self.top],
+        }
+
+    def dump_stats(self, path: str):
+        """合并后的 cProfile 数据写成 .pstats（可用 snakeviz 等工具查看）"""
+        with self._lock:
+            profiles = list(self._profiles)
+        stats = None
+        for profile in profiles:
+            try:
+                stats = pstats.Stats(profile) if stats is None else stats.add(profile)
+            except TypeError:
+                continue
+        if stats is not None:
+            stats.dump_stats(path)
+
+    def report(self) -> Dict:
+        """机器可读的报告（所有时间单位为秒，内存单位为字节）"""
+        with self._lock:
+            stages = {
+                path: dict(
+                    {k: round(v, 6) for k, v in values.items() if k != "count"},
+                    count=values["count"],
+                    wall_mean=round(values["wall"] / values["count"], 6) if values["count"] else 0.0,
+                )
+                for path, values in sorted(self._stages.items())
+            }
+            snapshots = list(self._snapshots)
+
+        # 各线程顶层阶段的合计（多线程时为线程·秒，可能超过 elapsed）：时间都花在哪儿了
+        summary = dict.fromkeys(STAGE_FIELDS, 0.0)
+        for path, values in stages.items():
+            if "/" not in path:
+                for field in STAGE_FIELDS:
+                    summary[field] += values[field]
+        wall = summary["wall"]
+        summary = {k: round(v, 6) for k, v in summary.items()}
+        summary["share"] = {
+            field: round(summary[field] / wall, 4) if wall else 0.0
+            for field in STAGE_FIELDS if field != "wall"
+        }
+
+        elapsed = self._elapsed if self._elapsed is not None else (
+            time.perf_counter() - self._started if self._started is not None else 0.0
+        )
+        report = {
+            "version": REPORT_VERSION,
+            "meta": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "platform": sys.platform,
+                "cpu_count": os.cpu_count(),
+                "started_at": self._started_at.isoformat() if self._started_at else None,
+                "elapsed": round(elapsed, 6),
+            },
+            "summary": summary,
+            "stages": stages,
+        }
+        if self.cpu:
+            report["cpu"] = self._cpu_report()
+        if self.memory:
+            report["memory"] = {
+                "peak": max((s["peak"] for s in snapshots), default=0),
+                "snapshots": snapshots,
+            }
+        return report
+
+    def write(self, path: str) -> Dict:
+        """写出 JSON 报告（键有序，便于 diff）"""
+        report = self.report()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write("\n")
+        os.replace(tmp, path)
+        return report
+
+
+def compare(old: Dict, new: Dict, threshold: float = 0.0) -> List[Dict]:
+    """
+    按阶段对比两份报告
+
+    Args:
+        old: 基线报告
+        new: 新报告
+        threshold: 只保留相对变化超过该比例的项（0 表示全部保留）
+
+    Returns:
+        [{"stage", "field", "old", "new", "change"}]，change 为相对变化（新增 / 消失的阶段为 None）
+    """
+    rows = []
+    old_stages = old.get("stages", {})
+    new_stages = new.get("stages", {})
+    for stage in sorted(set(old_stages) | set(new_stages)):
+        before = old_stages.get(stage)
+        after = new_stages.get(stage)
+        for field in ("count", "wall_mean") + STAGE_FIELDS:
+            a = before.get(field) if before else None
+            b = after.get(field) if after else None
+            if a is None or b is None:
+                change = None
+            elif a:
+                change = round((b - a) / a, 4)
+            else:
+                change = 0.0 if not b else None
+            if change is not None and abs(change) <= threshold:
+                continue
+            rows.append({"stage": stage, "field": field, "old": a, "new": b, "change": change})
+    old_peak = old.get("memory", {}).get("peak")
+    new_peak = new.get("memory", {}).get("peak")
+    if old_peak and new_peak:
+        change = round((new_peak - old_peak) / old_peak, 4)
+        if abs(change) > threshold:
+            rows.append({"stage": "(memory)", "field": "peak", "old": old_peak, "new": new_peak, "change": change})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="性能剖析报告工具")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("diff", help="按阶段对比两份报告（每行一条 JSON）")
+    p.add_argument("old", help="基线报告")
+    p.add_argument("new", help="新报告")
+    p.add_argument("--threshold", type=float, default=0.1, help="忽略相对变化不超过该比例的项")
+
+    p = sub.add_parser("show", help="输出报告的阶段汇总")
+    p.add_argument("report")
+    args = parser.parse_args()
+
+    if args.command == "diff":
+        with open(args.old, "r", encoding="utf-8") as f:
+            old = json.load(f)
+        with open(args.new, "r", encoding="utf-8") as f:
+            new = json.load(f)
+        for row in compare(old, new, args.threshold):
+            print(json.dumps(row, ensure_ascii=False))
+        return
+
+    with open(args.report, "r", encoding="utf-8") as f:
+        report = json.load(f)
+    print(json.dumps({"summary": report["summary"], "meta": report["meta"]}, ensure_ascii=False))
+    for path, values in report["stages"].items():
+        print(json.dumps(dict(values, stage=path), ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
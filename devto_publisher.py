@@ -15,30 +15,456 @@ import sys
 import json
 import time
 import datetime
-from typing import Optional, Dict, List
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Iterator
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+from devto_breaker import CircuitBreakers, CircuitOpenError
+from devto_cache import ResponseCache, identity_of
+from devto_content import load_collection
+from devto_metrics import Metrics, endpoint_label
+from devto_models import Article, to_articles
+from devto_markdown import normalize_markdown
+from devto_ledger import Ledger, content_hash, normalize_key
+from devto_ratelimit import TokenBucket, backoff_delay, parse_retry_after
+from devto_validate import has_errors, invalid_result, validate_article
 
 # 配置
 API_BASE = "https://dev.to/api"
+_NO_PROFILE = contextlib.nullcontext()  # 未开启剖析时的空上下文（可重复使用）
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = (5, 30)  # (连接超时, 读取超时) 秒
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_PER_PAGE = 30
+
+# 可安全重试的请求：幂等方法遇到这些状态码时重试；
+# POST 只在 429（服务端未处理）或连接尚未建立时重试，避免重复发文
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE"}
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+def prepare_article(
+    title: str,
+    content: str,
+    tags: List[str] = None,
+    published: bool = True,
+    canonical_url: str = None,
+    description: str = None,
+    normalize: bool = True,
+    tagger=None
+) -> Dict:
+    """
+    生成发布请求中的 article 字段（同步 / 异步发布器共用）
+    
+    标签最多保留 4 个；未指定时优先用 tagger 推荐，否则使用默认标签。
+    """
+    # 限制标签数量；Dev.to 的标签不区分大小写，统一转为小写
+    if tags and len(tags) > 4:
+        tags = tags[:4]
+    if tags:
+        tags = [t.lower() for t in tags]
+    if not tags and tagger is not None:
+        tags = tagger.suggest(f"{title}\n{content}")
+    
+    fields = {
+        "title": title,
+        "body_markdown": normalize_markdown(content) if normalize else content,
+        "published": published,
+        "tags": tags or ["python", "automation", "ai"],
+    }
+    
+    # 添加可选字段
+    if description:
+        fields["description"] = description
+    if canonical_url:
+        fields["canonical_url"] = canonical_url
+    return fields
+
+
+def prepare_payload(
+    title: str,
+    content: str,
+    tags: List[str] = None,
+    published: bool = True,
+    canonical_url: str = None,
+    description: str = None,
+    key: str = None,
+    normalize: bool = True,
+    tagger=None
+) -> Dict:
+    """
+    发布前的纯 CPU 部分：校验、生成请求字段、计算内容哈希（可在子进程中运行）
+    
+    Returns:
+        {"key", "fields", "digest", "content"}；校验不通过时为 {"result": invalid_result}
+    """
+    # 本地校验不通过的不发请求
+    article = {"title": title, "content": content, "tags": tags, "canonical_url": canonical_url}
+    problems = validate_article(article)
+    if has_errors(problems):
+        return {"result": invalid_result(article, problems)}
+    
+    fields = prepare_article(
+        title, content, tags, published, canonical_url, description,
+        normalize=normalize, tagger=tagger
+    )
+    return {
+        "key": key or normalize_key(title),
+        "fields": fields,
+        "digest": content_hash(title, fields["body_markdown"], fields["tags"]),
+        "content": content,
+    }
+
 
+def _skipped(entry: Dict, title: str) -> Dict:
+    return {"status": "skipped", "url": entry["url"], "id": entry["id"], "title": title}
 
-class DevToPublisher:
+
+class PublishSteps:
+    """
+    发布流程中与网络无关的步骤：账本、近似重复、结果整理（同步 / 异步发布器共用）
+    
+    使用方需要提供 ledger、dedup、dedup_action、search、profiler 属性，
+    自己只负责发出 POST / PUT 请求。
+    """
+    
+    def _stage(self, name: str):
+        """剖析阶段（未开启剖析时为空上下文）"""
+        return _NO_PROFILE if self.profiler is None else self.profiler.stage(name)
+    
+    def _invalidate_listings(self):
+        """发布 / 更新后清除文章列表缓存（有缓存的发布器覆盖）"""
+    
+    def _plan(self, payload: Dict) -> Dict:
+        """
+        发请求前的检查：账本、近似重复、新文章占位
+        
+        Returns:
+            {"result": ...} 表示不用发请求，直接返回该结果；否则为发布计划
+            {"key", "fields", "digest", "text", "entry", "duplicates"}，
+            entry 不为空时更新该文章，否则新建（已占位）
+        """
+        key = payload.get("key")
+        fields = payload["fields"]
+        digest = payload["digest"]
+        title = fields["title"]
+        
+        # 查账本：同一篇文章（按 key）内容未变则跳过；没有 key 时才按内容哈希查
+        entry = None
+        if self.ledger is not None:
+            with self._stage("ledger"):
+                entry = self.ledger.find_by_key(key) if key else self.ledger.find_by_hash(digest)
+            if entry and (entry["content_hash"] == digest or not key):
+                return {"result": _skipped(entry, title)}
+        key = key or normalize_key(title)
+        
+        # 查近似重复（排除同一篇文章的旧版本）
+        text = f"{title}\n{payload['content']}"
+        duplicates = []
+        if self.dedup is not None:
+            with self._stage("dedup"):
+                duplicates = self.dedup.query(text, exclude=key)
+            if duplicates and self.dedup_action == "block":
+                return {"result": {"status": "duplicate", "title": title, "duplicates": duplicates}}
+        
+        # 新文章先占位；占位失败说明其他线程 / 进程刚发布完或正在发布同一篇
+        if self.ledger is not None and entry is None:
+            with self._stage("ledger"):
+                claimed = self.ledger.claim(key, digest)
+                if not claimed:
+                    entry = self.ledger.find_by_key(key)
+            if not claimed:
+                if entry is None:
+                    return {"result": {"status": "pending", "title": title, "message": f"{key} 正由其他进程发布"}}
+                if entry["content_hash"] == digest:
+                    return {"result": _skipped(entry, title)}
+        return {
+            "key": key, "fields": fields, "digest": digest, "text": text,
+            "entry": entry, "duplicates": duplicates,
+        }
+    
+    def _updated(self, plan: Dict, article: Dict) -> Dict:
+        """update_article() 的返回值 -> 发布结果（成功时记账）"""
+        if "id" not in article:
+            if article.get("status") in ("unavailable", "invalid"):
+                return article
+            return {"status": "error", "message": article.get("message", article.get("error", article))}
+        with self._stage("ledger"):
+            self.ledger.record(plan["key"], plan["digest"], article["id"], article.get("url"))
+        result = {
+            "status": "updated",
+            "url": article.get("url", plan["entry"]["url"]),
+            "id": article["id"],
+            "title": plan["fields"]["title"]
+        }
+        if "index_error" in article:
+            result["index_error"] = article["index_error"]
+        return result
+    
+    def _created(self, plan: Dict, response) -> Dict:
+        """POST /articles 的响应 -> 发布结果（先记账，再收录全文索引）"""
+        if response.status_code != 201:
+            self._release(plan["key"])
+            return {
+                "status": "error",
+                "code": response.status_code,
+                "message": response.text
+            }
+        try:
+            article = response.json()["article"]
+        except (ValueError, KeyError, TypeError) as e:
+            # 已经创建成功，只是响应读不出来：保留占位，过期前不会重复发布
+            return {"status": "error", "message": str(e)}
+        self._invalidate_listings()
+        # 先记账：文章已经发布，后续步骤失败也不能让下次重试再发一篇
+        if self.ledger is not None:
+            with self._stage("ledger"):
+                self.ledger.record(plan["key"], plan["digest"], article["id"], article["url"])
+        result = {
+            "status": "success",
+            "url": article["url"],
+            "id": article["id"],
+            "title": article["title"]
+        }
+        return self._index_published(article, result)
+    
+    def _not_sent(self, error: Exception) -> bool:
+        """请求确定没有发出（熔断中），子类补充各自 HTTP 库的连接失败"""
+        return isinstance(error, CircuitOpenError)
+    
+    def _post_failed(self, plan: Dict, error: Exception) -> Dict:
+        """
+        POST /articles 抛出异常 -> 发布结果
+        
+        只有确定请求没有发出时才放弃占位；其他失败（读超时、响应途中断开等）
+        服务端可能已经创建了文章，保留占位直到过期，避免下次重复发布
+        """
+        if self._not_sent(error):
+            self._release(plan["key"])
+        if isinstance(error, CircuitOpenError):
+            return error.result()
+        return {"status": "error", "message": str(error) or type(error).__name__}
+    
+    def _finish(self, plan: Dict, result: Dict) -> Dict:
+        """发布 / 更新成功后收录近似重复索引，并附带发现的近似重复"""
+        if result.get("status") in ("success", "updated"):
+            if self.dedup is not None:
+                with self._stage("index"):
+                    self.dedup.add(plan["key"], plan["text"])
+            if plan["duplicates"]:
+                result["duplicates"] = plan["duplicates"]
+        return result
+    
+    def _index_published(self, article: Dict, result: Dict) -> Dict:
+        """收录到全文索引（尽力而为：失败时在结果中附带 index_error，不影响发布结果）"""
+        if self.search is not None:
+            try:
+                with self._stage("index"):
+                    self.search.add_published(article)
+            except Exception as e:
+                result["index_error"] = str(e)
+        return result
+    
+    def _release(self, key: str):
+        """发布确定失败：放弃账本占位"""
+        if self.ledger is not None:
+            self.ledger.release(key)
+
+
+class DevToPublisher(PublishSteps):
     """Dev.to 发布器"""
     
-    def __init__(self, api_key: str = None):
+    def __init__(
+        self,
+        api_key: str = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: tuple = DEFAULT_TIMEOUT,
+        keep_alive: bool = True,
+        rate_limiter: TokenBucket = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        ledger: Ledger = None,
+        cache: ResponseCache = None,
+        normalize: bool = True,
+        tagger=None,
+        metrics: Metrics = None,
+        dedup=None,
+        dedup_action: str = "flag",
+        breakers: CircuitBreakers = None,
+        search=None,
+        profiler=None,
+        api_base: str = API_BASE
+    ):
+        """
+        Args:
+            api_key: Dev.to API Key（默认读取 DEVTO_API_KEY）
+            pool_size: 连接池大小（并发线程数上限建议与之一致）
+            timeout: (连接超时, 读取超时)，单位秒
+            keep_alive: 是否复用 TCP/TLS 连接
+            rate_limiter: 令牌桶限流器（可在多个实例间共享）
+            max_retries: 可重试失败的最大重试次数
+            ledger: 已发布文章账本（设置后重复内容不再发布）
+            cache: GET 响应缓存（get_user / get_articles）
+            normalize: 发布 / 更新前是否规范化 Markdown 正文
+            tagger: 标签推荐器（devto_tags.TagSuggester），未指定标签时自动生成
+            metrics: 指标收集器（为空时不采集）
+            dedup: 近似重复索引（devto_dedup.DuplicateIndex）
+            dedup_action: 发现近似重复时 "flag"（照常发布并在结果中标注）或 "block"（不发布）
+            breakers: 按接口熔断（devto_breaker.CircuitBreakers），熔断中的调用返回 status == "unavailable"
+            search: 全文检索索引（devto_search.SearchIndex），发布 / 更新成功后自动收录（只在内存中，
+                由调用方 save()）
+            profiler: 性能剖析器（devto_profile.Profiler），按阶段拆分 CPU / 网络等待 / 限流等待
+            api_base: API 地址（测试时可指向本地模拟服务）
+        """
         self.api_key = api_key or os.getenv("DEVTO_API_KEY")
         self.headers = {
             "Content-Type": "application/json",
             "api-key": self.api_key
         }
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or TokenBucket()
+        self.max_retries = max_retries
+        self.ledger = ledger
+        self.cache = cache
+        self.normalize = normalize
+        self.tagger = tagger
+        self.metrics = metrics
+        self.dedup = dedup
+        self.dedup_action = dedup_action
+        self.breakers = breakers
+        self.search = search
+        self.profiler = profiler
+        self.api_base = api_base.rstrip("/")
+        
+        # 所有方法共享同一个 Session，避免每次请求重新握手；
+        # 底层 urllib3 连接池是线程安全的，可在多个工作线程间共享
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def close(self):
+        """关闭连接池"""
+        self.session.close()
+    
+    def _wait(self, kind: str):
+        """剖析中的等待区间（kind 为 "network" 或 "throttle"）"""
+        return _NO_PROFILE if self.profiler is None else self.profiler.wait(kind)
+    
+    def _request(self, method: str, path: str, timeout: tuple = None, **kwargs) -> requests.Response:
+        """
+        通过共享连接池发送请求（熔断 + 限流 + 抖动退避重试）
+        
+        Raises:
+            CircuitOpenError: 该接口熔断中，请求未发出
+        """
+        if self.profiler is None:
+            return self._send(method, path, timeout, **kwargs)
+        with self.profiler.stage("http"):
+            return self._send(method, path, timeout, **kwargs)
+    
+    def _send(self, method: str, path: str, timeout: tuple = None, **kwargs) -> requests.Response:
+        """_request 的实现"""
+        metrics = self.metrics
+        breakers = self.breakers
+        breaker = None
+        if metrics is not None or breakers is not None:
+            endpoint = endpoint_label(method, path)
+        idempotent = method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            if breakers is not None:
+                breaker = breakers.check(endpoint)
+            if metrics is None:
+                with self._wait("throttle"):
+                    self.rate_limiter.acquire()
+            else:
+                waited = time.perf_counter()
+                with self._wait("throttle"):
+                    self.rate_limiter.acquire()
+                metrics.observe_wait(endpoint, "limiter_wait", time.perf_counter() - waited)
+            started = time.perf_counter()
+            try:
+                with self._wait("network"):
+                    response = self.session.request(
+                        method,
+                        f"{self.api_base}{path}",
+                        timeout=timeout or self.timeout,
+                        **kwargs
+                    )
+            except BaseException as e:
+                if breaker is not None:
+                    if isinstance(e, Exception):
+                        breaker.record(True, time.perf_counter() - started)
+                    else:
+                        breaker.release()  # KeyboardInterrupt 等：没有结果，归还半开探测名额
+                if not isinstance(e, (requests.ConnectionError, requests.Timeout)):
+                    raise
+                if metrics is not None:
+                    metrics.observe_error(endpoint, type(e).__name__, time.perf_counter() - started)
+                # 非幂等请求只有在连接都没建立时才能确定服务端未处理
+                retryable = idempotent or isinstance(e, requests.ConnectTimeout)
+                if not retryable or attempt >= self.max_retries:
+                    raise
+                self._backoff(attempt, metrics and endpoint)
+                attempt += 1
+                continue
+            
+            if breaker is not None:
+                breaker.record(response.status_code >= 500, time.perf_counter() - started)
+            if metrics is not None:
+                metrics.observe_response(
+                    endpoint,
+                    response.status_code,
+                    time.perf_counter() - started,
+                    response.elapsed.total_seconds(),
+                    len(response.request.body or b""),
+                    len(response.content)
+                )
+            
+            self.rate_limiter.update_from_headers(response.headers)
+            status = response.status_code
+            if status == 429:
+                self.rate_limiter.penalize(parse_retry_after(response.headers.get("Retry-After")))
+            elif status < 500:
+                self.rate_limiter.reward()
+            
+            retryable = status == 429 or (idempotent and status in RETRY_STATUS)
+            if not retryable or attempt >= self.max_retries:
+                return response
+            self._backoff(attempt, metrics and endpoint)
+            attempt += 1
+    
+    def _backoff(self, attempt: int, endpoint: str = None):
+        """重试前的抖动退避"""
+        delay = backoff_delay(attempt)
+        with self._wait("throttle"):
+            time.sleep(delay)
+        if endpoint:
+            self.metrics.observe_retry(endpoint)
+            self.metrics.observe_wait(endpoint, "backoff", delay)
     
     def get_user(self) -> Dict:
         """获取当前用户信息"""
         if not self.api_key:
             return {"error": "No API key provided"}
         
-        response = requests.get(f"{API_BASE}/me", headers=self.headers)
-        return response.json()
+        try:
+            return self._get_json("/me", headers=self.headers)
+        except CircuitOpenError as e:
+            return e.result()
+        except (requests.RequestException, ValueError) as e:
+            return {"error": str(e)}
     
     def publish_article(
         self,
@@ -47,7 +473,8 @@ class DevToPublisher:
         tags: List[str] = None,
         published: bool = True,
         canonical_url: str = None,
-        description: str = None
+        description: str = None,
+        key: str = None
     ) -> Dict:
         """
         发布文章到 Dev.to
@@ -59,388 +486,255 @@ class DevToPublisher:
             published: 是否立即发布
             canonical_url: 原文链接（用于聚合文章）
             description: 文章描述（SEO）
+            key: 账本中的文章标识（默认为规范化标题）
         """
         if not self.api_key:
             return {"error": "请设置 DEVTO_API_KEY 环境变量"}
         
-        # 限制标签数量
-        if tags and len(tags) > 4:
-            tags = tags[:4]
+        with self._stage("publish_article"):
+            with self._stage("prepare"):
+                payload = prepare_payload(
+                    title, content, tags, published, canonical_url, description, key,
+                    normalize=self.normalize, tagger=self.tagger
+                )
+            return self._publish_prepared(payload)
+    
+    def publish_prepared(self, payload: Dict) -> Dict:
+        """
+        发布 prepare_payload() 生成的请求（只做账本 / 去重检查和网络请求）
         
-        data = {
-            "article": {
-                "title": title,
-                "body_markdown": content,
-                "published": published,
-                "tags": tags or ["python", "automation", "ai"],
-            }
-        }
+        Args:
+            payload: prepare_payload() 的返回值，可以来自子进程
+        """
+        # 与 publish_article() 计入同一个外层阶段，剖析报告的阶段路径和快照计数一致
+        with self._stage("publish_article"):
+            return self._publish_prepared(payload)
+    
+    def _publish_prepared(self, payload: Dict) -> Dict:
+        if "result" in payload:
+            return payload["result"]
+        if not self.api_key:
+            return {"error": "请设置 DEVTO_API_KEY 环境变量"}
         
-        # 添加可选字段
-        if description:
-            data["article"]["description"] = description
-        if canonical_url:
-            data["article"]["canonical_url"] = canonical_url
+        plan = self._plan(payload)
+        if "result" in plan:
+            return plan["result"]
+        if plan["entry"] is not None:
+            article = self.update_article(plan["entry"]["id"], **plan["fields"])
+            return self._finish(plan, self._updated(plan, article))
         
         try:
-            response = requests.post(
-                f"{API_BASE}/articles",
+            response = self._request(
+                "POST",
+                "/articles",
                 headers=self.headers,
-                json=data
+                json={"article": plan["fields"]}
             )
-            
-            if response.status_code == 201:
-                article = response.json()["article"]
-                return {
-                    "status": "success",
-                    "url": article["url"],
-                    "id": article["id"],
-                    "title": article["title"]
-                }
-            else:
-                return {
-                    "status": "error",
-                    "code": response.status_code,
-                    "message": response.text
-                }
         except Exception as e:
-            return {"status": "error", "message": str(e)}
+            return self._post_failed(plan, e)
+        return self._finish(plan, self._created(plan, response))
+    
+    def _not_sent(self, error: Exception) -> bool:
+        """熔断、连接超时或连接被拒绝：请求体还没有发出"""
+        if isinstance(error, (CircuitOpenError, requests.ConnectTimeout)):
+            return True
+        if isinstance(error, requests.ConnectionError):
+            reason = error.args[0] if error.args else None
+            return isinstance(getattr(reason, "reason", reason), NewConnectionError)
+        return False
     
     def update_article(self, article_id: int, **kwargs) -> Dict:
         """更新已发布的文章"""
         if not self.api_key:
             return {"error": "No API key provided"}
         
+        with self._stage("prepare"):
+            problems = validate_article(kwargs, partial=True)
+            if has_errors(problems):
+                return invalid_result(kwargs, problems)
+            
+            if self.normalize and kwargs.get("body_markdown"):
+                kwargs["body_markdown"] = normalize_markdown(kwargs["body_markdown"])
         data = {"article": kwargs}
         
         try:
-            response = requests.put(
-                f"{API_BASE}/articles/{article_id}",
+            response = self._request(
+                "PUT",
+                f"/articles/{article_id}",
                 headers=self.headers,
                 json=data
             )
-            return response.json()
+            article = response.json()
+            if response.ok:
+                self._invalidate_listings()
+                if "id" in article:
+                    self._index_published(article, article)
+            return article
+        except CircuitOpenError as e:
+            return e.result()
         except Exception as e:
             return {"status": "error", "message": str(e)}
     
-    def get_articles(self, username: str = None) -> List[Dict]:
-        """获取文章列表"""
-        if username:
-            response = requests.get(f"{API_BASE}/articles?username={username}")
-        else:
-            response = requests.get(f"{API_BASE}/articles/me", headers=self.headers)
+    def get_articles(
+        self,
+        username: str = None,
+        page: int = None,
+        per_page: int = None,
+        records: bool = False,
+        body: bool = False,
+        raw: bool = False
+    ) -> List[Dict]:
+        """
+        获取文章列表（单页）；失败时返回带 status 的字典
         
-        return response.json()
-
-
-class ContentGenerator:
-    """内容生成器 - 用于生成适合 Dev.to 的文章"""
-    
-    # 预置话题库
-    TOPICS = [
-        {
-            "title": "为什么你应该现在开始学习 AI 自动化？",
-            "tags": ["ai", "automation", "productivity"],
-            "content": """
-# 为什么你应该现在开始学习 AI 自动化？
-
-在人工智能飞速发展的今天，你是否感到焦虑和迷茫？
-
-每天都有新的 AI 工具问世，与其被动焦虑，不如主动拥抱变化。
-
-## 什么是 AI 自动化？
-
-AI 自动化不仅仅是使用 ChatGPT 写代码，它是一套系统化的方法：
-
-1. **任务分析** - 识别哪些工作可以被 AI 替代或增强
-2. **流程设计** - 构建人机协作的工作流程
-3. **工具链集成** - 将多个 AI 工具串联成自动化流水线
-4. **持续优化** - 根据反馈不断调整和改进
-
-## 我的 AI 自动化实践
-
-### 代码审查自动化
-
-```python
-import openai
-
-def review_code(code: str) -> str:
-    response = openai.ChatCompletion.create(
-        model="gpt-4",
-        messages=[
-            {"role": "system", "content": "你是一个资深代码审查专家"},
-            {"role": "user", "content": f"请审查以下代码并给出建议:\n\n{code}"}
-        ]
-    )
-    return response.choices[0].message.content
-```
-
-### 技术文档写作
-
-写技术文档是很多开发者的噩梦，现在 30 分钟完成以前一天的工作。
-
-### 数据分析报告
-
-面对海量数据，AI 帮助自动发现异常和趋势。
-
-## AI 自动化的核心优势
-
-- **效率提升 10 倍以上**
-- **质量更稳定**
-- **学习曲线更平缓**
-
-## 如何开始？
-
-1. **选择你的工具** - ChatGPT、Claude、GitHub Copilot
-2. **从一个小项目开始**
-3. **建立自己的提示词库**
-4. **持续迭代**
-
-## 结语
-
-现在是开始学习 AI 自动化的最佳时机。不是因为它会让你的工作消失，而是因为它会让你的工作更有价值。
-
----
-
-*本文由 AI 辅助创作*
-            """
-        },
-        {
-            "title": "Python 自动化脚本实战：从入门到精通",
-            "tags": ["python", "automation", "tutorial"],
-            "content": """
-# Python 自动化脚本实战
-
-Python 是自动化领域的瑞士军刀。本文分享 5 个实用的自动化脚本。
-
-## 1. 文件自动整理脚本
-
-```python
-import os
-import shutil
-from pathlib import Path
-
-def organize_downloads(download_dir: str):
-    """自动整理下载文件夹"""
-    patterns = {
-        "Images": [".png", ".jpg", ".gif", ".webp"],
-        "Documents": [".pdf", ".doc", ".docx", ".txt"],
-        "Archives": [".zip", ".rar", ".7z"],
-        "Videos": [".mp4", ".mkv", ".avi"]
-    }
+        Args:
+            records: 返回紧凑的 Article 记录而不是完整 JSON 字典
+            body: records 为 True 时是否保留 body_markdown
+            raw: records 为 True 时是否保留原始字典
+        """
+        params = {}
+        if page:
+            params["page"] = page
+        if per_page:
+            params["per_page"] = per_page
+        try:
+            if username:
+                articles = self._get_json("/articles", params={"username": username, **params})
+            else:
+                articles = self._get_json("/articles/me", headers=self.headers, params=params)
+        except CircuitOpenError as e:
+            return e.result()
+        except (requests.RequestException, ValueError) as e:
+            return {"status": "error", "message": str(e)}
+        if records and isinstance(articles, list):
+            return to_articles(articles, body, raw)
+        return articles
     
-    for file in Path(download_dir).iterdir():
-        if file.is_file():
-            for folder, exts in patterns.items():
-                if file.suffix.lower() in exts:
-                    target = Path(download_dir) / folder
-                    target.mkdir(exist_ok=True)
-                    shutil.move(str(file), str(target / file.name))
-                    print(f"Moved {file.name} to {folder}/")
-```
-
-## 2. 网页内容监控
-
-```python
-import requests
-from bs4 import BeautifulSoup
-
-def monitor_price(url: str, target_price: float):
-    """监控商品价格"""
-    headers = {"User-Agent": "Mozilla/5.0"}
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.text, "html.parser")
+    def _get_json(self, path: str, headers: Dict = None, params: Dict = None):
+        """
+        GET 并解析 JSON，启用缓存时走缓存 / 条件请求
+        
+        注意：命中缓存时返回的是缓存中的同一对象，调用方不要原地修改。
+        """
+        if self.cache is None:
+            return self._request("GET", path, headers=headers, params=params).json()
+        
+        key = self.cache.make_key(path, params, identity_of(self.api_key))
+        entry = self.cache.get(key)
+        if entry is not None and entry.fresh:
+            return entry.data
+        
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(entry.validators())
+        response = self._request("GET", path, headers=request_headers, params=params)
+        if response.status_code == 304 and entry is not None:
+            self.cache.refresh(key)
+            return entry.data
+        if entry is not None:
+            self.cache.record_stale_miss()
+        
+        data = response.json()
+        if response.status_code == 200:
+            self.cache.put(
+                key,
+                data,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified")
+            )
+        return data
     
-    # 提取价格（根据网站结构调整）
-    price = float(soup.select_one(".price").text.strip("$"))
+    def _invalidate_listings(self):
+        """发布 / 更新后清除文章列表缓存"""
+        if self.cache is not None:
+            self.cache.invalidate("/articles")
     
-    if price <= target_price:
-        print(f"价格已降至 ${price}！")
-    else:
-        print(f"当前价格 ${price}，目标 ${target_price}")
-```
-
-## 3. Excel 数据处理
-
-```python
-import pandas as pd
-
-def process_excel(input_file: str, output_file: str):
-    """自动化 Excel 处理"""
-    df = pd.read_excel(input_file)
+    def _list_request(self, username: Optional[str], params: Dict) -> requests.Response:
+        """请求 /articles?username= 或 /articles/me"""
+        if username:
+            return self._request("GET", "/articles", params={"username": username, **params})
+        return self._request("GET", "/articles/me", headers=self.headers, params=params)
     
-    # 数据清洗
-    df.dropna(inplace=True)
-    df["date"] = pd.to_datetime(df["date"])
+    def _fetch_page(self, username: Optional[str], page: int, per_page: int) -> List[Dict]:
+        """获取一页文章，失败时抛出 HTTPError"""
+        response = self._list_request(username, {"page": page, "per_page": per_page})
+        response.raise_for_status()
+        return response.json()
     
-    # 数据统计
-    summary = df.groupby("category")["amount"].sum()
+    def iter_articles(
+        self,
+        username: str = None,
+        per_page: int = DEFAULT_PER_PAGE,
+        prefetch: bool = True,
+        records: bool = False,
+        body: bool = False,
+        raw: bool = False
+    ) -> Iterator[Dict]:
+        """
+        逐篇遍历全部文章（自动翻页）
+        
+        调用方处理当前页时，后台线程预取下一页；
+        内存占用只与 per_page 有关，与账户文章总数无关。
+        接口熔断中时停止遍历，生成器的返回值为 status == "unavailable" 的结果
+        （用 capture_result() 读取）；其他 HTTP 错误抛出 HTTPError。
+        
+        Args:
+            username: 用户名（为空时遍历当前账户 /articles/me）
+            per_page: 每页数量（Dev.to 最大 1000）
+            prefetch: 是否后台预取下一页
+            records: 逐篇产出紧凑的 Article 记录（适合把全部文章留在内存里对账）
+            body: records 为 True 时是否保留 body_markdown
+            raw: records 为 True 时是否保留原始字典
+        """
+        if records:
+            articles = self.iter_articles(username, per_page, prefetch)
+            while True:
+                try:
+                    article = next(articles)
+                except StopIteration as stop:
+                    return stop.value
+                yield Article.from_api(article, body, raw)
+        if not prefetch:
+            page = 1
+            while True:
+                try:
+                    articles = self._fetch_page(username, page, per_page)
+                except CircuitOpenError as e:
+                    return e.result()
+                yield from articles
+                if len(articles) < per_page:
+                    return
+                page += 1
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = 1
+            pending = executor.submit(self._fetch_page, username, page, per_page)
+            while pending is not None:
+                try:
+                    articles = pending.result()
+                except CircuitOpenError as e:
+                    return e.result()
+                pending = None
+                if len(articles) == per_page:
+                    page += 1
+                    pending = executor.submit(self._fetch_page, username, page, per_page)
+                yield from articles
+
+
+def capture_result(articles: Iterator, outcome: Dict) -> Iterator:
+    """
+    原样遍历 iter_articles()，并把生成器的返回值写入 outcome["result"]
     
-    # 输出
-    summary.to_excel(output_file)
-    print(f"处理完成，结果已保存到 {output_file}")
-```
-
-## 4. 定时任务调度
-
-```python
-import schedule
-import time
-
-def job():
-    print("执行定时任务...")
-
-# 设置定时任务
-schedule.every().day.at("09:00").do(job)
-schedule.every().hour.do(job)
-
-while True:
-    schedule.run_pending()
-    time.sleep(60)
-```
-
-## 5. 邮件自动发送
-
-```python
-import smtplib
-from email.mime.text import MIMEText
-
-def send_email(to: str, subject: str, body: str):
-    """发送邮件"""
-    msg = MIMEText(body, "plain", "utf-8")
-    msg["Subject"] = subject
-    msg["From"] = "your@email.com"
-    msg["To"] = to
-    
-    with smtplib.SMTP("smtp.gmail.com", 587) as server:
-        server.starttls()
-        server.login("your@email.com", "password")
-        server.send_message(msg)
-```
-
-## 总结
-
-自动化不是让工作消失，而是让我们专注于更有价值的事情。
-
----
-
-*本文由 AI 辅助创作*
-            """
-        },
-        {
-            "title": "GitHub Actions 实战：打造你的 CI/CD 自动化流水线",
-            "tags": ["github", "cicd", "devops"],
-            "content": """
-# GitHub Actions 实战
-
-GitHub Actions 是 GitHub 自带的 CI/CD 工具，完全免费！
-
-## 什么是 CI/CD？
-
-- **CI (Continuous Integration)** - 持续集成
-- **CD (Continuous Deployment)** - 持续部署
+    遍历完整时为 None；接口熔断时为 status == "unavailable" 的结果。
+    """
+    outcome["result"] = yield from articles
 
-简单说：代码提交 → 自动测试 → 自动部署
 
-## 第一个 Workflow
-
-创建 `.github/workflows/ci.yml`：
-
-```yaml
-name: CI Pipeline
-
-on:
-  push:
-    branches: [main]
-  pull_request:
-    branches: [main]
-
-jobs:
-  test:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v3
-      
-      - name: Set up Python
-        uses: actions/setup-python@v4
-        with:
-          python-version: '3.10'
-      
-      - name: Install dependencies
-        run: |
-          python -m pip install --upgrade pip
-          pip install -r requirements.txt
-      
-      - name: Run tests
-        run: pytest
-```
-
-## 自动化部署到服务器
-
-```yaml
-deploy:
-    runs-on: ubuntu-latest
-    needs: test
-    if: github.ref == 'refs/heads/main'
-    
-    steps:
-      - uses: actions/checkout@v3
-      
-      - name: Deploy to Server
-        uses: appleboy/ssh-action@v0.1.3
-        with:
-          host: ${{ secrets.SERVER_HOST }}
-          username: ${{ secrets.SERVER_USER }}
-          key: ${{ secrets.SERVER_KEY }}
-          script: |
-            cd /path/to/project
-            git pull
-            docker-compose up -d
-```
-
-## 自动发布 Release
-
-```yaml
-release:
-    runs-on: ubuntu-latest
-    if: startsWith(github.ref, 'refs/tags/')
-    
-    steps:
-      - uses: actions/checkout@v3
-      
-      - name: Create Release
-        uses: actions/create-release@v1
-        env:
-          GITHUB_TOKEN: ${{ secrets.GITHUB_TOKEN }}
-        with:
-          tag_name: ${{ github.ref_name }}
-          release_name: Release ${{ github.ref_name }}
-          draft: false
-          prerelease: false
-```
-
-## 常用 Actions
-
-| Action | 用法 |
-|--------|------|
-| actions/checkout | 检出代码 |
-| actions/setup-python | 设置 Python |
-| appleboy/ssh-action | SSH 连接 |
-|.codecov/codecov-action | 代码覆盖率 |
-
-## 最佳实践
-
-1. **使用缓存** - 加速构建
-2. **矩阵策略** - 多版本测试
-3. **手动审批** - 生产环境部署需要确认
-4. **Secrets 管理** - 敏感信息放 Secrets
-
----
-
-*本文由 AI 辅助创作*
-            """
-        }
-    ]
+class ContentGenerator:
+    """内容生成器 - 用于生成适合 Dev.to 的文章"""
+    
+    # 预置话题库（正文存放在 content/topics/，首次访问时才读取）
+    TOPICS = load_collection("topics")
     
     def get_topic(self, index: int = None) -> Dict:
         """获取预设话题"""
@@ -455,7 +749,11 @@ release:
 
 
 def main():
-    """主函数"""
+    """主函数（带参数时转交非交互命令行 devto_cli）"""
+    if len(sys.argv) > 1:
+        from devto_cli import main as cli_main
+        sys.exit(cli_main(sys.argv[1:]))
+    
     print("=" * 50)
     print("🚀 Dev.to 自动发布系统")
     print("=" * 50)
@@ -473,11 +771,18 @@ def main():
         return
     
     publisher = DevToPublisher(api_key)
-    
+    try:
+        _run(publisher)
+    finally:
+        publisher.close()
+
+
+def _run(publisher: DevToPublisher):
+    """交互式发布流程"""
     # 获取用户信息
     user = publisher.get_user()
-    if "error" in user:
-        print(f"❌ API 错误: {user['error']}")
+    if "error" in user or "status" in user:
+        print(f"❌ API 错误: {user.get('error', user.get('message'))}")
         return
     
     print(f"\n✅ 已连接：{user.get('name', user.get('username', 'User'))}")
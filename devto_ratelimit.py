@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Dev.to 客户端限流
+
+- TokenBucket: 线程安全的令牌桶，按服务端反馈（429 / Retry-After /
+  RateLimit 头）在运行时自适应调整速率（AIMD：成功缓慢加速，429 减半）
+- backoff_delay: 有上限的指数退避 + 全抖动
+"""
+
+import random
+import threading
+import time
+import datetime
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+DEFAULT_RATE = 3.0          # 每秒请求数
+DEFAULT_BURST = 10          # 桶容量
+DEFAULT_MIN_RATE = 0.1
+DEFAULT_MAX_RATE = 10.0     # 没有 RateLimit 头时自适应加速的上限
+DEFAULT_RATE_STEP = 0.1     # 每次成功后的加速步长
+BACKOFF_BASE = 0.5          # 秒
+BACKOFF_CAP = 30.0          # 秒
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_CAP) -> float:
+    """第 attempt 次重试前的等待时间（全抖动指数退避）"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """解析 Retry-After 头（秒数或 HTTP 日期），返回需等待的秒数"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+class TokenBucket:
+    """令牌桶限流器，可在多个 DevToPublisher / 线程间共享"""
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        min_rate: float = DEFAULT_MIN_RATE,
+        max_rate: float = None,
+        rate_step: float = DEFAULT_RATE_STEP
+    ):
+        """
+        Args:
+            rate: 初始速率（请求/秒）
+            burst: 允许的突发请求数
+            min_rate: 被限流后速率下限
+            max_rate: 自适应加速的上限（默认 DEFAULT_MAX_RATE，不低于初始速率）；
+                响应带 RateLimit 头时，上限收紧到服务端给出的剩余额度 / 重置时间，之后随成功请求回升
+            rate_step: 每次成功请求后的速率增量
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate or max(rate, DEFAULT_MAX_RATE)
+        self.rate_step = rate_step
+        self._ceiling = self.max_rate
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """尝试拿一个令牌：成功返回 0，否则返回建议等待的秒数"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = self._blocked_until - now
+            if wait > 0:
+                return wait
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def wait_time(self) -> float:
+        """拿到下一个令牌前需等待的秒数（不消耗令牌）"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = self._blocked_until - now
+            if wait > 0:
+                return wait
+            return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        """阻塞直到拿到一个令牌"""
+        while True:
+            wait = self.try_acquire()
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """asyncio 版本的 acquire，等待期间不占用线程"""
+        import asyncio
+        while True:
+            wait = self.try_acquire()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    def block_for(self, seconds: float):
+        """在接下来 seconds 秒内暂停发放令牌"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = 0.0
+            self._blocked_until = max(self._blocked_until, now + seconds)
+
+    def penalize(self, retry_after: float = None):
+        """收到 429：速率减半，并遵守 Retry-After"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+        if retry_after:
+            self.block_for(retry_after)
+
+    def reward(self):
+        """请求成功：速率缓慢回升（RateLimit 头收紧的上限也按同样步长回升到 max_rate）"""
+        with self._lock:
+            self._ceiling = min(self.max_rate, self._ceiling + self.rate_step)
+            self.rate = min(self._ceiling, self.rate + self.rate_step)
+
+    def update_from_headers(self, headers: Mapping[str, str]):
+        """根据 X-RateLimit-* / RateLimit-* 头调整速率"""
+        remaining = headers.get("X-RateLimit-Remaining", headers.get("RateLimit-Remaining"))
+        reset = headers.get("X-RateLimit-Reset", headers.get("RateLimit-Reset"))
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining = int(remaining)
+            reset = float(reset)
+        except ValueError:
+            return
+        # 大于 1e9 视为 Unix 时间戳，否则为剩余秒数
+        if reset > 1e9:
+            reset -= time.time()
+        reset = max(reset, 0.0)
+
+        if remaining <= 0:
+            if reset:
+                self.block_for(reset)
+            return
+        if reset:
+            # 只收紧上限和当前速率，不抬高速率：penalize() 减半后的速率由 reward() 逐步回升
+            with self._lock:
+                self._ceiling = max(self.min_rate, min(self.max_rate, remaining / reset))
+                self.rate = min(self.rate, self._ceiling)
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+定时发布
+
+- ScheduleStore: SQLite 持久化的发布队列，重启不丢任务
+- SchedulerDaemon: 常驻进程，用最小堆保存到期时间，
+  睡眠到下一个截止时间（不轮询），到期后以有限并发发布
+
+防止重复发布：任务在发布前先原子地标记为 running，并记录领取者（owner）和租约到期时间；
+租约过期的 running 任务（领取它的进程已退出）只有在发布器配置了账本（ledger）时才重新入队，
+否则标记为 unknown 交由人工确认。其他进程仍持有租约的任务不受影响。
+
+守护进程定期按状态和到期时间（status = 'pending' AND due_at <= 刷新时刻）重新读取队列，
+其他进程新加入、改期或重新入队的任务都能被发现。
+
+用法：
+    python devto_scheduler.py add article.md --at 2026-01-01T09:00
+    python devto_scheduler.py run --workers 4
+"""
+
+import argparse
+import datetime
+import heapq
+import json
+import os
+import sqlite3
+import uuid
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from devto_bulk import DEFAULT_WORKERS, publish_one
+
+DEFAULT_SCHEDULE_PATH = os.path.expanduser("~/.devto_publisher/schedule.db")
+DEFAULT_REFRESH_INTERVAL = 60.0
+DEFAULT_LEASE_SECONDS = 600.0  # 租约有效期，应远大于一次发布（含重试）的耗时
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS schedule (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    due_at    REAL NOT NULL,
+    article   TEXT NOT NULL,
+    status    TEXT NOT NULL DEFAULT 'pending',
+    result    TEXT,
+    owner     TEXT,
+    lease_until REAL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_schedule_status_due ON schedule (status, due_at);
+"""
+
+
+def to_timestamp(when: Union[float, int, datetime.datetime, str]) -> float:
+    """把时间（时间戳 / datetime / ISO 字符串）转成 Unix 时间戳"""
+    if isinstance(when, str):
+        when = datetime.datetime.fromisoformat(when)
+    if isinstance(when, datetime.datetime):
+        return when.timestamp()
+    return float(when)
+
+
+class ScheduleStore:
+    """持久化发布队列，可在多线程间共享"""
+
+    def __init__(self, path: str = DEFAULT_SCHEDULE_PATH):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """旧版队列数据库没有租约列时补上（遗留的 running 任务视为租约已过期）"""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(schedule)")}
+        with self._conn:
+            for name, kind in (("owner", "TEXT"), ("lease_until", "REAL")):
+                if name not in columns:
+                    self._conn.execute(f"ALTER TABLE schedule ADD COLUMN {name} {kind}")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def enqueue(self, article: Dict, due_at: float) -> int:
+        """加入队列，返回任务 id"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO schedule (due_at, article, updated_at) VALUES (?, ?, ?)",
+                (due_at, json.dumps(dict(article), ensure_ascii=False), time.time())
+            )
+            return cursor.lastrowid
+
+    def enqueue_many(self, items: List[Tuple[Dict, float]]) -> List[int]:
+        """批量加入队列（单个事务），返回任务 id 列表"""
+        now = time.time()
+        ids = []
+        with self._lock, self._conn:
+            for article, due_at in items:
+                cursor = self._conn.execute(
+                    "INSERT INTO schedule (due_at, article, updated_at) VALUES (?, ?, ?)",
+                    (due_at, json.dumps(dict(article), ensure_ascii=False), now)
+                )
+                ids.append(cursor.lastrowid)
+        return ids
+
+    def pending(self, until: Optional[float] = None) -> List[Tuple[float, int]]:
+        """
+        待发布任务的 (due_at, id)
+
+        Args:
+            until: 只返回 due_at 不晚于该时间戳的任务（None 表示全部）
+        """
+        with self._lock:
+            if until is None:
+                return self._conn.execute("SELECT due_at, id FROM schedule WHERE status = 'pending'").fetchall()
+            return self._conn.execute(
+                "SELECT due_at, id FROM schedule WHERE status = 'pending' AND due_at <= ?",
+                (until,)
+            ).fetchall()
+
+    def claim(self, task_id: int, owner: str, lease_seconds: float = DEFAULT_LEASE_SECONDS) -> Optional[Dict]:
+        """
+        原子地把已到期的任务从 pending 改为 running 并记下租约
+
+        Args:
+            task_id: 任务 id
+            owner: 领取者标识
+            lease_seconds: 租约有效期（秒），过期后 recover() 才会处理该任务
+
+        Returns:
+            文章字典；已被领取、已取消或已改期到将来时返回 None
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE schedule SET status = 'running', owner = ?, lease_until = ?, updated_at = ? "
+                "WHERE id = ? AND status = 'pending' AND due_at <= ?",
+                (owner, now + lease_seconds, now, task_id, now)
+            )
+            if cursor.rowcount != 1:
+                return None
+            row = self._conn.execute("SELECT article FROM schedule WHERE id = ?", (task_id,)).fetchone()
+        return json.loads(row[0])
+
+    def complete(self, task_id: int, result: Dict):
+        """记录发布结果"""
+        status = "done" if result.get("status") in ("success", "updated", "skipped") else "failed"
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE schedule SET status = ?, result = ?, lease_until = NULL, updated_at = ? WHERE id = ?",
+                (status, json.dumps(result, ensure_ascii=False), time.time(), task_id)
+            )
+
+    def reschedule(self, task_id: int, due_at: float):
+        """把已领取的任务放回队列，在 due_at 重试"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE schedule SET status = 'pending', due_at = ?, owner = NULL, lease_until = NULL, updated_at = ? "
+                "WHERE id = ?",
+                (due_at, time.time(), task_id)
+            )
+
+    def cancel(self, task_id: int) -> bool:
+        """取消尚未发布的任务"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE schedule SET status = 'cancelled', updated_at = ? WHERE id = ? AND status = 'pending'",
+                (time.time(), task_id)
+            )
+            return cursor.rowcount == 1
+
+    def recover(self, requeue: bool) -> int:
+        """
+        处理租约已过期的 running 任务（领取它的进程异常退出）
+
+        Args:
+            requeue: True 时重新入队，否则标记为 unknown
+
+        Returns:
+            处理的任务数
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE schedule SET status = ?, owner = NULL, lease_until = NULL, updated_at = ? "
+                "WHERE status = 'running' AND (lease_until IS NULL OR lease_until <= ?)",
+                ("pending" if requeue else "unknown", now, now)
+            )
+            return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """各状态任务数"""
+        with self._lock:
+            return dict(self._conn.execute("SELECT status, COUNT(*) FROM schedule GROUP BY status").fetchall())
+
+
+class SchedulerDaemon:
+    """基于最小堆的定时发布守护进程"""
+
+    def __init__(
+        self,
+        publisher,
+        store: ScheduleStore,
+        workers: int = DEFAULT_WORKERS,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ):
+        """
+        Args:
+            publisher: DevToPublisher 实例
+            store: 持久化队列
+            workers: 同时发布的最大数量
+            refresh_interval: 重新读取队列的间隔（秒，None 表示只接收本进程的 schedule()）；
+                同时接管租约已过期的任务
+            lease_seconds: 领取任务的租约有效期（秒）
+        """
+        self.publisher = publisher
+        self.store = store
+        self.workers = workers
+        self.refresh_interval = refresh_interval
+        self.lease_seconds = lease_seconds
+        self.owner = uuid.uuid4().hex
+        self._heap: List[Tuple[float, int]] = []
+        self._queued: Set[Tuple[float, int]] = set()
+        self._cond = threading.Condition()
+        self._slots = threading.BoundedSemaphore(workers)
+        self._stopped = False
+        self._thread = None
+
+    def schedule(self, article: Dict, when) -> int:
+        """安排一篇文章在 when 发布，返回任务 id"""
+        due_at = to_timestamp(when)
+        task_id = self.store.enqueue(article, due_at)
+        with self._cond:
+            self._push(due_at, task_id)
+            self._cond.notify()
+        return task_id
+
+    def _push(self, due_at: float, task_id: int):
+        entry = (due_at, task_id)
+        if entry not in self._queued:
+            self._queued.add(entry)
+            heapq.heappush(self._heap, entry)
+
+    def _load(self, until: Optional[float] = None):
+        """读取 until 之前到期的 pending 任务（含其他进程加入、改期或重新入队的）"""
+        for due_at, task_id in self.store.pending(until):
+            self._push(due_at, task_id)
+
+    def _recover(self):
+        self.store.recover(requeue=getattr(self.publisher, "ledger", None) is not None)
+
+    def _next_due(self) -> Optional[int]:
+        """阻塞直到有任务到期，返回任务 id；停止时返回 None"""
+        last_refresh = time.monotonic()
+        with self._cond:
+            while not self._stopped:
+                now = time.time()
+                if self._heap and self._heap[0][0] <= now:
+                    entry = heapq.heappop(self._heap)
+                    self._queued.discard(entry)
+                    return entry[1]
+                timeout = self._heap[0][0] - now if self._heap else None
+                if self.refresh_interval:
+                    until_refresh = last_refresh + self.refresh_interval - time.monotonic()
+                    if until_refresh <= 0:
+                        # 下次刷新前到期的任务都会在这次读到，更晚的留给之后的刷新
+                        self._recover()
+                        self._load(time.time() + self.refresh_interval)
+                        last_refresh = time.monotonic()
+                        continue
+                    timeout = until_refresh if timeout is None else min(timeout, until_refresh)
+                self._cond.wait(timeout)
+        return None
+
+    def _fire(self, task_id: int):
+        try:
+            article = self.store.claim(task_id, self.owner, self.lease_seconds)
+            if article is not None:
+                result = publish_one(self.publisher, article)
+                if result.get("status") == "unavailable":
+                    # 熔断中：等熔断器半开后再试，不算失败
+                    due_at = time.time() + max(result.get("retry_after", 0.0), 1.0)
+                    self.store.reschedule(task_id, due_at)
+                    with self._cond:
+                        self._push(due_at, task_id)
+                        self._cond.notify()
+                else:
+                    self.store.complete(task_id, result)
+        finally:
+            self._slots.release()
+
+    def run_forever(self):
+        """在当前线程运行，直到 stop()"""
+        self._recover()
+        with self._cond:
+            self._load()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while True:
+                self._slots.acquire()
+                task_id = self._next_due()
+                if task_id is None:
+                    self._slots.release()
+                    break
+                executor.submit(self._fire, task_id)
+
+    def start(self) -> "SchedulerDaemon":
+        """在后台线程运行"""
+        self._thread = threading.Thread(target=self.run_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, wait: bool = True):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if wait and self._thread is not None:
+            self._thread.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dev.to 定时发布")
+    parser.add_argument("--db", default=DEFAULT_SCHEDULE_PATH, help="队列数据库路径")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    add = sub.add_parser("add", help="添加定时任务")
+    add.add_argument("file", help="Markdown 文件")
+    add.add_argument("--at", required=True, help="发布时间（ISO 格式，如 2026-01-01T09:00）")
+    add.add_argument("--draft", action="store_true", help="以草稿形式发布")
+
+    run = sub.add_parser("run", help="运行守护进程")
+    run.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+
+    sub.add_parser("status", help="查看队列状态")
+    args = parser.parse_args()
+
+    store = ScheduleStore(args.db)
+    if args.command == "add":
+        from devto_sync import parse_markdown
+        with open(args.file, "r", encoding="utf-8") as f:
+            article = parse_markdown(f.read(), os.path.splitext(os.path.basename(args.file))[0])
+        if args.draft:
+            article["published"] = False
+        task_id = store.enqueue(article, to_timestamp(args.at))
+        print(f"⏰ 已加入队列 #{task_id}: {article['title']}")
+    elif args.command == "status":
+        print(json.dumps(store.counts(), ensure_ascii=False))
+    else:
+        from devto_publisher import DevToPublisher
+        from devto_ledger import Ledger
+        with DevToPublisher(ledger=Ledger()) as publisher:
+            daemon = SchedulerDaemon(publisher, store, workers=args.workers)
+            print("⏰ 定时发布守护进程已启动（Ctrl+C 退出）")
+            try:
+                daemon.run_forever()
+            except KeyboardInterrupt:
+                pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+本地全文检索（倒排索引 + BM25）
+
+回答“这个话题是不是已经写过”：内置文章集（topics / agent_li）、Markdown 目录、
+已发布文章建在同一个索引里，按 BM25 排序返回。
+
+- 分词与 devto_tags 一致：英文按单词，中文按二元组，标题中的词权重加倍
+- 倒排表为 CSR 布局的 NumPy 数组（词 -> 文档 id / 词频），查询只读相关词的切片，
+  10 万篇规模下单次查询在毫秒级
+- 新增文档先追加到按词分组的 array，删除只打墓碑，
+  保存时合并进 CSR 并压缩掉已删除文档，不需要排序
+- 文档按内容哈希判断是否变化，重复收录同一内容不会改动索引
+
+    python devto_search.py index --content-dir articles/ --remote
+    python devto_search.py query "GitHub Actions 自动部署" -n 5
+
+依赖：pip install numpy
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+import threading
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from devto_tags import tokenize
+
+DEFAULT_SEARCH_PATH = os.path.expanduser("~/.devto_publisher/search.npz")
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+DEFAULT_LIMIT = 10
+TITLE_WEIGHT = 2  # 标题中的词按出现 1 + TITLE_WEIGHT 次计
+MAX_TF = 65535    # 词频按 uint16 存储
+
+
+def published_key(article_id) -> str:
+    """已发布文章在索引中的 key"""
+    return f"devto:{article_id}"
+
+
+def _digest(title: str, text: str) -> str:
+    return hashlib.sha1(f"{title}\n{text}".encode("utf-8")).hexdigest()[:16]
+
+
+def _group_ranks(groups: np.ndarray) -> np.ndarray:
+    """按值连续分组的数组中，每个元素在组内的序号"""
+    if not len(groups):
+        return np.zeros(0, dtype=np.int64)
+    first = np.flatnonzero(np.concatenate(([True], groups[1:] != groups[:-1])))
+    return np.arange(len(groups)) - np.repeat(first, np.diff(np.append(first, len(groups))))
+
+
+class SearchIndex:
+    """可增量更新、可持久化的 BM25 倒排索引（线程安全）"""
+
+    def __init__(self, path: Optional[str] = DEFAULT_SEARCH_PATH, k1: float = DEFAULT_K1, b: float = DEFAULT_B):
+        """
+        Args:
+            path: 索引文件（None 表示只在内存中）；存在时自动加载
+            k1: BM25 词频饱和参数
+            b: BM25 文档长度归一化参数
+        """
+        self.path = path
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+
+        # 文档表（按文档 id 下标；已删除的 key 为 None）
+        self.keys: List[Optional[str]] = []
+        self.titles: List[str] = []
+        self.digests: List[str] = []
+        self.source_names: List[str] = []
+        self._source_codes: Dict[str, int] = {}
+        self._doc: Dict[str, int] = {}
+        self._sources = np.zeros(0, dtype=np.int16)
+        self._lengths = np.zeros(0, dtype=np.float32)
+        self._live = np.zeros(0, dtype=bool)
+        self._live_count = 0
+        self._total_length = 0.0
+
+        # 已合并部分：CSR
+        self._terms: List[str] = []
+        self._vocab: Dict[str, int] = {}
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._postings = np.zeros(0, dtype=np.int32)
+        self._tfs = np.zeros(0, dtype=np.uint16)
+
+        # 未合并的新增：词 -> (文档 id, 词频)
+        self._delta: Dict[str, Tuple[array, array]] = {}
+
+        if path and os.path.exists(path):
+            self._load(path)
+
+    def __len__(self) -> int:
+        return self._live_count
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._doc
+
+    # --- 写入 ---
+
+    def _grow(self, size: int):
+        if size <= len(self._live):
+            return
+        capacity = max(size, len(self._live) * 2, 1024)
+        self._lengths = np.resize(self._lengths, capacity)
+        self._sources = np.resize(self._sources, capacity)
+        live = np.zeros(capacity, dtype=bool)
+        live[:len(self._live)] = self._live
+        self._live = live
+
+    def _source_code(self, source: str) -> int:
+        code = self._source_codes.get(source)
+        if code is None:
+            code = self._source_codes[source] = len(self.source_names)
+            self.source_names.append(source)
+        return code
+
+    def add(self, key: str, text: str, title: str = "", source: str = "") -> bool:
+        """
+        收录或更新一篇文档
+
+        Args:
+            key: 文档唯一标识（如 "devto:123"、"markdown:posts/a.md"）
+            text: 正文
+            title: 标题（词权重加倍，并在结果中返回）
+            source: 来源名称，可用于过滤查询
+
+        Returns:
+            索引是否有变化（内容未变时为 False）
+        """
+        digest = _digest(title, text)
+        counts = Counter(tokenize(text))
+        for token in tokenize(title):
+            counts[token] += 1 + TITLE_WEIGHT
+        with self._lock:
+            doc_id = self._doc.get(key)
+            if doc_id is not None:
+                if self.digests[doc_id] == digest:
+                    return False
+                self._remove(doc_id)
+
+            doc_id = len(self.keys)
+            self._grow(doc_id + 1)
+            self.keys.append(key)
+            self.titles.append(title)
+            self.digests.append(digest)
+            self._doc[key] = doc_id
+            length = float(sum(counts.values()))
+            self._lengths[doc_id] = length
+            self._sources[doc_id] = self._source_code(source)
+            self._live[doc_id] = True
+            self._live_count += 1
+            self._total_length += length
+
+            for term, tf in counts.items():
+                entry = self._delta.get(term)
+                if entry is None:
+                    entry = self._delta[term] = (array("i"), array("H"))
+                entry[0].append(doc_id)
+                entry[1].append(min(tf, MAX_TF))
+            return True
+
+    def add_published(self, article: Dict) -> bool:
+        """收录一篇 Dev.to 返回的文章（发布 / 更新成功后由 DevToPublisher 调用）"""
+        return self.add(
+            published_key(article["id"]),
+            article.get("body_markdown") or "",
+            article.get("title") or "",
+            "devto"
+        )
+
+    def add_many(self, docs: Iterable[Tuple[str, str, str, str]]) -> int:
+        """批量收录 (key, text, title, source)，返回有变化的文档数"""
+        return sum(self.add(key, text, title, source) for key, text, title, source in docs)
+
+    def _remove(self, doc_id: int):
+        self._doc.pop(self.keys[doc_id], None)
+        self.keys[doc_id] = None
+        self._live[doc_id] = False
+        self._live_count -= 1
+        self._total_length -= float(self._lengths[doc_id])
+
+    def remove(self, key: str) -> bool:
+        """删除文档（倒排表中的记录在保存时才清理）"""
+        with self._lock:
+            doc_id = self._doc.get(key)
+            if doc_id is None:
+                return False
+            self._remove(doc_id)
+            return True
+
+    def keys_with_prefix(self, prefix: str) -> List[str]:
+        """以 prefix 开头的全部 key（用于清理已删除的来源文档）"""
+        with self._lock:
+            return [key for key in self._doc if key.startswith(prefix)]
+
+    # --- 查询 ---
+
+    def _term_postings(self, term: str) -> Tuple[np.ndarray, np.ndarray]:
+        parts_ids, parts_tfs = [], []
+        term_id = self._vocab.get(term)
+        if term_id is not None:
+            start, end = self._offsets[term_id], self._offsets[term_id + 1]
+            parts_ids.append(self._postings[start:end])
+            parts_tfs.append(self._tfs[start:end])
+        entry = self._delta.get(term)
+        if entry is not None and len(entry[0]):
+            # 复制一份：array 被 NumPy 视图引用期间不能再 append
+            parts_ids.append(np.frombuffer(entry[0], dtype=np.int32).copy())
+            parts_tfs.append(np.frombuffer(entry[1], dtype=np.uint16).copy())
+        if not parts_ids:
+            return self._postings[:0], self._tfs[:0]
+        if len(parts_ids) == 1:
+            return parts_ids[0], parts_tfs[0]
+        return np.concatenate(parts_ids), np.concatenate(parts_tfs)
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT, source: str = None) -> List[Dict]:
+        """
+        BM25 排序查询
+
+        Args:
+            query: 查询文本（中英文均可）
+            limit: 最多返回的结果数
+            source: 只返回该来源的文档
+
+        Returns:
+            [{"key", "title", "source", "score"}]，按得分从高到低
+        """
+        terms = set(tokenize(query))
+        limit = max(1, limit)
+        with self._lock:
+            if not terms or not self._live_count:
+                return []
+            if source is not None and source not in self._source_codes:
+                return []
+            size = len(self.keys)
+            live = self._live[:size]
+            n = self._live_count
+            avg_length = self._total_length / n or 1.0
+            k1, b = self.k1, self.b
+            scores = np.zeros(size, dtype=np.float32)
+            for term in terms:
+                ids, tfs = self._term_postings(term)
+                if not len(ids):
+                    continue
+                df = int(np.count_nonzero(live[ids]))
+                if not df:
+                    continue
+                idf = math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+                tf = tfs.astype(np.float32)
+                norm = k1 * (1.0 - b + b * self._lengths[ids] / avg_length)
+                # 同一个词的倒排表里文档 id 不重复，可以直接按下标累加
+                scores[ids] += idf * tf * (k1 + 1.0) / (tf + norm)
+
+            mask = live
+            if source is not None:
+                mask = mask & (self._sources[:size] == self._source_codes[source])
+            scores[~mask] = 0.0
+            hits = np.flatnonzero(scores > 0)
+            if len(hits) > limit:
+                hits = hits[np.argpartition(-scores[hits], limit - 1)[:limit]]
+            hits = hits[np.argsort(-scores[hits], kind="stable")]
+            return [
+                {
+                    "key": self.keys[i],
+                    "title": self.titles[i],
+                    "source": self.source_names[self._sources[i]],
+                    "score": round(float(scores[i]), 4),
+                }
+                for i in hits
+            ]
+
+    # --- 合并与持久化 ---
+
+    def _merge(self):
+        """把新增部分合并进 CSR，并压缩掉已删除的文档"""
+        size = len(self.keys)
+        if not self._delta and self._live_count == size:
+            return
+        live = self._live[:size]
+        vocab = self._vocab
+        terms = self._terms
+        new_terms = [term for term in self._delta if term not in vocab]
+        if new_terms:
+            vocab = dict(vocab)
+            terms = terms + new_terms
+            vocab.update((term, i) for i, term in enumerate(new_terms, len(self._terms)))
+        num_terms = len(terms)
+
+        # 已合并部分按词有序；新增部分按词分组（组内文档 id 递增，且大于已合并部分）
+        main_terms = np.repeat(np.arange(num_terms - len(new_terms)), np.diff(self._offsets))
+        main_ids, main_tfs = self._postings, self._tfs
+        delta_terms = np.repeat(
+            np.fromiter((vocab[term] for term in self._delta), dtype=np.int64, count=len(self._delta)),
+            np.fromiter((len(ids) for ids, _ in self._delta.values()), dtype=np.int64, count=len(self._delta))
+        )
+        # bytes.join 直接拼接 array 的缓冲区，避免逐词转换
+        delta_ids = np.frombuffer(b"".join(ids for ids, _ in self._delta.values()), dtype=np.int32)
+        delta_tfs = np.frombuffer(b"".join(tfs for _, tfs in self._delta.values()), dtype=np.uint16)
+
+        if self._live_count < size:
+            keep = live[main_ids]
+            main_terms, main_ids, main_tfs = main_terms[keep], main_ids[keep], main_tfs[keep]
+            keep = live[delta_ids]
+            delta_terms, delta_ids, delta_tfs = delta_terms[keep], delta_ids[keep], delta_tfs[keep]
+
+        # 每个词：先放已合并的，再放新增的，直接算出目标位置
+        main_counts = np.bincount(main_terms, minlength=num_terms)
+        counts = main_counts + np.bincount(delta_terms, minlength=num_terms)
+        starts = np.concatenate(([0], np.cumsum(counts)))[:-1]
+        postings = np.empty(int(counts.sum()), dtype=np.int32)
+        tfs = np.empty(len(postings), dtype=np.uint16)
+        positions = starts[main_terms] + _group_ranks(main_terms)
+        postings[positions] = main_ids
+        tfs[positions] = main_tfs
+        positions = starts[delta_terms] + main_counts[delta_terms] + _group_ranks(delta_terms)
+        postings[positions] = delta_ids
+        tfs[positions] = delta_tfs
+
+        # 去掉已无文档的词，压缩文档 id
+        used = counts > 0
+        if not used.all():
+            terms = [t for t, u in zip(terms, used) if u]
+            vocab = dict(zip(terms, range(len(terms))))
+            counts = counts[used]
+        self._terms = terms
+        self._vocab = vocab
+        self._offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        if self._live_count < size:
+            remap = (np.cumsum(live) - 1).astype(np.int32)
+            postings = remap[postings]
+            alive = np.flatnonzero(live)
+            self.keys = [self.keys[i] for i in alive]
+            self.titles = [self.titles[i] for i in alive]
+            self.digests = [self.digests[i] for i in alive]
+            self._lengths = self._lengths[alive]
+            self._sources = self._sources[alive]
+            self._live = np.ones(len(alive), dtype=bool)
+            self._doc = dict(zip(self.keys, range(len(self.keys))))
+        self._postings = postings
+        self._tfs = tfs
+        self._delta = {}
+
+    def save(self, path: str = None):
+        """合并新增部分并保存（不压缩，加载时不需要解压）"""
+        path = path or self.path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._lock:
+            self._merge()
+            size = len(self.keys)
+            meta = json.dumps({
+                "k1": self.k1, "b": self.b, "title_weight": TITLE_WEIGHT,
+                "keys": self.keys, "titles": self.titles, "digests": self.digests,
+                "sources": self.source_names, "terms": self._terms,
+            }, ensure_ascii=False)
+            arrays = {
+                "offsets": self._offsets, "postings": self._postings, "tfs": self._tfs,
+                "lengths": self._lengths[:size], "source_codes": self._sources[:size],
+            }
+        tmp = path + ".tmp.npz"
+        np.savez(tmp, meta=np.array(meta), **arrays)
+        os.replace(tmp, path)
+
+    def _load(self, path: str):
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            arrays = {name: data[name] for name in ("offsets", "postings", "tfs", "lengths", "source_codes")}
+        if meta["title_weight"] != TITLE_WEIGHT:
+            raise ValueError("索引参数与当前配置不一致，请重建索引")
+        self.keys = meta["keys"]
+        self.titles = meta["titles"]
+        self.digests = meta["digests"]
+        self.source_names = meta["sources"]
+        self._source_codes = {name: i for i, name in enumerate(self.source_names)}
+        self._doc = dict(zip(self.keys, range(len(self.keys))))
+        self._terms = meta["terms"]
+        self._vocab = dict(zip(self._terms, range(len(self._terms))))
+        self._offsets = arrays["offsets"]
+        self._postings = arrays["postings"]
+        self._tfs = arrays["tfs"]
+        self._lengths = arrays["lengths"].astype(np.float32)
+        self._sources = arrays["source_codes"].astype(np.int16)
+        self._live = np.ones(len(self.keys), dtype=bool)
+        self._live_count = len(self.keys)
+        self._total_length = float(self._lengths.sum())
+
+
+def update_index(index: SearchIndex, content_dir: str = None, publisher=None) -> Dict:
+    """
+    收录内置文章集、Markdown 目录和（可选）已发布文章，并删除来源中已不存在的文档
+
+    Args:
+        index: 搜索索引
+        content_dir: Markdown 目录（key 为 "markdown:相对路径"）
+        publisher: 提供时遍历 /articles/me（key 为 "devto:文章 id"）
+
+    Returns:
+        {"changed": 新增或内容变化的文档数, "removed": 删除的文档数, "documents": 当前文档数}；
+        已发布文章没取全（熔断）时附带 "remote": unavailable 结果，此时不删除 devto 文档；
+        无法读取或不是 UTF-8 的 Markdown 文件跳过，列在 "skipped" 中
+    """
+    from devto_content import list_collections, load_collection
+    from devto_ledger import normalize_key
+
+    changed = removed = 0
+    summary = {}
+
+    def refresh(prefix: str, docs: Iterable[Tuple[str, str, str, str]], outcome: Dict = None):
+        nonlocal changed, removed
+        stale = set(index.keys_with_prefix(prefix))
+        for key, text, title, source in docs:
+            stale.discard(key)
+            changed += index.add(key, text, title, source)
+        if outcome and outcome.get("result"):
+            return  # 列表没取全（熔断），不能据此删除文档
+        for key in stale:
+            removed += index.remove(key)
+
+    for name in list_collections():
+        refresh(f"{name}:", (
+            (f"{name}:{normalize_key(a['title'])}", a["content"], a["title"], name)
+            for a in load_collection(name)
+        ))
+
+    if content_dir:
+        from devto_sync import parse_markdown, scan_markdown
+
+        def markdown_docs():
+            for rel, _ in scan_markdown(content_dir):
+                try:
+                    with open(os.path.join(content_dir, rel), "r", encoding="utf-8") as f:
+                        text = f.read()
+                except (OSError, UnicodeDecodeError) as e:
+                    # 读不了的文件跳过（不影响其他文件），在结果中列出
+                    summary.setdefault("skipped", []).append({"path": rel, "message": str(e)})
+                    continue
+                article = parse_markdown(text, os.path.splitext(os.path.basename(rel))[0])
+                yield f"markdown:{rel}", article["content"], article["title"], "markdown"
+
+        refresh("markdown:", markdown_docs())
+
+    if publisher is not None:
+        from devto_publisher import capture_result
+
+        outcome = {}
+        refresh("devto:", (
+            (published_key(a["id"]), a.get("body_markdown") or "", a.get("title") or "", "devto")
+            for a in capture_result(publisher.iter_articles(records=True, body=True), outcome)
+        ), outcome)
+        if outcome.get("result"):
+            summary["remote"] = outcome["result"]
+
+    summary.update(changed=changed, removed=removed, documents=len(index))
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="本地全文检索（BM25）")
+    parser.add_argument("--index", default=DEFAULT_SEARCH_PATH, help="索引文件路径")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("index", help="收录内置文章、Markdown 目录和已发布文章")
+    p.add_argument("--content-dir", help="Markdown 目录")
+    p.add_argument("--remote", action="store_true", help="收录 Dev.to 上的文章（需要 DEVTO_API_KEY）")
+
+    p = sub.add_parser("query", help="查询")
+    p.add_argument("query", nargs="+")
+    p.add_argument("-n", "--limit", type=int, default=DEFAULT_LIMIT)
+    p.add_argument("--source", help="只查某个来源（topics、agent_li、markdown、devto）")
+    args = parser.parse_args()
+
+    index = SearchIndex(args.index)
+    if args.command == "query":
+        for hit in index.search(" ".join(args.query), args.limit, args.source):
+            print(json.dumps(hit, ensure_ascii=False))
+        return
+
+    publisher = None
+    if args.remote:
+        from devto_publisher import DevToPublisher
+        publisher = DevToPublisher()
+    try:
+        summary = update_index(index, args.content_dir, publisher)
+    finally:
+        if publisher is not None:
+            publisher.close()
+    index.save()
+    print(json.dumps(summary, ensure_ascii=False), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Markdown 目录增量同步
+
+扫描目录下的 .md 文件，与上次同步状态比较：
+- mtime 和 size 都没变：直接跳过（不读文件）
+- 变了才读取并计算哈希，哈希没变只刷新 mtime/size
+- 真正有变化的文件才调用 publish_article / update_article
+"""
+
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+STATE_FILENAME = ".devto_sync.json"
+DEFAULT_WORKERS = 4
+
+_FRONT_MATTER = re.compile(r"\A---\s*\n(.*?)\n---\s*(?:\n|\Z)", re.S)
+_HEADING = re.compile(r"^#\s+(.+?)\s*#*\s*$", re.M)
+
+
+def parse_markdown(text: str, fallback_title: str = "") -> Dict:
+    """
+    解析 Markdown 文件
+
+    标题优先取 front matter 的 title，其次取第一个一级标题，最后用 fallback_title；
+    标签取 front matter 的 tags（逗号分隔或 [a, b] 形式）。
+    """
+    meta = {}
+    body = text
+    match = _FRONT_MATTER.match(text)
+    if match:
+        body = text[match.end():]
+        for line in match.group(1).splitlines():
+            name, sep, value = line.partition(":")
+            if sep:
+                meta[name.strip().lower()] = value.strip().strip("'\"")
+
+    title = meta.get("title")
+    if not title:
+        heading = _HEADING.search(body)
+        title = heading.group(1) if heading else fallback_title
+
+    tags = [t.strip().strip("'\"") for t in meta.get("tags", "").strip("[]").split(",")]
+    article = {"title": title, "content": body, "tags": [t for t in tags if t]}
+    if "published" in meta:
+        article["published"] = meta["published"].lower() == "true"
+    for name in ("description", "canonical_url"):
+        if meta.get(name):
+            article[name] = meta[name]
+    return article
+
+
+def file_key(path: str, directory: str) -> str:
+    """文件在账本和同步状态中的标识：相对 directory 的规范化路径"""
+    return os.path.relpath(path, directory)
+
+
+def scan_markdown(directory: str) -> List[Tuple[str, os.stat_result]]:
+    """递归列出目录下所有 .md 文件（相对路径, stat）"""
+    found = []
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".md") and entry.is_file():
+                    try:
+                        st = entry.stat()
+                    except OSError:  # 扫描途中被删除
+                        continue
+                    found.append((file_key(entry.path, directory), st))
+    return found
+
+
+def load_state(path: str) -> Dict[str, Dict]:
+    """读取上次同步状态"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_state(path: str, state: Dict[str, Dict]):
+    """原子写入同步状态"""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def _record_update(publisher, rel: str, article: Dict, article_id: int, url: Optional[str]):
+    """更新成功后按 publish_article 的算法刷新账本中的内容哈希，下次同步不会再更新一次"""
+    ledger = getattr(publisher, "ledger", None)
+    if ledger is None:
+        return
+    from devto_publisher import prepare_payload
+    payload = prepare_payload(
+        article["title"],
+        article["content"],
+        article["tags"] or None,
+        article.get("published", True),
+        article.get("canonical_url"),
+        article.get("description"),
+        rel,
+        normalize=getattr(publisher, "normalize", True),
+        tagger=getattr(publisher, "tagger", None)
+    )
+    if "digest" in payload:
+        ledger.record(rel, payload["digest"], article_id, url)
+
+
+def push_article(publisher, rel: str, article: Dict, previous: Optional[Dict]) -> Dict:
+    """把一个有变化的文件推送到 Dev.to"""
+    if previous and previous.get("id"):
+        fields = {"title": article["title"], "body_markdown": article["content"]}
+        # 没写标签时不发 tags 字段，避免清空线上文章的标签
+        if article["tags"]:
+            fields["tags"] = article["tags"][:4]
+        for name in ("published", "description", "canonical_url"):
+            if name in article:
+                fields[name] = article[name]
+        result = publisher.update_article(previous["id"], **fields)
+        if "id" in result:
+            url = result.get("url", previous.get("url"))
+            _record_update(publisher, rel, article, result["id"], url)
+            return {"status": "updated", "id": result["id"], "url": url}
+        return {"status": "error", "message": result.get("message", result.get("error", result))}
+
+    return publisher.publish_article(
+        title=article["title"],
+        content=article["content"],
+        tags=article["tags"] or None,
+        published=article.get("published", True),
+        canonical_url=article.get("canonical_url"),
+        description=article.get("description"),
+        key=rel
+    )
+
+
+def sync_directory(
+    publisher,
+    directory: str,
+    state_path: str = None,
+    workers: int = DEFAULT_WORKERS,
+    dry_run: bool = False
+) -> Dict:
+    """
+    增量同步目录到 Dev.to
+
+    Args:
+        publisher: DevToPublisher 实例
+        directory: Markdown 目录
+        state_path: 同步状态文件（默认为目录下的 .devto_sync.json）
+        workers: 并发请求数
+        dry_run: 只计算差异，不发请求也不写状态
+
+    Returns:
+        {"unchanged": n, "published": [...], "updated": [...], "errors": [...], "removed": [...]}
+    """
+    state_path = state_path or os.path.join(directory, STATE_FILENAME)
+    state = load_state(state_path)
+    new_state = {}
+    pending = []
+    unreadable = []
+    unchanged = 0
+
+    for rel, st in scan_markdown(directory):
+        previous = state.get(rel)
+        if previous and previous["mtime_ns"] == st.st_mtime_ns and previous["size"] == st.st_size:
+            new_state[rel] = previous
+            unchanged += 1
+            continue
+
+        try:
+            with open(os.path.join(directory, rel), "rb") as f:
+                raw = f.read()
+        except OSError as e:
+            # 扫描后被删除或无权读取：单独报错，保留旧状态
+            if previous:
+                new_state[rel] = previous
+            unreadable.append({"path": rel, "result": {"status": "error", "path": rel, "message": str(e)}})
+            continue
+        digest = hashlib.sha256(raw).hexdigest()
+        entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "hash": digest}
+        if previous:
+            entry["id"] = previous.get("id")
+            entry["url"] = previous.get("url")
+        new_state[rel] = entry
+        if previous and previous.get("hash") == digest:
+            unchanged += 1
+            continue
+
+        try:
+            text = raw.decode("utf-8")
+        except UnicodeDecodeError as e:
+            # 不是 UTF-8 的文件单独报错，保留旧状态（下次同步重试），不影响其他文件
+            if previous:
+                new_state[rel] = previous
+            else:
+                del new_state[rel]
+            unreadable.append({"path": rel, "result": {"status": "error", "path": rel, "message": str(e)}})
+            continue
+        fallback = os.path.splitext(os.path.basename(rel))[0]
+        pending.append((rel, parse_markdown(text, fallback), previous))
+
+    summary = {
+        "unchanged": unchanged,
+        "published": [],
+        "updated": [],
+        "errors": unreadable,
+        "removed": sorted(set(state) - set(new_state)),
+    }
+    if dry_run:
+        for rel, _, previous in pending:
+            summary["updated" if previous and previous.get("id") else "published"].append(rel)
+        return summary
+
+    def push(item):
+        rel, article, previous = item
+        try:
+            return push_article(publisher, rel, article, previous)
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for (rel, _, previous), result in zip(pending, executor.map(push, pending)):
+            status = result.get("status")
+            if status in ("success", "updated", "skipped"):
+                new_state[rel]["id"] = result["id"]
+                new_state[rel]["url"] = result.get("url")
+                summary["updated" if status == "updated" else "published"].append(rel)
+            else:
+                # 失败的文件保留旧状态，下次同步会重试
+                if previous:
+                    new_state[rel] = previous
+                else:
+                    del new_state[rel]
+                summary["errors"].append({"path": rel, "result": result})
+
+    if new_state != state:
+        save_state(state_path, new_state)
+    return summary
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+自动标签生成
+
+在本地语料（ARTICLES、TOPICS、同步目录）上建立 TF-IDF 词项统计，
+用 NumPy 一次性为一批文章打分，返回每篇最合适的 4 个 Dev.to 标签。
+
+- 候选标签 = 常用 Dev.to 标签 + 语料中出现过的标签
+- 标签画像 = 带该标签文章的词频质心 + 标签名本身
+- 每个标签的词频稀疏保存（词 id → 权重），内存与词表大小无关，只与标签实际出现过的词数有关
+- 索引保存在磁盘（.npz，标签词频为 CSR 三元组），按内容哈希增量更新，已收录的文章不会重复计数
+
+依赖：pip install numpy
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Mapping, Optional
+
+import numpy as np
+
+DEFAULT_TAG_INDEX_PATH = os.path.expanduser("~/.devto_publisher/tags.npz")
+MAX_TAGS = 4
+BATCH_SIZE = 256
+NAME_BOOST = 3.0
+PROFILE_TERMS = 300  # 每个标签画像保留的最高权重词数
+
+# 常用 Dev.to 标签（只含小写字母数字，符合 Dev.to 规则）
+DEFAULT_CANDIDATE_TAGS = [
+    "ai", "api", "automation", "aws", "beginners", "career", "cicd", "cloud", "codenewbie",
+    "css", "database", "datascience", "devops", "discuss", "docker", "frontend", "git",
+    "github", "go", "html", "java", "javascript", "kubernetes", "linux", "machinelearning",
+    "node", "opensource", "performance", "productivity", "programming", "python", "react",
+    "rust", "security", "showdev", "testing", "tutorial", "typescript", "webdev", "writing",
+]
+
+# 标签名以外、也能代表该标签的词
+TAG_ALIASES = {
+    "ai": ["chatgpt", "gpt", "llm", "claude", "copilot", "openai"],
+    "cicd": ["ci", "cd", "pipeline", "workflow", "workflows"],
+    "devops": ["deploy", "deployment", "ssh"],
+    "javascript": ["js", "npm"],
+    "machinelearning": ["ml", "model", "training"],
+    "python": ["pip", "pandas", "py", "pytest"],
+    "typescript": ["ts"],
+    "docker": ["compose", "container", "dockerfile"],
+}
+
+_VALID_TAG = re.compile(r"^[a-z0-9]+$")
+_WORD = re.compile(r"[a-z][a-z0-9+#]*|[\u4e00-\u9fff]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """英文按单词切分，中文按二元组切分"""
+    tokens = []
+    for word in _WORD.findall(text.lower()):
+        if word.isascii() or len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def _doc_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _article_text(article: Mapping) -> str:
+    return f"{article.get('title', '')}\n{article.get('content', '')}"
+
+
+class TagSuggester:
+    """基于 TF-IDF 质心的批量标签推荐器，可增量更新并持久化"""
+
+    def __init__(self, path: str = DEFAULT_TAG_INDEX_PATH, candidates: List[str] = None):
+        """
+        Args:
+            path: 索引文件路径（None 表示只在内存中）
+            candidates: 候选标签（默认 DEFAULT_CANDIDATE_TAGS）
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self.vocab: Dict[str, int] = {}
+        self.df = np.zeros(0, dtype=np.int32)
+        self.n_docs = 0
+        self.tags: List[str] = []
+        self._tag_index: Dict[str, int] = {}
+        self.tag_tf: List[Dict[int, float]] = []  # 每个标签：词 id -> 归一化词频之和
+        self.tag_docs = np.zeros(0, dtype=np.int32)
+        self.seen = set()
+        self._profiles = None
+
+        if path and os.path.exists(path):
+            self._load(path)
+        for tag in candidates or DEFAULT_CANDIDATE_TAGS:
+            self._ensure_tag(tag)
+
+    # --- 索引维护 ---
+
+    def _ensure_term(self, term: str) -> int:
+        index = self.vocab.get(term)
+        if index is None:
+            index = self.vocab[term] = len(self.vocab)
+        return index
+
+    def _ensure_tag(self, tag: str) -> Optional[int]:
+        tag = tag.strip().lower()
+        if not _VALID_TAG.match(tag):
+            return None
+        index = self._tag_index.get(tag)
+        if index is None:
+            index = self._tag_index[tag] = len(self.tags)
+            self.tags.append(tag)
+            self._ensure_term(tag)
+            for alias in TAG_ALIASES.get(tag, []):
+                self._ensure_term(alias)
+        return index
+
+    def _grow(self):
+        """词表 / 标签表超出容量时按倍数扩展数组（均摊 O(1)）"""
+        n_terms, n_tags = len(self.vocab), len(self.tags)
+        if self.df.shape[0] < n_terms:
+            df = np.zeros(max(n_terms, 2 * self.df.shape[0], 1024), dtype=np.int32)
+            df[:self.df.shape[0]] = self.df
+            self.df = df
+        while len(self.tag_tf) < n_tags:
+            self.tag_tf.append({})
+        if self.tag_docs.shape[0] < n_tags:
+            docs = np.zeros(max(n_tags, 2 * self.tag_docs.shape[0], 64), dtype=np.int32)
+            docs[:self.tag_docs.shape[0]] = self.tag_docs
+            self.tag_docs = docs
+
+    def add_documents(self, articles: Iterable[Mapping]) -> int:
+        """
+        增量收录带标签的文章（已收录过的内容自动跳过）
+
+        Returns:
+            新收录的文章数
+        """
+        added = 0
+        with self._lock:
+            for article in articles:
+                text = _article_text(article)
+                digest = _doc_hash(text)
+                if digest in self.seen:
+                    continue
+                terms = np.array([self._ensure_term(t) for t in tokenize(text)], dtype=np.int64)
+                tag_ids = [i for i in (self._ensure_tag(t) for t in article.get("tags") or []) if i is not None]
+                self._grow()
+                if terms.size:
+                    ids, counts = np.unique(terms, return_counts=True)
+                    self.df[ids] += 1
+                    weights = (counts / np.linalg.norm(counts)).tolist()
+                    ids = ids.tolist()
+                    for tag_id in tag_ids:
+                        tf = self.tag_tf[tag_id]
+                        for term, weight in zip(ids, weights):
+                            tf[term] = tf.get(term, 0.0) + weight
+                        self.tag_docs[tag_id] += 1
+                self.n_docs += 1
+                self.seen.add(digest)
+                added += 1
+            if added:
+                self._profiles = None
+        return added
+
+    # --- 持久化 ---
+
+    def save(self, path: str = None):
+        """保存索引（原子替换）"""
+        path = path or self.path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        terms = sorted(self.vocab, key=self.vocab.get)
+        meta = json.dumps({"terms": terms, "tags": self.tags, "n_docs": self.n_docs, "seen": sorted(self.seen)})
+        tmp = path + ".tmp.npz"
+        n_terms, n_tags = len(self.vocab), len(self.tags)
+        with self._lock:
+            self._grow()
+            rows = self.tag_tf[:n_tags]
+            indptr = np.cumsum([0] + [len(tf) for tf in rows], dtype=np.int64)
+            np.savez_compressed(
+                tmp,
+                meta=np.array(meta),
+                df=self.df[:n_terms],
+                tag_indptr=indptr,
+                tag_terms=np.fromiter((t for tf in rows for t in tf), dtype=np.int32, count=indptr[-1]),
+                tag_weights=np.fromiter((w for tf in rows for w in tf.values()), dtype=np.float32, count=indptr[-1]),
+                tag_docs=self.tag_docs[:n_tags]
+            )
+        os.replace(tmp, path)
+
+    def _load(self, path: str):
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            self.df = data["df"]
+            self.tag_docs = data["tag_docs"]
+            if "tag_indptr" in data:
+                indptr, terms, weights = data["tag_indptr"], data["tag_terms"].tolist(), data["tag_weights"].tolist()
+                self.tag_tf = [
+                    dict(zip(terms[indptr[i]:indptr[i + 1]], weights[indptr[i]:indptr[i + 1]]))
+                    for i in range(len(indptr) - 1)
+                ]
+            else:  # 旧版索引：稠密矩阵
+                self.tag_tf = [
+                    {int(t): float(row[t]) for t in np.flatnonzero(row)} for row in data["tag_tf"]
+                ]
+        self.vocab = {term: i for i, term in enumerate(meta["terms"])}
+        self.tags = meta["tags"]
+        self._tag_index = {tag: i for i, tag in enumerate(self.tags)}
+        self.n_docs = meta["n_docs"]
+        self.seen = set(meta["seen"])
+
+    # --- 打分 ---
+
+    def _idf(self) -> np.ndarray:
+        df = self.df[:len(self.vocab)]
+        return (np.log((1 + self.n_docs) / (1 + df)) + 1).astype(np.float32)
+
+    def _build_profiles(self):
+        """
+        构建标签画像
+
+        Returns:
+            (col_map, profiles_t, idf)：col_map 把词 id 映射到画像列（-1 表示不参与打分），
+            profiles_t 为（画像词数 × 标签数）的 L2 归一化矩阵
+        """
+        self._grow()
+        n_terms, n_tags = len(self.vocab), len(self.tags)
+        idf = self._idf()
+
+        # 每个标签只保留权重最高的 PROFILE_TERMS 个词，控制打分矩阵大小
+        kept = []
+        for tag_id, tag in enumerate(self.tags):
+            docs = max(int(self.tag_docs[tag_id]), 1)
+            weights = {term: weight / docs for term, weight in self.tag_tf[tag_id].items()}
+            weights[self.vocab[tag]] = weights.get(self.vocab[tag], 0.0) + NAME_BOOST
+            for alias in TAG_ALIASES.get(tag, []):
+                weights[self.vocab[alias]] = weights.get(self.vocab[alias], 0.0) + NAME_BOOST / 2
+            terms = np.fromiter(weights, dtype=np.int64, count=len(weights))
+            values = np.fromiter(weights.values(), dtype=np.float32, count=len(weights)) * idf[terms]
+            if terms.size > PROFILE_TERMS:
+                top = np.argpartition(-values, PROFILE_TERMS - 1)[:PROFILE_TERMS]
+                terms, values = terms[top], values[top]
+            nonzero = values != 0
+            kept.append((terms[nonzero], values[nonzero]))
+
+        active = np.unique(np.concatenate([terms for terms, _ in kept])) if kept else np.zeros(0, dtype=np.int64)
+        col_map = np.full(n_terms, -1, dtype=np.int64)
+        col_map[active] = np.arange(active.size)
+        profiles_t = np.zeros((active.size, n_tags), dtype=np.float32)
+        for tag_id, (terms, values) in enumerate(kept):
+            profiles_t[col_map[terms], tag_id] = values
+        norms = np.linalg.norm(profiles_t, axis=0, keepdims=True)
+        norms[norms == 0] = 1
+        profiles_t /= norms
+        return col_map, profiles_t, idf
+
+    def suggest_many(self, texts: List[str], k: int = MAX_TAGS) -> List[List[str]]:
+        """为一批文本各推荐 k 个标签（按批向量化打分）"""
+        with self._lock:
+            if self._profiles is None:
+                self._profiles = self._build_profiles()
+            col_map, profiles_t, idf = self._profiles
+            vocab = self.vocab
+            tags = list(self.tags)
+        k = min(k, len(tags))
+        results = []
+
+        for start in range(0, len(texts), BATCH_SIZE):
+            batch = texts[start:start + BATCH_SIZE]
+            rows, terms = [], []
+            for row, text in enumerate(batch):
+                ids = [vocab[t] for t in tokenize(text) if t in vocab]
+                rows.extend([row] * len(ids))
+                terms.extend(ids)
+            scores = np.zeros((len(batch), len(tags)), dtype=np.float32)
+
+            if terms:
+                # (行, 词) 去重计数 → TF-IDF 权重，按行 L2 归一化
+                n_terms = len(col_map)
+                pairs, counts = np.unique(
+                    np.asarray(rows, dtype=np.int64) * n_terms + np.asarray(terms, dtype=np.int64),
+                    return_counts=True
+                )
+                pair_rows, pair_terms = np.divmod(pairs, n_terms)
+                weights = counts.astype(np.float32) * idf[pair_terms]
+                row_norms = np.sqrt(np.bincount(pair_rows, weights=weights ** 2, minlength=len(batch)))
+                weights /= np.maximum(row_norms[pair_rows], 1e-12).astype(np.float32)
+
+                # 只有画像中的词参与打分
+                cols = col_map[pair_terms]
+                mask = cols >= 0
+                pair_rows, cols, weights = pair_rows[mask], cols[mask], weights[mask]
+                if cols.size:
+                    contrib = profiles_t[cols] * weights[:, None]
+                    starts = np.flatnonzero(np.r_[True, pair_rows[1:] != pair_rows[:-1]])
+                    scores[pair_rows[starts]] = np.add.reduceat(contrib, starts, axis=0)
+
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            for row in range(len(batch)):
+                order = top[row][np.argsort(-scores[row, top[row]])]
+                results.append([tags[i] for i in order if scores[row, i] > 0])
+        return results
+
+    def suggest(self, text: str, k: int = MAX_TAGS) -> List[str]:
+        """为单篇文本推荐标签"""
+        return self.suggest_many([text], k)[0]
+
+    def suggest_articles(self, articles: List[Mapping], k: int = MAX_TAGS) -> List[List[str]]:
+        """为一批文章字典推荐标签"""
+        return self.suggest_many([_article_text(a) for a in articles], k)
+
+
+def build_default_index(path: str = DEFAULT_TAG_INDEX_PATH, directory: str = None) -> TagSuggester:
+    """
+    用内置文章（及可选的 Markdown 目录）建立 / 增量更新标签索引并保存
+    """
+    from devto_content import load_collection
+
+    suggester = TagSuggester(path)
+    suggester.add_documents(load_collection("topics"))
+    suggester.add_documents(load_collection("agent_li"))
+    if directory:
+        from devto_sync import parse_markdown
+        for root, _, files in os.walk(directory):
+            for name in files:
+                if name.endswith(".md"):
+                    with open(os.path.join(root, name), "r", encoding="utf-8") as f:
+                        article = parse_markdown(f.read(), os.path.splitext(name)[0])
+                    if article["tags"]:
+                        suggester.add_documents([article])
+    if path:
+        suggester.save(path)
+    return suggester
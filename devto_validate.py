@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+发布前本地校验
+
+按 Dev.to 的限制检查文章，一次列出全部问题，不发任何请求：
+- 标题非空，不超过 128 个字符
+- 正文非空
+- 标签只能是字母和数字，每个不超过 30 个字符；含大写时由 Dev.to 转为小写（警告），
+  超过 4 个时只保留前 4 个（警告）
+- canonical_url 必须是 http(s) 绝对地址
+
+severity 为 "error" 的问题会让发布路径直接跳过该文章（返回 status == "invalid"），
+"warning" 只提示，不阻止发布。
+"""
+
+import re
+from typing import Dict, Iterable, List, Tuple
+from urllib.parse import urlparse
+
+MAX_TITLE_LENGTH = 128
+MAX_TAGS = 4
+MAX_TAG_LENGTH = 30
+
+_TAG_RE = re.compile(r"[a-z0-9]+")
+
+
+def _problem(field: str, message: str, severity: str = "error") -> Dict:
+    return {"field": field, "message": message, "severity": severity}
+
+
+def validate_article(article: Dict, partial: bool = False) -> List[Dict]:
+    """
+    校验一篇文章
+
+    Args:
+        article: 文章字典（title / content 或 body_markdown / tags / canonical_url）
+        partial: 只校验出现的字段（用于更新请求）
+
+    Returns:
+        问题列表，每项为 {"field", "message", "severity"}；为空表示通过
+    """
+    problems = []
+
+    if not partial or "title" in article:
+        title = (article.get("title") or "").strip()
+        if not title:
+            problems.append(_problem("title", "标题不能为空"))
+        elif len(title) > MAX_TITLE_LENGTH:
+            problems.append(_problem("title", f"标题超过 {MAX_TITLE_LENGTH} 个字符（{len(title)}）"))
+
+    body_field = "body_markdown" if "body_markdown" in article else "content"
+    if not partial or body_field in article:
+        if not (article.get(body_field) or "").strip():
+            problems.append(_problem(body_field, "正文不能为空"))
+
+    tags = article.get("tags")
+    if tags:
+        if isinstance(tags, str):
+            problems.append(_problem("tags", "tags 必须是列表"))
+            tags = []
+        if len(tags) > MAX_TAGS:
+            problems.append(_problem(
+                "tags", f"标签超过 {MAX_TAGS} 个，将只保留 {', '.join(map(str, tags[:MAX_TAGS]))}", "warning"
+            ))
+        for tag in tags[:MAX_TAGS]:
+            if not isinstance(tag, str) or not _TAG_RE.fullmatch(tag.lower()):
+                problems.append(_problem("tags", f"标签 {tag!r} 只能包含字母和数字"))
+            elif len(tag) > MAX_TAG_LENGTH:
+                problems.append(_problem("tags", f"标签 {tag!r} 超过 {MAX_TAG_LENGTH} 个字符"))
+            elif tag != tag.lower():
+                problems.append(_problem("tags", f"标签 {tag!r} 将转为小写 {tag.lower()!r}", "warning"))
+
+    canonical_url = article.get("canonical_url")
+    if canonical_url:
+        parsed = urlparse(canonical_url)
+        if parsed.scheme not in ("http", "https") or not parsed.netloc or " " in canonical_url:
+            problems.append(_problem("canonical_url", f"canonical_url 不是有效的 http(s) 地址: {canonical_url!r}"))
+
+    return problems
+
+
+def has_errors(problems: List[Dict]) -> bool:
+    return any(p["severity"] == "error" for p in problems)
+
+
+def invalid_result(article: Dict, problems: List[Dict]) -> Dict:
+    """发布路径中校验失败时的返回值"""
+    return {"status": "invalid", "title": article.get("title"), "problems": problems}
+
+
+def validate_batch(articles: Iterable[Dict]) -> Tuple[List[int], List[Dict]]:
+    """
+    批量校验
+
+    Args:
+        articles: 文章字典的可迭代对象
+
+    Returns:
+        (通过校验的下标列表, 问题报告列表)；
+        报告每项为 {"index", "title", "problems"}，包含只有警告的文章
+    """
+    valid, report = [], []
+    for index, article in enumerate(articles):
+        problems = validate_article(article)
+        if problems:
+            report.append({"index": index, "title": article.get("title"), "problems": problems})
+        if not has_errors(problems):
+            valid.append(index)
+    return valid, report
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+目录监听：保存即推送草稿
+
+- Linux 上用 inotify（ctypes 调用 libc，无额外依赖），没有变化时进程阻塞在 select 上，不占 CPU
+- 其他平台或 inotify 不可用时退回 stat 轮询（每轮只 stat 目录和最近改过的文件）
+- 同一文件的连续保存在 debounce 窗口内合并为一次推送
+- 新文件以草稿（published=False）发布；已发布过的文件只更新内容，不改变发布状态
+- 与 devto_sync 共用状态文件 .devto_sync.json，监听和手动同步可以交替使用；
+  监听只处理启动后的保存，启动前的改动请先用 sync_directory 补上
+
+    python devto_watch.py articles/ --debounce 2
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import errno
+import hashlib
+import os
+import select
+import struct
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+from devto_sync import STATE_FILENAME, load_state, parse_markdown, push_article, save_state, scan_markdown
+
+DEFAULT_DEBOUNCE = 2.0       # 秒
+DEFAULT_POLL_INTERVAL = 2.0  # 秒
+DEFAULT_FULL_SCAN = 60.0     # 秒
+DEFAULT_HOT_WINDOW = 600.0   # 秒
+
+# inotify 常量（linux/inotify.h）
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE_SELF | IN_ONLYDIR
+_EVENT = struct.Struct("iIII")
+
+
+def _is_markdown(rel: str) -> bool:
+    return rel.endswith(".md") and not any(part.startswith(".") for part in rel.split(os.sep))
+
+
+class PollingWatcher:
+    """
+    stat 轮询
+
+    每轮只 stat 所有目录和最近改过的文件：新建文件、以重命名方式保存的编辑器
+    会改变目录 mtime，立即发现；原地写入的冷文件由每 full_every 秒一次的全量扫描发现，
+    之后进入“热”集合，后续保存同样立即发现。
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        full_every: float = DEFAULT_FULL_SCAN,
+        hot_window: float = DEFAULT_HOT_WINDOW
+    ):
+        """
+        Args:
+            directory: 监听目录
+            interval: 轮询间隔（秒）
+            full_every: 全量扫描间隔（秒）
+            hot_window: 文件变化后多久内每轮都 stat（秒）
+        """
+        self.directory = directory
+        self.interval = interval
+        self.full_every = full_every
+        self.hot_window = hot_window
+        self._files: Dict[str, tuple] = {}
+        self._dirs: Dict[str, int] = {}
+        self._children: Dict[str, Set[str]] = {}
+        self._hot: Dict[str, float] = {}
+        self._full_scan()
+        self._next = time.monotonic() + interval
+
+    def _scan_dir(self, rel_dir: str, changed: Set[str]) -> List[str]:
+        """重新列出一个目录，更新其中文件的签名，返回子目录"""
+        path = os.path.join(self.directory, rel_dir)
+        subdirs = []
+        files = set()
+        try:
+            self._dirs[rel_dir] = os.stat(path).st_mtime_ns
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.name.startswith("."):
+                        continue
+                    rel = os.path.normpath(os.path.join(rel_dir, entry.name))
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(rel)
+                    elif entry.name.endswith(".md") and entry.is_file():
+                        st = entry.stat()
+                        sig = (st.st_mtime_ns, st.st_size)
+                        if self._files.get(rel) != sig:
+                            if rel in self._files or self._ready:
+                                changed.add(rel)
+                            self._files[rel] = sig
+                        files.add(rel)
+        except FileNotFoundError:
+            self._dirs.pop(rel_dir, None)
+        for rel in self._children.get(rel_dir, set()) - files:
+            self._files.pop(rel, None)
+            self._hot.pop(rel, None)
+        self._children[rel_dir] = files
+        return subdirs
+
+    def _walk(self, rel_dir: str, changed: Set[str]):
+        stack = [rel_dir]
+        while stack:
+            stack.extend(self._scan_dir(stack.pop(), changed))
+
+    def _full_scan(self) -> Set[str]:
+        changed = set()
+        self._ready = bool(self._dirs)
+        self._walk(os.curdir, changed)
+        self._ready = True
+        self._last_full = time.monotonic()
+        return changed
+
+    def _tick(self) -> Set[str]:
+        now = time.monotonic()
+        if now - self._last_full >= self.full_every:
+            changed = self._full_scan()
+        else:
+            changed = set()
+            for rel_dir, mtime in list(self._dirs.items()):
+                try:
+                    current = os.stat(os.path.join(self.directory, rel_dir)).st_mtime_ns
+                except FileNotFoundError:
+                    current = None
+                if current != mtime:
+                    for sub in self._scan_dir(rel_dir, changed):
+                        if sub not in self._dirs:
+                            self._walk(sub, changed)
+            for rel in list(self._hot):
+                try:
+                    st = os.stat(os.path.join(self.directory, rel))
+                except FileNotFoundError:
+                    continue
+                sig = (st.st_mtime_ns, st.st_size)
+                if self._files.get(rel) != sig:
+                    self._files[rel] = sig
+                    changed.add(rel)
+        for rel in changed:
+            self._hot[rel] = now
+        for rel, seen in list(self._hot.items()):
+            if now - seen > self.hot_window:
+                del self._hot[rel]
+        return changed
+
+    def wait(self, timeout: Optional[float]) -> Set[str]:
+        """等待变化，返回变化文件的相对路径（超时返回空集合）"""
+        delay = self._next - time.monotonic()
+        if timeout is not None and timeout < delay:
+            time.sleep(max(timeout, 0))
+            return set()
+        time.sleep(max(delay, 0))
+        self._next = time.monotonic() + self.interval
+        return self._tick()
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """inotify 监听（递归监听所有子目录）"""
+
+    def __init__(self, directory: str):
+        """
+        Args:
+            directory: 监听目录
+
+        Raises:
+            OSError: 当前系统不支持 inotify 或监听数量超过上限
+        """
+        self.directory = directory
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError(errno.ENOSYS, "inotify 不可用")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 失败")
+        self._dirs: Dict[int, str] = {}
+        self._overflow = False
+        try:
+            self._watch_tree(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch(self, path: str):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_add_watch 失败: {path} ({os.strerror(err)})")
+        self._dirs[wd] = os.path.relpath(path, self.directory)
+
+    def _watch_tree(self, root: str) -> List[str]:
+        """监听 root 及其子目录，返回其中已有的 .md 文件"""
+        found = []
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            self._watch(current)
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".md"):
+                        found.append(os.path.relpath(entry.path, self.directory))
+        return found
+
+    def _read_events(self) -> Set[str]:
+        changed = set()
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _, length = _EVENT.unpack_from(buf, offset)
+                offset += _EVENT.size
+                name = buf[offset:offset + length].rstrip(b"\0").decode("utf-8", "surrogateescape")
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    self._overflow = True
+                    continue
+                parent = self._dirs.get(wd)
+                if parent is None:
+                    continue
+                if mask & (IN_IGNORED | IN_DELETE_SELF):
+                    self._dirs.pop(wd, None)
+                    continue
+                rel = os.path.normpath(os.path.join(parent, name))
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO) and not name.startswith("."):
+                        # 新目录（或移进来的目录树）：补上监听，并处理其中已有的文件
+                        try:
+                            changed.update(self._watch_tree(os.path.join(self.directory, rel)))
+                        except OSError:
+                            self._overflow = True
+                elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO) and _is_markdown(rel):
+                    changed.add(rel)
+
+    def wait(self, timeout: Optional[float]) -> Set[str]:
+        """等待变化，返回变化文件的相对路径（超时返回空集合）"""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        changed = self._read_events() if readable else set()
+        if self._overflow:
+            # 事件队列溢出：全量扫描，交给状态文件里的 mtime/size 去判断
+            self._overflow = False
+            changed.update(rel for rel, _ in scan_markdown(self.directory))
+        return changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def open_watcher(directory: str, poll_interval: float = DEFAULT_POLL_INTERVAL, polling: bool = False):
+    """优先使用 inotify，不可用时退回轮询"""
+    if not polling:
+        try:
+            return InotifyWatcher(directory)
+        except OSError as e:
+            print(f"⚠️  inotify 不可用（{e}），改用轮询", file=sys.stderr)
+    return PollingWatcher(directory, poll_interval)
+
+
+class WatchDaemon:
+    """监听目录，把保存后的 Markdown 文件推送为草稿"""
+
+    def __init__(
+        self,
+        publisher,
+        directory: str,
+        state_path: str = None,
+        debounce: float = DEFAULT_DEBOUNCE,
+        watcher=None
+    ):
+        """
+        Args:
+            publisher: DevToPublisher 实例
+            directory: Markdown 目录
+            state_path: 同步状态文件（默认与 devto_sync 相同）
+            debounce: 同一文件最后一次保存后等待多久再推送（秒）
+            watcher: 监听器（默认 open_watcher(directory)）
+        """
+        self.publisher = publisher
+        self.directory = directory
+        self.state_path = state_path or os.path.join(directory, STATE_FILENAME)
+        self.debounce = debounce
+        self.watcher = watcher or open_watcher(directory)
+        self.state = load_state(self.state_path)
+        self._pending: Dict[str, float] = {}
+        self._running = False
+
+    def push(self, paths: Iterable[str]) -> List[Dict]:
+        """推送一批文件（内容没变的跳过），返回推送结果"""
+        results = []
+        dirty = False
+        for rel in paths:
+            path = os.path.join(self.directory, rel)
+            try:
+                st = os.stat(path)
+                with open(path, "rb") as f:
+                    raw = f.read()
+            except FileNotFoundError:
+                continue
+            previous = self.state.get(rel)
+            digest = hashlib.sha256(raw).hexdigest()
+            entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "hash": digest}
+            if previous:
+                entry["id"] = previous.get("id")
+                entry["url"] = previous.get("url")
+            if previous and previous.get("hash") == digest:
+                if previous != entry:
+                    self.state[rel] = entry
+                    dirty = True
+                continue
+
+            try:
+                text = raw.decode("utf-8")
+            except UnicodeDecodeError as e:
+                # 不是 UTF-8 的文件只报错，守护线程继续处理其他文件
+                results.append({"status": "error", "path": rel, "message": str(e)})
+                continue
+            article = parse_markdown(text, os.path.splitext(os.path.basename(rel))[0])
+            if previous and previous.get("id"):
+                article.pop("published", None)
+            else:
+                article["published"] = False
+            try:
+                result = push_article(self.publisher, rel, article, previous)
+            except Exception as e:
+                result = {"status": "error", "message": str(e)}
+            result["path"] = rel
+            results.append(result)
+            if result.get("status") in ("success", "updated", "skipped"):
+                entry["id"] = result["id"]
+                entry["url"] = result.get("url")
+                self.state[rel] = entry
+                dirty = True
+        if dirty:
+            save_state(self.state_path, self.state)
+        return results
+
+    def poll_once(self, timeout: Optional[float] = None) -> List[Dict]:
+        """等待一轮事件，推送 debounce 到期的文件"""
+        now = time.monotonic()
+        if self._pending:
+            wait = max(0.0, min(self._pending.values()) - now)
+            timeout = wait if timeout is None else min(timeout, wait)
+        for rel in self.watcher.wait(timeout):
+            self._pending[rel] = time.monotonic() + self.debounce
+        now = time.monotonic()
+        due = [rel for rel, deadline in self._pending.items() if deadline <= now]
+        for rel in due:
+            del self._pending[rel]
+        return self.push(sorted(due)) if due else []
+
+    def run_forever(self, on_result=None):
+        """持续监听，直到 stop()"""
+        self._running = True
+        while self._running:
+            for result in self.poll_once(timeout=1.0):
+                if on_result:
+                    on_result(result)
+
+    def stop(self):
+        self._running = False
+
+    def close(self):
+        self.watcher.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="监听 Markdown 目录，保存后自动推送为 Dev.to 草稿")
+    parser.add_argument("directory", help="Markdown 目录")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE, help="防抖时间（秒）")
+    parser.add_argument("--poll", action="store_true", help="强制使用 stat 轮询")
+    parser.add_argument("--interval", type=float, default=DEFAULT_POLL_INTERVAL, help="轮询间隔（秒）")
+    args = parser.parse_args()
+
+    import json
+    from devto_publisher import DevToPublisher
+
+    watcher = open_watcher(args.directory, args.interval, args.poll)
+    with DevToPublisher() as publisher:
+        daemon = WatchDaemon(publisher, args.directory, debounce=args.debounce, watcher=watcher)
+        print(f"👀 正在监听 {args.directory}（{type(watcher).__name__}，Ctrl+C 退出）", file=sys.stderr)
+        try:
+            daemon.run_forever(lambda r: print(json.dumps(r, ensure_ascii=False), flush=True))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            daemon.close()
+
+
+if __name__ == "__main__":
+    main()
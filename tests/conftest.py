@@ -0,0 +1,11 @@
+import pytest
+
+from devto_mock import MockServer
+
+
+@pytest.fixture
+def server():
+    """后台运行的本地模拟 Dev.to 服务"""
+    server = MockServer().start()
+    yield server
+    server.stop()
@@ -0,0 +1,26 @@
+from devto_accounts import PublisherPool
+from devto_ledger import Ledger
+
+
+def test_every_result_has_account_and_elapsed(server):
+    articles = [
+        {"title": "Good", "content": "body"},
+        {"title": "", "content": "body"},
+        {"title": "Lost", "content": "body", "account": "nobody"},
+    ]
+    with PublisherPool.from_keys({"a": "ka", "b": "kb"}, api_base=server.url) as pool:
+        results = pool.publish_many(articles)
+    assert [r["status"] for r in results] == ["success", "invalid", "error"]
+    for result in results:
+        assert "account" in result and "elapsed" in result
+    assert results[0]["account"] in ("a", "b")
+    assert results[1]["account"] is None and results[1]["elapsed"] == 0.0
+
+
+def test_accounts_do_not_share_ledger_entries(tmp_path, server):
+    with Ledger(str(tmp_path / "ledger.db")) as ledger:
+        with PublisherPool.from_keys({"a": "ka", "b": "kb"}, api_base=server.url, ledger=ledger) as pool:
+            first = pool.publish_article({"title": "Shared", "content": "body", "account": "a"})
+            second = pool.publish_article({"title": "Shared", "content": "body", "account": "b"})
+    assert (first["status"], second["status"]) == ("success", "success")
+    assert first["id"] != second["id"]
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from devto_analytics import WEEK, MetricStore, deltas, growth_by_tag, harvest, latest
+
+MONDAY = 4 * 86400  # 1970-01-05
+
+
+def _rows(ids, ts, views):
+    n = len(ids)
+    return {"id": ids, "ts": [ts] * n, "views": views, "reactions": [0] * n, "comments": [0] * n}
+
+
+class FakePublisher:
+    def __init__(self, articles):
+        self.articles = articles
+
+    def iter_articles(self, per_page=30):
+        yield from self.articles
+
+
+def _article(article_id, views, published_at="2026-01-01T00:00:00Z", tags=("python",)):
+    return {"id": article_id, "title": f"Post {article_id}", "published_at": published_at,
+            "tag_list": list(tags), "page_views_count": views}
+
+
+def test_uncommitted_rows_are_truncated_on_open(tmp_path):
+    store = MetricStore(str(tmp_path))
+    store.append(_rows([1], MONDAY, [10]))
+    store.save_meta()
+    store.append(_rows([1], MONDAY + 60, [20]))  # 没有 save_meta() 就退出
+    assert len(MetricStore(str(tmp_path))) == 1
+
+
+def test_append_rejects_ragged_columns(tmp_path):
+    store = MetricStore(str(tmp_path))
+    rows = _rows([1, 2], MONDAY, [1, 2])
+    rows["views"] = [1]
+    with pytest.raises(ValueError):
+        store.append(rows)
+
+
+def test_deltas_and_latest(tmp_path):
+    store = MetricStore(str(tmp_path))
+    store.append(_rows([1, 2], MONDAY, [10, 5]))
+    store.append(_rows([1], MONDAY + 60, [25]))
+    d = deltas(store)
+    assert d["id"].tolist() == [1, 1, 2]
+    assert d["delta"].tolist() == [10, 15, 5]
+    assert latest(store) == {1: 25, 2: 5}
+
+
+def test_growth_by_tag_sums_per_week_and_skips_unknown_articles(tmp_path):
+    store = MetricStore(str(tmp_path))
+    store.articles = {"1": {"tags": ["python", "web"]}, "2": {"tags": ["python"]}}
+    store.append(_rows([1, 2, 3], MONDAY, [10, 5, 100]))  # 3 没有元数据
+    store.append(_rows([1], MONDAY + WEEK, [30]))
+    tags, weeks, matrix = growth_by_tag(store)
+    assert tags == ["python", "web"]
+    assert weeks.tolist() == [MONDAY, MONDAY + WEEK]
+    assert matrix.tolist() == [[15, 20], [10, 20]]
+
+
+def test_growth_by_tag_with_only_unknown_articles(tmp_path):
+    store = MetricStore(str(tmp_path))
+    store.articles = {"1": {"tags": ["python"]}}
+    store.append(_rows([9], MONDAY, [1]))
+    tags, weeks, matrix = growth_by_tag(store)
+    assert tags == ["python"] and matrix.shape == (1, 0)
+
+
+def test_harvest_writes_only_changed_articles(tmp_path):
+    store = MetricStore(str(tmp_path))
+    publisher = FakePublisher([_article(2, 5), _article(1, 10)])
+    now = 1_800_000_000
+    assert harvest(publisher, store, full=True, now=now)["changed"] == 2
+    publisher.articles = [_article(2, 5), _article(1, 12)]
+    assert harvest(publisher, store, full=True, now=now + 60) == {"checked": 2, "changed": 1, "full": True}
+    assert latest(store) == {1: 12, 2: 5}
+    assert np.array_equal(MetricStore(str(tmp_path)).columns(["id"])["id"], np.array([2, 1, 1]))
+
+
+def test_incremental_harvest_stops_at_old_quiet_articles(tmp_path):
+    store = MetricStore(str(tmp_path))
+    old = "2020-01-01T00:00:00Z"
+    publisher = FakePublisher([_article(3, 1, "2026-01-10T00:00:00Z"), _article(2, 1, old), _article(1, 1, old)])
+    now = 1_768_000_000  # 2026-01-10 前后
+    harvest(publisher, store, full=True, now=now)
+    assert harvest(publisher, store, full=False, now=now + 60)["checked"] == 1
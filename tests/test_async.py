@@ -0,0 +1,53 @@
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from devto_async import AsyncDevToPublisher  # noqa: E402
+from devto_breaker import CircuitBreakers  # noqa: E402
+from devto_ledger import Ledger  # noqa: E402
+
+
+def test_ledger_steps_run_off_the_event_loop(tmp_path, server):
+    ledger = Ledger(str(tmp_path / "ledger.db"))
+    threads = []
+    claim = ledger.claim
+    ledger.claim = lambda *args: threads.append(threading.current_thread()) or claim(*args)
+
+    async def run():
+        async with AsyncDevToPublisher(api_key="k", api_base=server.url, ledger=ledger) as publisher:
+            first = await publisher.publish_article("Async", "body")
+            second = await publisher.publish_article("Async", "body")
+            return first, second, threading.current_thread()
+
+    first, second, loop_thread = asyncio.run(run())
+    assert (first["status"], second["status"]) == ("success", "skipped")
+    assert threads and loop_thread not in threads
+    ledger.close()
+
+
+def test_iter_articles_stops_with_unavailable_result(server):
+    breakers = CircuitBreakers(min_calls=1, failure_rate=0.5, open_seconds=60)
+    breakers.get("GET /articles/me").record(True, 0.0)
+
+    async def run():
+        outcome = {}
+        async with AsyncDevToPublisher(api_key="k", api_base=server.url, breakers=breakers) as publisher:
+            articles = [a async for a in publisher.iter_articles(outcome=outcome)]
+        return articles, outcome
+
+    articles, outcome = asyncio.run(run())
+    assert articles == []
+    assert outcome["result"]["status"] == "unavailable"
+
+
+def test_iter_articles_pages_through_everything(server):
+    async def run():
+        async with AsyncDevToPublisher(api_key="k", api_base=server.url) as publisher:
+            for i in range(5):
+                await publisher.publish_article(f"Post {i}", "body")
+            return [a["title"] async for a in publisher.iter_articles(per_page=2)]
+
+    assert sorted(asyncio.run(run())) == [f"Post {i}" for i in range(5)]
@@ -0,0 +1,67 @@
+import pytest
+
+from devto_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakers, CircuitOpenError
+from devto_mock import MockServer
+from devto_publisher import DevToPublisher
+
+
+def test_opens_on_failure_rate_after_min_calls():
+    breaker = CircuitBreaker(window=4, min_calls=4, failure_rate=0.5)
+    for failed in (True, False, True):
+        breaker.record(failed, 0.0)
+    assert breaker.state == CLOSED
+    breaker.record(False, 0.0)
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+
+def test_slow_calls_open_the_breaker():
+    breaker = CircuitBreaker(min_calls=2, slow_call_seconds=1.0, slow_call_rate=1.0)
+    breaker.record(False, 2.0)
+    breaker.record(False, 2.0)
+    assert breaker.state == OPEN
+
+
+def test_half_open_probes_close_or_reopen():
+    breaker = CircuitBreaker(min_calls=1, open_seconds=0, probes=2)
+    breaker.record(True, 0.0)
+    assert breaker.allow() and breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()  # 探测名额用完
+    breaker.record(False, 0.0)
+    breaker.record(False, 0.0)
+    assert breaker.state == CLOSED
+
+    breaker.record(True, 0.0)
+    assert breaker.allow()
+    breaker.record(True, 0.0)
+    assert breaker.state == OPEN
+
+
+def test_released_probe_returns_its_slot():
+    breaker = CircuitBreaker(min_calls=1, open_seconds=0, probes=1)
+    breaker.record(True, 0.0)
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.allow()
+
+
+def test_check_raises_with_retry_after():
+    breakers = CircuitBreakers(min_calls=1, open_seconds=30)
+    breakers.check("GET /me").record(True, 0.0)
+    with pytest.raises(CircuitOpenError) as info:
+        breakers.check("GET /me")
+    assert 0 < info.value.retry_after <= 30
+    assert breakers.snapshot()["GET /me"]["state"] == OPEN
+
+
+def test_publisher_returns_unavailable_without_sending():
+    breakers = CircuitBreakers(min_calls=2, open_seconds=60)
+    with MockServer(error_rate=1.0) as server:
+        with DevToPublisher(api_key="k", api_base=server.url, breakers=breakers, max_retries=0) as publisher:
+            publisher.publish_article("A", "body")
+            publisher.publish_article("B", "body")
+            sent = server.state.requests
+            result = publisher.publish_article("C", "body")
+    assert result["status"] == "unavailable" and result["endpoint"] == "POST /articles"
+    assert server.state.requests == sent
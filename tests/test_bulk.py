@@ -0,0 +1,38 @@
+from devto_bulk import publish_many, publish_one
+from devto_models import PublishResult
+from devto_publisher import DevToPublisher
+
+
+def test_results_keep_input_order(server):
+    articles = [{"title": f"Post {i}", "content": "body"} for i in range(8)]
+    with DevToPublisher(api_key="k", api_base=server.url) as publisher:
+        results = publish_many(publisher, articles, workers=4)
+    assert [r["title"] for r in results] == [a["title"] for a in articles]
+    assert all(r["status"] == "success" and r["elapsed"] >= 0 for r in results)
+    assert len({r["id"] for r in results}) == len(articles)
+
+
+def test_invalid_articles_are_not_sent(server):
+    articles = [{"title": "Good", "content": "body"}, {"title": "", "content": "body"}]
+    with DevToPublisher(api_key="k", api_base=server.url) as publisher:
+        results = publish_many(publisher, articles, workers=2)
+    assert [r["status"] for r in results] == ["success", "invalid"]
+    assert results[1]["elapsed"] == 0.0
+    assert len(server.state.articles) == 1
+
+
+def test_records_mode_returns_publish_results(server):
+    with DevToPublisher(api_key="k", api_base=server.url) as publisher:
+        results = publish_many(publisher, [{"title": "Post", "content": "body"}], workers=1, records=True)
+    assert isinstance(results[0], PublishResult)
+    assert results[0]["status"] == "success" and results[0].elapsed is not None
+
+
+def test_publish_one_turns_exceptions_into_errors():
+    class Broken:
+        def publish_article(self, **kwargs):
+            raise RuntimeError("boom")
+
+    result = publish_one(Broken(), {"title": "Post", "content": "body"})
+    assert result["status"] == "error" and result["message"] == "boom"
+    assert "elapsed" in result
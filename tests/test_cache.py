@@ -0,0 +1,51 @@
+from devto_cache import ResponseCache
+from devto_publisher import DevToPublisher
+
+
+def test_fresh_entries_skip_the_request(server):
+    cache = ResponseCache(ttl=60)
+    with DevToPublisher(api_key="k", api_base=server.url, cache=cache) as publisher:
+        assert publisher.get_user()["username"] == publisher.get_user()["username"]
+    assert server.state.requests == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_expired_entries_revalidate_with_etag(server):
+    cache = ResponseCache(ttl=-1)
+    with DevToPublisher(api_key="k", api_base=server.url, cache=cache) as publisher:
+        first = publisher.get_user()
+        second = publisher.get_user()
+    assert second is first  # 304 时复用缓存对象
+    assert server.state.requests == 2
+    assert cache.stats()["revalidated"] == 1
+
+
+def test_accounts_sharing_a_cache_do_not_see_each_other(server):
+    cache = ResponseCache(ttl=60)
+    with DevToPublisher(api_key="a", api_base=server.url, cache=cache) as a, \
+            DevToPublisher(api_key="b", api_base=server.url, cache=cache) as b:
+        a.get_user()
+        b.get_user()
+    assert server.state.requests == 2
+    assert cache.stats()["size"] == 2
+    assert all(key[2] not in ("a", "b") for key in cache._entries)  # 只保存 Key 的哈希
+
+
+def test_publish_invalidates_listings(server):
+    cache = ResponseCache(ttl=60)
+    with DevToPublisher(api_key="k", api_base=server.url, cache=cache) as publisher:
+        assert publisher.get_articles() == []
+        publisher.publish_article("New", "body")
+        assert [a["title"] for a in publisher.get_articles()] == ["New"]
+
+
+def test_lru_eviction():
+    cache = ResponseCache(max_entries=2)
+    keys = [cache.make_key(f"/p{i}") for i in range(3)]
+    cache.put(keys[0], 0)
+    cache.put(keys[1], 1)
+    cache.get(keys[0])
+    cache.put(keys[2], 2)
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]).data == 0
+    assert cache.stats()["evictions"] == 1
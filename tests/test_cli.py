@@ -0,0 +1,30 @@
+import json
+
+import devto_cli
+
+
+def _lines(capsys):
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_unreadable_files_are_reported_and_batch_continues(tmp_path, capsys):
+    good = tmp_path / "good.md"
+    good.write_text("# Good\n\nbody\n", encoding="utf-8")
+    latin = tmp_path / "latin.md"
+    latin.write_bytes("# Caf\xe9\n".encode("latin-1"))
+    missing = tmp_path / "missing.md"
+
+    code = devto_cli.main(["publish", str(missing), str(latin), str(good), "--dry-run"])
+    records = _lines(capsys)
+    assert code == devto_cli.EXIT_FAILED
+    assert [(r["status"], r["path"]) for r in records] == [
+        ("error", str(missing)), ("error", str(latin)), ("dry_run", str(good)),
+    ]
+    assert all(r["error"] for r in records[:2])
+
+
+def test_update_with_missing_file_emits_error(tmp_path, capsys):
+    code = devto_cli.main(["update", "1", str(tmp_path / "missing.md"), "--dry-run"])
+    (record,) = _lines(capsys)
+    assert code == devto_cli.EXIT_FAILED
+    assert record["status"] == "error"
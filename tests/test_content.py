@@ -0,0 +1,36 @@
+import json
+
+from devto_content import list_collections, load_collection
+
+
+def _store(tmp_path, body="# Hello\n\nbody\n"):
+    (tmp_path / "post.md").write_text(body, encoding="utf-8")
+    (tmp_path / "empty.md").write_bytes(b"")
+    index = {"demo": [
+        {"title": "Hello", "tags": ["python"], "file": "post.md"},
+        {"title": "Empty", "tags": [], "file": "empty.md"},
+    ]}
+    (tmp_path / "index.json").write_text(json.dumps(index), encoding="utf-8")
+    return str(tmp_path)
+
+
+def test_body_is_read_on_first_access(tmp_path):
+    articles = load_collection("demo", _store(tmp_path))
+    assert [a["title"] for a in articles] == ["Hello", "Empty"]
+    assert not articles[0].loaded
+    assert articles[0]["content"] == "# Hello\n\nbody\n"
+    assert articles[0].loaded
+    assert articles[1]["content"] == ""
+
+
+def test_behaves_like_article_dict(tmp_path):
+    article = load_collection("demo", _store(tmp_path))[0]
+    assert dict(article) == {"title": "Hello", "content": "# Hello\n\nbody\n", "tags": ["python"]}
+    assert article.get("description") is None
+
+
+def test_bundled_collections_load():
+    assert {"agent_li", "topics"} <= set(list_collections())
+    for name in ("agent_li", "topics"):
+        articles = load_collection(name)
+        assert articles and all(a["title"] and a["content"] for a in articles)
@@ -0,0 +1,29 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import devto_dedup  # noqa: E402
+from devto_dedup import DuplicateIndex, shingles  # noqa: E402
+
+TEXT = " ".join(f"word{i}" for i in range(3000))
+
+
+def test_chunked_signature_matches_single_pass(monkeypatch):
+    index = DuplicateIndex()
+    values = shingles(TEXT)
+    expected = ((index._a[:, None] * values[None, :] + index._b[:, None]) >> np.uint64(32)).min(axis=1)
+    monkeypatch.setattr(devto_dedup, "SIGNATURE_CHUNK", 7)
+    assert np.array_equal(index.signature(TEXT), expected.astype(np.uint32))
+
+
+def test_empty_text_signature():
+    index = DuplicateIndex()
+    assert (index.signature("") == 0xFFFFFFFF).all()
+
+
+def test_near_duplicate_is_found():
+    index = DuplicateIndex()
+    index.add("original", TEXT)
+    assert index.query(TEXT + " one more sentence here")[0][0] == "original"
+    assert index.query(" ".join(f"other{i}" for i in range(500))) == []
+    assert index.query(TEXT, exclude="original") == []
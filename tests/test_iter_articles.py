@@ -0,0 +1,51 @@
+import pytest
+import requests
+
+from devto_models import Article
+from devto_publisher import DevToPublisher
+
+
+def _fill(server, count):
+    for i in range(count):
+        server.state.create({"title": f"Post {i}", "body_markdown": "body", "published": True})
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iterates_every_page(server, prefetch):
+    _fill(server, 7)
+    with DevToPublisher(api_key="k", api_base=server.url) as publisher:
+        ids = [a["id"] for a in publisher.iter_articles(per_page=3, prefetch=prefetch)]
+    assert ids == list(range(7, 0, -1))
+
+
+def test_exact_multiple_of_page_size_stops_on_empty_page(server):
+    _fill(server, 4)
+    with DevToPublisher(api_key="k", api_base=server.url) as publisher:
+        assert len(list(publisher.iter_articles(per_page=2))) == 4
+    # 2 页满页 + 1 个空页
+    assert server.state.requests == 3
+
+
+def test_stopping_early_fetches_at_most_one_extra_page(server):
+    _fill(server, 10)
+    with DevToPublisher(api_key="k", api_base=server.url) as publisher:
+        articles = publisher.iter_articles(per_page=2)
+        first = next(articles)
+        articles.close()
+    assert first["id"] == 10
+    assert server.state.requests <= 2
+
+
+def test_records_mode_yields_articles(server):
+    _fill(server, 2)
+    with DevToPublisher(api_key="k", api_base=server.url) as publisher:
+        records = list(publisher.iter_articles(records=True))
+    assert all(isinstance(r, Article) for r in records)
+    assert records[0].body_markdown is None
+
+
+def test_http_errors_propagate(server):
+    server.state.error_rate = 1.0
+    with DevToPublisher(api_key="k", api_base=server.url, max_retries=0) as publisher:
+        with pytest.raises(requests.HTTPError):
+            list(publisher.iter_articles(prefetch=False))
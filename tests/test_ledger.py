@@ -0,0 +1,82 @@
+import threading
+from http.client import RemoteDisconnected
+
+import pytest
+import requests
+from urllib3.exceptions import ProtocolError
+
+from devto_ledger import Ledger
+from devto_publisher import DevToPublisher
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    with Ledger(str(tmp_path / "ledger.db")) as ledger:
+        yield ledger
+
+
+def test_claim_is_exclusive_until_released(ledger):
+    assert ledger.claim("post", "h1")
+    assert not ledger.claim("post", "h1")
+    assert ledger.find_by_key("post") is None  # 占位行不对外可见
+    ledger.release("post")
+    assert ledger.claim("post", "h1")
+
+
+def test_stale_claim_can_be_taken_over(ledger):
+    assert ledger.claim("post", "h1")
+    assert not ledger.claim("post", "h2", claim_seconds=600)
+    assert ledger.claim("post", "h2", claim_seconds=-1)
+
+
+def test_release_keeps_recorded_rows(ledger):
+    assert ledger.claim("post", "h1")
+    ledger.record("post", "h1", 7, "https://dev.to/x")
+    ledger.release("post")
+    assert ledger.find_by_key("post")["id"] == 7
+    assert not ledger.claim("post", "h2")
+
+
+def test_concurrent_publishes_send_one_request(ledger, server):
+    results = []
+    with DevToPublisher(api_key="k", api_base=server.url, ledger=ledger) as publisher:
+        threads = [
+            threading.Thread(target=lambda: results.append(publisher.publish_article("Race", "body")))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    statuses = sorted(r["status"] for r in results)
+    assert statuses.count("success") == 1
+    assert set(statuses) <= {"success", "pending", "skipped"}
+
+
+def test_connection_reset_after_send_keeps_claim(ledger, server, monkeypatch):
+    with DevToPublisher(api_key="k", api_base=server.url, ledger=ledger) as publisher:
+        def reset(*args, **kwargs):
+            raise requests.ConnectionError(ProtocolError("Connection aborted.", RemoteDisconnected("closed")))
+
+        monkeypatch.setattr(publisher.session, "request", reset)
+        assert publisher.publish_article("Lost", "body")["status"] == "error"
+        monkeypatch.undo()
+        # 服务端可能已经创建：占位保留，不会再发一篇
+        assert publisher.publish_article("Lost", "body")["status"] == "pending"
+
+
+def test_refused_connection_releases_claim(ledger):
+    with DevToPublisher(api_key="k", api_base="http://127.0.0.1:9", ledger=ledger, max_retries=0) as publisher:
+        assert publisher.publish_article("Refused", "body")["status"] == "error"
+    assert ledger.claim("refused", "h")
+
+
+def test_async_publisher_keeps_claim_unless_connection_failed():
+    aiohttp = pytest.importorskip("aiohttp")
+    from devto_async import AsyncDevToPublisher
+    from devto_breaker import CircuitOpenError
+
+    publisher = AsyncDevToPublisher(api_key="k")
+    assert publisher._not_sent(CircuitOpenError("POST /articles", 1.0))
+    assert not publisher._not_sent(aiohttp.ServerDisconnectedError())
+    assert not publisher._not_sent(aiohttp.ServerTimeoutError())
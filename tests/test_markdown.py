@@ -0,0 +1,57 @@
+from devto_markdown import _split_cells, normalize_markdown
+
+
+def test_only_common_indent_is_removed():
+    text = "    $ pip install x\n\nSome text\n\n    indented code\n- list\n    - nested\n"
+    assert normalize_markdown(text) == text
+
+
+def test_triple_quoted_body_is_dedented():
+    text = "\n    # Title\n\n    - list\n        - nested\n"
+    assert normalize_markdown(text) == "# Title\n\n- list\n    - nested\n"
+
+
+def test_no_embed_inside_indented_code():
+    text = "Example:\n\n    https://github.com/user/repo\n\nhttps://github.com/user/repo\n"
+    assert normalize_markdown(text) == (
+        "Example:\n\n    https://github.com/user/repo\n\n{% embed https://github.com/user/repo %}\n"
+    )
+
+
+def test_list_continuation_is_not_code():
+    text = "- item\n\n    https://github.com/user/repo\n"
+    assert "{% embed https://github.com/user/repo %}" in normalize_markdown(text)
+
+
+def test_pipes_inside_inline_code_do_not_split_cells():
+    assert _split_cells("| `x|y` | b |") == ["`x|y`", "b"]
+    assert _split_cells("| ``a|`b`` | c \\| d |") == ["``a|`b``", "c \\| d"]
+    assert normalize_markdown("| a | b |\n|---|---|\n| `x|y` | z |\n") == (
+        "| a | b |\n| --- | --- |\n| `x|y` | z |\n"
+    )
+
+
+def test_unclosed_backtick_still_splits():
+    assert _split_cells("| `a | b |") == ["`a", "b"]
+
+
+def test_only_github_repos_and_gists_are_embedded():
+    text = (
+        "https://github.com/user/repo\n\n"
+        "https://gist.github.com/user/abc123\n\n"
+        "https://github.com/user/repo/blob/main/README.md\n\n"
+        "https://github.com/user/repo/issues/1\n\n"
+        "https://github.com/user\n"
+    )
+    assert normalize_markdown(text) == (
+        "{% embed https://github.com/user/repo %}\n\n"
+        "{% embed https://gist.github.com/user/abc123 %}\n\n"
+        "https://github.com/user/repo/blob/main/README.md\n\n"
+        "https://github.com/user/repo/issues/1\n\n"
+        "https://github.com/user\n"
+    )
+
+
+def test_embeds_can_be_disabled():
+    text = "https://github.com/user/repo\n"
+    assert normalize_markdown(text, embeds=False) == text
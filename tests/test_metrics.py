@@ -0,0 +1,57 @@
+from devto_metrics import Histogram, Metrics, endpoint_label
+from devto_mock import MockServer
+from devto_publisher import DevToPublisher
+
+
+def test_endpoint_label_collapses_ids():
+    assert endpoint_label("PUT", "/articles/123") == "PUT /articles/{id}"
+    assert endpoint_label("GET", "/articles/me") == "GET /articles/me"
+
+
+def test_histogram_quantiles_use_bucket_bounds():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 5.0):
+        histogram.observe(value)
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1.0
+    assert histogram.quantile(1.0) == float("inf")
+
+
+def test_publisher_records_status_and_bytes(server):
+    metrics = Metrics()
+    with DevToPublisher(api_key="k", api_base=server.url, metrics=metrics) as publisher:
+        article_id = publisher.publish_article("Post", "body")["id"]
+        publisher.update_article(article_id, body_markdown="new body")
+    snapshot = metrics.snapshot()
+    assert snapshot["POST /articles"]["status"] == {"201": 1}
+    assert snapshot["PUT /articles/{id}"]["status"] == {"200": 1}
+    assert snapshot["POST /articles"]["bytes_out"] > 0 and snapshot["POST /articles"]["bytes_in"] > 0
+    assert snapshot["POST /articles"]["latency"]["total"]["count"] == 1
+
+
+def test_retries_are_counted():
+    metrics = Metrics()
+    with MockServer(error_rate=1.0) as server:
+        with DevToPublisher(api_key="k", api_base=server.url, metrics=metrics, max_retries=1) as publisher:
+            publisher.get_user()
+    endpoint = metrics.snapshot()["GET /me"]
+    assert endpoint["status"] == {"503": 2}
+    assert endpoint["retries"] == 1
+    assert endpoint["latency"]["backoff"]["count"] == 1
+
+
+def test_connection_errors_are_counted():
+    metrics = Metrics()
+    with DevToPublisher(api_key="k", api_base="http://127.0.0.1:9", metrics=metrics, max_retries=0) as publisher:
+        assert "error" in publisher.get_user()
+    assert metrics.snapshot()["GET /me"]["errors"] == {"ConnectionError": 1}
+
+
+def test_prometheus_export(tmp_path):
+    metrics = Metrics()
+    metrics.observe_response("GET /me", 200, 0.02, 0.01, 0, 10)
+    path = tmp_path / "devto.prom"
+    metrics.write_prometheus(str(path))
+    text = path.read_text(encoding="utf-8")
+    assert 'devto_responses_total{endpoint="GET /me",code="200"} 1' in text
+    assert 'devto_request_duration_seconds_bucket{endpoint="GET /me",phase="total",le="+Inf"} 1' in text
@@ -0,0 +1,49 @@
+import requests
+
+from devto_bench import measure, percentile, run_benchmarks
+from devto_mock import MockServer
+
+
+def test_percentile_is_nearest_rank():
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([], 50) == 0.0
+
+
+def test_measure_counts_errors_and_exceptions():
+    def op(i):
+        if i == 0:
+            raise ValueError("boom")
+        return i % 2 == 0
+
+    report = measure(op, 10, workers=2)
+    assert report["calls"] == 10
+    assert report["errors"] == 6  # 0 抛异常 + 5 个奇数
+
+
+def test_mock_supports_conditional_get(server):
+    headers = {"api-key": "k"}
+    first = requests.get(server.url + "/me", headers=headers)
+    assert first.status_code == 200 and first.headers["ETag"]
+    second = requests.get(server.url + "/me", headers={**headers, "If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 304
+
+
+def test_mock_injects_rate_limits():
+    with MockServer(rate_limit_rate=1.0, retry_after=3) as server:
+        response = requests.get(server.url + "/me", headers={"api-key": "k"})
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "3"
+
+
+def test_mock_rejects_missing_api_key(server):
+    assert requests.post(server.url + "/articles", json={"article": {"title": "x"}}).status_code == 401
+
+
+def test_run_benchmarks_reports_every_operation():
+    report = run_benchmarks(count=4, workers=2)
+    assert set(report["results"]) == {"publish_article", "update_article", "get_articles", "publish_all"}
+    assert all(r["errors"] == 0 for r in report["results"].values())
+    assert report["server_requests"] > 0
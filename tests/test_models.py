@@ -0,0 +1,50 @@
+import pytest
+
+from devto_models import Article, PublishResult, to_results
+
+API_ARTICLE = {
+    "id": 7, "title": "Post", "url": "https://dev.to/x/post-7", "published_at": "2026-01-01T00:00:00Z",
+    "tag_list": "python, web", "page_views_count": 12, "public_reactions_count": 3,
+    "comments_count": None, "body_markdown": "body", "reading_time_minutes": 2,
+}
+
+
+def test_article_reads_api_field_names():
+    article = Article.from_api(API_ARTICLE)
+    assert article["tag_list"] == ("python", "web")
+    assert article["page_views_count"] == 12 and article.reactions == 3 and article.comments == 0
+    assert article.published is True
+    assert article.get("body_markdown") is None  # 默认不保留正文
+    assert article.get("reading_time_minutes", 0) == 0
+    with pytest.raises(KeyError):
+        article["reading_time_minutes"]
+
+
+def test_article_keeps_body_and_raw_on_request():
+    article = Article.from_api(API_ARTICLE, body=True, raw=True)
+    assert article["body_markdown"] == "body"
+    assert article["reading_time_minutes"] == 2
+    assert article.to_dict()["tags"] == ["python", "web"]
+
+
+def test_tags_are_interned():
+    a = Article.from_api({"id": 1, "tag_list": ["py" + "thon"]})
+    b = Article.from_api({"id": 2, "tag_list": "".join(["py", "thon"])})
+    assert a.tags[0] is b.tags[0]
+
+
+def test_article_has_no_instance_dict():
+    assert not hasattr(Article.from_api(API_ARTICLE), "__dict__")
+
+
+def test_publish_result_round_trip():
+    data = {"status": "skipped", "id": 3, "url": "u", "title": "T", "elapsed": 0.1, "reason": "unchanged"}
+    result = PublishResult.from_dict(data)
+    assert result.ok and result["reason"] == "unchanged" and "reason" in result
+    assert result.to_dict() == data
+
+
+def test_legacy_error_dict_and_missing_entries():
+    results = to_results([{"error": "No API key provided"}, None])
+    assert results[0].status == "error" and not results[0].ok
+    assert results[1] is None
@@ -0,0 +1,38 @@
+import os
+
+from devto_pipeline import common_root, run_pipeline
+from devto_sync import scan_markdown
+
+
+def _write(path, title):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"---\ntitle: {title}\n---\n\nbody of {title}\n")
+
+
+def test_same_filename_in_different_directories_gets_distinct_keys(tmp_path):
+    paths = [str(tmp_path / "a" / "post.md"), str(tmp_path / "b" / "post.md")]
+    for i, path in enumerate(paths):
+        _write(path, f"Post {i}")
+    results = run_pipeline(None, paths, processes=1)["results"]
+    assert [r["key"] for r in results] == [os.path.join("a", "post.md"), os.path.join("b", "post.md")]
+
+
+def test_default_keys_match_sync_of_common_directory(tmp_path):
+    for rel in ("top.md", os.path.join("sub", "nested.md")):
+        _write(str(tmp_path / rel), rel)
+    paths = [str(tmp_path / "top.md"), str(tmp_path / "sub" / "nested.md")]
+    results = run_pipeline(None, paths, processes=1)["results"]
+    assert sorted(r["key"] for r in results) == sorted(rel for rel, _ in scan_markdown(str(tmp_path)))
+
+
+def test_explicit_root(tmp_path):
+    path = str(tmp_path / "sub" / "post.md")
+    _write(path, "Post")
+    results = run_pipeline(None, [path], processes=1, root=str(tmp_path))["results"]
+    assert results[0]["key"] == os.path.join("sub", "post.md")
+
+
+def test_common_root_ignores_article_dicts(tmp_path):
+    assert common_root([{"title": "x"}]) == os.curdir
+    assert common_root([str(tmp_path / "a" / "x.md"), {"title": "x"}]) == str(tmp_path / "a")
@@ -0,0 +1,67 @@
+import json
+import threading
+import time
+
+from devto_bulk import publish_many
+from devto_profile import Profiler, compare
+from devto_publisher import DevToPublisher
+
+
+def test_nested_stages_and_wait_split():
+    profiler = Profiler(cpu=False, memory=False)
+    with profiler:
+        with profiler.stage("outer"):
+            with profiler.stage("inner"):
+                with profiler.wait("network"):
+                    time.sleep(0.05)
+            with profiler.wait("throttle"):
+                time.sleep(0.02)
+    stages = profiler.report()["stages"]
+    assert set(stages) == {"outer", "outer/inner"}
+    assert stages["outer/inner"]["network_wait"] >= 0.04
+    # 内层的等待计入外层
+    assert stages["outer"]["network_wait"] >= stages["outer/inner"]["network_wait"]
+    assert stages["outer"]["throttle_wait"] >= 0.01 and stages["outer/inner"]["throttle_wait"] == 0
+
+
+def test_stages_are_per_thread():
+    profiler = Profiler(cpu=False, memory=False)
+
+    def work():
+        with profiler.stage("task"):
+            time.sleep(0.01)
+
+    with profiler:
+        with profiler.stage("main"):
+            thread = threading.Thread(target=work)
+            thread.start()
+            thread.join()
+    assert set(profiler.report()["stages"]) == {"main", "task"}
+
+
+def test_publisher_stages_and_snapshots(server, tmp_path):
+    profiler = Profiler(snapshot_on=("publish_article",), snapshot_every=2)
+    articles = [{"title": f"Post {i}", "content": "body"} for i in range(4)]
+    with profiler:
+        with DevToPublisher(api_key="k", api_base=server.url, profiler=profiler) as publisher:
+            publish_many(publisher, articles, workers=2)
+    report = profiler.write(str(tmp_path / "profile.json"))
+    assert report["stages"]["publish_article"]["count"] == 4
+    assert report["stages"]["publish_article/http"]["network_wait"] > 0
+    assert "publish_article/prepare" in report["stages"]
+    labels = [s["label"] for s in report["memory"]["snapshots"]]
+    assert labels[0] == "start" and labels[-1] == "stop"
+    assert sorted(labels[1:-1]) == ["publish_article#2", "publish_article#4"]
+    assert report["cpu"]["functions"] > 0
+    with open(tmp_path / "profile.json", encoding="utf-8") as f:
+        assert json.load(f)["stages"] == report["stages"]
+
+
+def test_compare_reports_relative_changes():
+    old = {"stages": {"a": {"count": 1, "wall": 1.0}}, "memory": {"peak": 100}}
+    new = {"stages": {"a": {"count": 1, "wall": 2.0}, "b": {"count": 1}}, "memory": {"peak": 100}}
+    rows = {(r["stage"], r["field"]): r["change"] for r in compare(old, new, threshold=0.1)}
+    assert rows[("a", "wall")] == 1.0
+    assert ("a", "count") not in rows
+    assert rows[("b", "count")] is None
+    assert not any(stage == "(memory)" for stage, _ in rows)
@@ -0,0 +1,67 @@
+import time
+
+import pytest
+
+from devto_ratelimit import DEFAULT_MAX_RATE, TokenBucket, parse_retry_after
+
+
+def test_reward_climbs_past_initial_rate_up_to_ceiling():
+    bucket = TokenBucket(rate=3, rate_step=1)
+    for _ in range(100):
+        bucket.reward()
+    assert bucket.rate == DEFAULT_MAX_RATE
+
+
+def test_explicit_max_rate():
+    bucket = TokenBucket(rate=3, max_rate=4, rate_step=1)
+    for _ in range(10):
+        bucket.reward()
+    assert bucket.rate == 4
+
+
+def test_penalize_halves_rate():
+    bucket = TokenBucket(rate=8, min_rate=1)
+    bucket.penalize()
+    assert bucket.rate == 4
+    for _ in range(10):
+        bucket.penalize()
+    assert bucket.rate == 1
+
+
+def test_headers_do_not_undo_penalize():
+    bucket = TokenBucket(rate=8)
+    bucket.penalize()
+    bucket.update_from_headers({"X-RateLimit-Remaining": "100", "X-RateLimit-Reset": "10"})
+    assert bucket.rate == 4
+
+
+def test_headers_lower_rate_and_ceiling_recovers():
+    bucket = TokenBucket(rate=8, max_rate=8, rate_step=1)
+    bucket.update_from_headers({"X-RateLimit-Remaining": "4", "X-RateLimit-Reset": "2"})
+    assert bucket.rate == 2
+    bucket.reward()
+    assert bucket.rate == 3
+    for _ in range(20):
+        bucket.reward()
+    assert bucket.rate == 8
+
+
+def test_exhausted_headers_block():
+    bucket = TokenBucket(rate=100, burst=5)
+    bucket.update_from_headers({"RateLimit-Remaining": "0", "RateLimit-Reset": "30"})
+    assert bucket.try_acquire() > 25
+
+
+def test_burst_then_wait():
+    bucket = TokenBucket(rate=1, burst=2)
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == pytest.approx(1, abs=0.05)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("5") == 5
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+    when = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime(time.time() + 60))
+    assert 50 < parse_retry_after(when) <= 60
@@ -0,0 +1,73 @@
+import time
+
+import pytest
+
+from devto_publisher import DevToPublisher
+from devto_scheduler import ScheduleStore, SchedulerDaemon, to_timestamp
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ScheduleStore(str(tmp_path / "schedule.db"))
+    yield store
+    store.close()
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_claim_is_exclusive_and_respects_due_time(store):
+    due = store.enqueue({"title": "Now", "content": "body"}, time.time() - 1)
+    later = store.enqueue({"title": "Later", "content": "body"}, time.time() + 3600)
+    assert store.claim(due, "a")["title"] == "Now"
+    assert store.claim(due, "b") is None
+    assert store.claim(later, "a") is None
+
+
+def test_recover_only_takes_expired_leases(store):
+    held = store.enqueue({"title": "Held"}, 0)
+    expired = store.enqueue({"title": "Expired"}, 0)
+    store.claim(held, "a", lease_seconds=600)
+    store.claim(expired, "b", lease_seconds=-1)
+    assert store.recover(requeue=True) == 1
+    assert store.counts() == {"running": 1, "pending": 1}
+    assert store.pending() == [(0.0, expired)]
+
+
+def test_recover_without_ledger_marks_unknown(store):
+    task = store.enqueue({"title": "Lost"}, 0)
+    store.claim(task, "a", lease_seconds=-1)
+    store.recover(requeue=False)
+    assert store.counts() == {"unknown": 1}
+
+
+def test_to_timestamp_accepts_iso_strings():
+    assert to_timestamp("1970-01-01T00:00:00+00:00") == 0.0
+    assert to_timestamp(5) == 5.0
+
+
+def test_daemon_publishes_due_tasks(store, server):
+    with DevToPublisher(api_key="k", api_base=server.url) as publisher:
+        daemon = SchedulerDaemon(publisher, store, workers=2, refresh_interval=None).start()
+        try:
+            daemon.schedule({"title": "Soon", "content": "body"}, time.time() + 0.1)
+            assert _wait_for(lambda: store.counts().get("done") == 1)
+        finally:
+            daemon.stop()
+    assert [a["title"] for a in server.state.articles.values()] == ["Soon"]
+
+
+def test_daemon_picks_up_tasks_added_by_other_processes(store, server):
+    with DevToPublisher(api_key="k", api_base=server.url) as publisher:
+        daemon = SchedulerDaemon(publisher, store, refresh_interval=0.1).start()
+        try:
+            store.enqueue({"title": "External", "content": "body"}, time.time())
+            assert _wait_for(lambda: store.counts().get("done") == 1)
+        finally:
+            daemon.stop()
@@ -0,0 +1,64 @@
+import pytest
+
+from devto_publisher import DevToPublisher
+from devto_search import SearchIndex, published_key, update_index
+
+DOCS = [
+    ("a", "GitHub Actions 自动部署 静态网站", "GitHub Actions 入门", "markdown"),
+    ("b", "用 Python 写一个命令行工具", "Python CLI", "markdown"),
+    ("c", "Docker 镜像 自动部署 到服务器", "Docker 部署", "topics"),
+]
+
+
+@pytest.fixture
+def index():
+    index = SearchIndex(path=None)
+    index.add_many(DOCS)
+    return index
+
+
+def test_ranks_by_bm25_and_filters_by_source(index):
+    hits = index.search("自动部署 GitHub")
+    assert [h["key"] for h in hits] == ["a", "c"]
+    assert hits[0]["score"] > hits[1]["score"]
+    assert [h["key"] for h in index.search("自动部署", source="topics")] == ["c"]
+    assert index.search("自动部署", source="nowhere") == []
+
+
+def test_unchanged_content_is_not_reindexed(index):
+    assert not index.add(*DOCS[0])
+    assert index.add("a", "Kubernetes 集群", "K8s", "markdown")
+    assert [h["key"] for h in index.search("GitHub")] == []
+    assert [h["key"] for h in index.search("Kubernetes")] == ["a"]
+
+
+def test_save_merges_deltas_and_drops_removed_docs(index, tmp_path):
+    path = str(tmp_path / "search.npz")
+    index.remove("b")
+    index.save(path)
+    index.add("d", "Rust 异步 运行时", "Rust", "markdown")
+    index.save(path)
+    loaded = SearchIndex(path)
+    assert len(loaded) == 3 and "b" not in loaded
+    assert [h["key"] for h in loaded.search("Rust")] == ["d"]
+    assert [h["key"] for h in loaded.search("自动部署")][0] in ("a", "c")
+    assert loaded.search("Python") == []
+
+
+def test_publisher_indexes_published_articles(server):
+    index = SearchIndex(path=None)
+    with DevToPublisher(api_key="k", api_base=server.url, search=index) as publisher:
+        result = publisher.publish_article("Vector search", "An inverted index with BM25 ranking")
+    assert [h["key"] for h in index.search("inverted index")] == [published_key(result["id"])]
+
+
+def test_update_index_removes_deleted_markdown(tmp_path):
+    (tmp_path / "keep.md").write_text("# Keep\n\nzebra", encoding="utf-8")
+    (tmp_path / "gone.md").write_text("# Gone\n\nzebra", encoding="utf-8")
+    (tmp_path / "bad.md").write_bytes(b"\xff")
+    index = SearchIndex(path=None)
+    first = update_index(index, str(tmp_path))
+    assert [s["path"] for s in first["skipped"]] == ["bad.md"]
+    (tmp_path / "gone.md").unlink()
+    assert update_index(index, str(tmp_path))["removed"] == 1
+    assert [h["key"] for h in index.search("zebra")] == ["markdown:keep.md"]
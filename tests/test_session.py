@@ -0,0 +1,46 @@
+import threading
+
+from devto_publisher import DevToPublisher
+
+
+def _count_connections(server):
+    connections = []
+    process_request = server.httpd.process_request
+
+    def counting(request, client_address):
+        connections.append(client_address)
+        return process_request(request, client_address)
+
+    server.httpd.process_request = counting
+    return connections
+
+
+def test_calls_reuse_one_connection(server):
+    connections = _count_connections(server)
+    with DevToPublisher(api_key="k", api_base=server.url) as publisher:
+        for _ in range(5):
+            assert publisher.get_user()["username"]
+    assert len(connections) == 1
+
+
+def test_keep_alive_can_be_disabled(server):
+    connections = _count_connections(server)
+    with DevToPublisher(api_key="k", api_base=server.url, keep_alive=False) as publisher:
+        for _ in range(3):
+            publisher.get_user()
+    assert len(connections) == 3
+
+
+def test_session_is_shared_across_threads(server):
+    connections = _count_connections(server)
+    with DevToPublisher(api_key="k", api_base=server.url, pool_size=2) as publisher:
+        def work():
+            for _ in range(5):
+                publisher.get_user()
+
+        threads = [threading.Thread(target=work) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert len(connections) <= 2
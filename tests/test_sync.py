@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+import devto_sync
+from devto_ledger import Ledger
+from devto_mock import MockServer
+from devto_publisher import DevToPublisher
+from devto_sync import sync_directory
+
+
+@pytest.fixture
+def publisher(tmp_path):
+    server = MockServer().start()
+    with Ledger(str(tmp_path / "ledger.db")) as ledger:
+        with DevToPublisher(api_key="k", api_base=server.url, ledger=ledger) as publisher:
+            publisher.server_state = server.state
+            yield publisher
+    server.stop()
+
+
+def _write(directory, rel, text):
+    with open(os.path.join(directory, rel), "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def test_update_without_tags_keeps_remote_tags(tmp_path, publisher):
+    articles = tmp_path / "articles"
+    articles.mkdir()
+    _write(str(articles), "post.md", "---\ntitle: Post\ntags: python, docker\n---\n\nfirst\n")
+    assert sync_directory(publisher, str(articles))["published"] == ["post.md"]
+
+    _write(str(articles), "post.md", "---\ntitle: Post\n---\n\nsecond version\n")
+    assert sync_directory(publisher, str(articles))["updated"] == ["post.md"]
+    (remote,) = publisher.server_state.articles.values()
+    assert remote["tag_list"] == ["python", "docker"]
+    assert "second version" in remote["body_markdown"]
+
+
+def test_update_refreshes_ledger_hash(tmp_path, publisher):
+    articles = tmp_path / "articles"
+    articles.mkdir()
+    _write(str(articles), "post.md", "---\ntitle: Post\ntags: python\n---\n\nfirst\n")
+    sync_directory(publisher, str(articles))
+    _write(str(articles), "post.md", "---\ntitle: Post\ntags: python\n---\n\nsecond version\n")
+    sync_directory(publisher, str(articles))
+
+    # 同一内容再走发布路径：账本哈希已是最新，直接跳过
+    result = publisher.publish_article("Post", "\nsecond version\n", ["python"], key="post.md")
+    assert result["status"] == "skipped"
+    assert len(publisher.server_state.articles) == 1
+
+
+def test_unreadable_file_is_reported_per_file(tmp_path, publisher, monkeypatch):
+    articles = tmp_path / "articles"
+    articles.mkdir()
+    _write(str(articles), "good.md", "# Good\n\nbody\n")
+    _write(str(articles), "gone.md", "# Gone\n\nbody\n")
+
+    def deleted_mid_scan(path, *args, **kwargs):
+        if path.endswith("gone.md"):
+            raise FileNotFoundError(2, "No such file or directory", path)
+        return open(path, *args, **kwargs)
+
+    monkeypatch.setattr(devto_sync, "open", deleted_mid_scan, raising=False)
+    summary = sync_directory(publisher, str(articles))
+    assert summary["published"] == ["good.md"]
+    assert [e["path"] for e in summary["errors"]] == ["gone.md"]
+    assert summary["errors"][0]["result"]["status"] == "error"
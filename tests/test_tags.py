@@ -0,0 +1,38 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from devto_tags import TagSuggester  # noqa: E402
+
+DOCS = [
+    {"title": "Docker compose", "content": "container images and dockerfile tips", "tags": ["docker"]},
+    {"title": "Pytest fixtures", "content": "python testing with pytest and pip", "tags": ["python", "testing"]},
+    {"title": "容器部署", "content": "用容器部署服务", "tags": ["docker"]},
+]
+
+
+def test_suggests_tags_from_corpus():
+    tagger = TagSuggester(path=None)
+    assert tagger.add_documents(DOCS) == 3
+    assert tagger.add_documents(DOCS) == 0
+    assert tagger.suggest("a dockerfile for my container")[0] == "docker"
+    assert "python" in tagger.suggest("pytest fixtures in python")
+
+
+def test_tag_weights_are_sparse():
+    tagger = TagSuggester(path=None)
+    tagger.add_documents(DOCS)
+    docker_terms = len(tagger.tag_tf[tagger._tag_index["docker"]])
+    assert docker_terms < len(tagger.vocab)
+    assert all(not tf for tag, tf in zip(tagger.tags, tagger.tag_tf) if tag == "rust")
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "tags.npz")
+    tagger = TagSuggester(path=None)
+    tagger.add_documents(DOCS)
+    tagger.save(path)
+    loaded = TagSuggester(path)
+    texts = ["dockerfile container", "python pip"]
+    assert loaded.suggest_many(texts) == tagger.suggest_many(texts)
+    assert loaded.add_documents(DOCS) == 0
@@ -0,0 +1,46 @@
+from devto_publisher import DevToPublisher
+from devto_validate import has_errors, validate_article, validate_batch
+
+
+def _fields(problems):
+    return [(p["field"], p["severity"]) for p in problems]
+
+
+def test_valid_article_has_no_problems():
+    assert validate_article({"title": "Hello", "content": "body", "tags": ["python"],
+                             "canonical_url": "https://example.com/post"}) == []
+
+
+def test_all_problems_are_reported_at_once():
+    problems = validate_article({"title": " ", "content": "", "tags": ["c++"], "canonical_url": "ftp://x"})
+    assert _fields(problems) == [("title", "error"), ("content", "error"),
+                                 ("tags", "error"), ("canonical_url", "error")]
+
+
+def test_tag_warnings_do_not_block():
+    problems = validate_article({"title": "T", "content": "b", "tags": ["Python", "a", "b", "c", "d"]})
+    assert _fields(problems) == [("tags", "warning"), ("tags", "warning")]
+    assert not has_errors(problems)
+
+
+def test_partial_only_checks_present_fields():
+    assert validate_article({"body_markdown": "new"}, partial=True) == []
+    assert _fields(validate_article({"body_markdown": ""}, partial=True)) == [("body_markdown", "error")]
+
+
+def test_validate_batch_reports_warnings_but_accepts_them():
+    valid, report = validate_batch([
+        {"title": "Ok", "content": "b"},
+        {"title": "", "content": "b"},
+        {"title": "Warn", "content": "b", "tags": ["Upper"]},
+    ])
+    assert valid == [0, 2]
+    assert [item["index"] for item in report] == [1, 2]
+
+
+def test_publisher_rejects_invalid_articles_without_a_request(server):
+    with DevToPublisher(api_key="k", api_base=server.url) as publisher:
+        published = publisher.publish_article("x" * 200, "body")
+        updated = publisher.update_article(1, title="")
+    assert published["status"] == "invalid" and updated["status"] == "invalid"
+    assert server.state.requests == 0
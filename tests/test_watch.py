@@ -0,0 +1,90 @@
+import os
+import time
+
+import pytest
+
+from devto_publisher import DevToPublisher
+from devto_watch import InotifyWatcher, PollingWatcher, WatchDaemon
+
+
+class FakeWatcher:
+    def __init__(self):
+        self.events = []
+
+    def wait(self, timeout):
+        events, self.events = set(self.events), []
+        if not events and timeout:
+            time.sleep(min(timeout, 0.05))
+        return events
+
+    def close(self):
+        pass
+
+
+def _write(path, text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def test_new_files_become_drafts_and_edits_keep_status(tmp_path, server):
+    _write(tmp_path / "post.md", "# Post\n\nfirst")
+    with DevToPublisher(api_key="k", api_base=server.url) as publisher:
+        daemon = WatchDaemon(publisher, str(tmp_path), debounce=0, watcher=FakeWatcher())
+        assert daemon.push(["post.md"])[0]["status"] == "success"
+        article = next(iter(server.state.articles.values()))
+        assert article["published"] is False
+
+        server.state.articles[article["id"]]["published"] = True  # 作者在网页上发布了
+        _write(tmp_path / "post.md", "# Post\n\nsecond")
+        assert daemon.push(["post.md"])[0]["status"] == "updated"
+        assert daemon.push(["post.md"]) == []  # 内容没变
+    article = server.state.articles[article["id"]]
+    assert article["published"] is True and article["body_markdown"].rstrip().endswith("second")
+    assert len(server.state.articles) == 1
+
+
+def test_debounce_merges_repeated_saves(tmp_path, server):
+    _write(tmp_path / "post.md", "# Post\n\nbody")
+    watcher = FakeWatcher()
+    with DevToPublisher(api_key="k", api_base=server.url) as publisher:
+        daemon = WatchDaemon(publisher, str(tmp_path), debounce=0.2, watcher=watcher)
+        watcher.events = ["post.md"]
+        assert daemon.poll_once(timeout=0) == []
+        watcher.events = ["post.md"]
+        assert daemon.poll_once(timeout=0) == []
+        results = []
+        deadline = time.monotonic() + 2
+        while not results and time.monotonic() < deadline:
+            results = daemon.poll_once(timeout=0.1)
+    assert [r["path"] for r in results] == ["post.md"]
+    assert server.state.requests == 1
+
+
+def test_non_utf8_file_is_reported(tmp_path, server):
+    (tmp_path / "bad.md").write_bytes(b"\xff\xfe")
+    with DevToPublisher(api_key="k", api_base=server.url) as publisher:
+        daemon = WatchDaemon(publisher, str(tmp_path), watcher=FakeWatcher())
+        assert daemon.push(["bad.md"])[0]["status"] == "error"
+
+
+def test_polling_watcher_sees_new_files_in_new_directories(tmp_path):
+    watcher = PollingWatcher(str(tmp_path), interval=0)
+    os.makedirs(tmp_path / "sub")
+    _write(tmp_path / "sub" / "post.md", "x")
+    assert watcher.wait(None) == {os.path.join("sub", "post.md")}
+    assert watcher.wait(None) == set()
+
+
+def test_inotify_watcher_reports_closed_writes(tmp_path):
+    try:
+        watcher = InotifyWatcher(str(tmp_path))
+    except OSError:
+        pytest.skip("inotify 不可用")
+    try:
+        os.makedirs(tmp_path / "sub")
+        watcher.wait(1.0)  # 新目录事件，补上监听
+        _write(tmp_path / "sub" / "post.md", "x")
+        _write(tmp_path / "notes.txt", "x")
+        assert watcher.wait(1.0) == {os.path.join("sub", "post.md")}
+    finally:
+        watcher.close()